@@ -4,7 +4,25 @@ Graph representation of airport connections using adjacency list.
 """
 
 import heapq
+import logging
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from Metrics import COUNT_BUCKETS, REGISTRY
+
+log = logging.getLogger('airport.graph')
+
+
+def settled_histogram(search):
+    """The ``airport_dijkstra_settled_nodes`` histogram for one kind of search."""
+    return REGISTRY.histogram('airport_dijkstra_settled_nodes', 'Airports settled per shortest-path search',
+                              COUNT_BUCKETS, search=search)
+
+
+_SETTLED_POINT = settled_histogram('point')
+_SETTLED_TREE = settled_histogram('tree')
+_SETTLED_RESTRICTED = settled_histogram('restricted_tree')
+_SETTLED_SPUR = settled_histogram('spur')
 
 
 class AirportGraph:
@@ -13,11 +31,22 @@ class AirportGraph:
     def __init__(self):
         self.graph = defaultdict(list)  # airport -> [(neighbor, distance), ...]
     
+    def __contains__(self, airport):
+        return airport in self.graph
+    
     def add_route(self, source, destination, distance=1):
         """Add a bidirectional route between two airports."""
         self.graph[source].append((destination, distance))
         self.graph[destination].append((source, distance))
-        print(f"✓ Route added: {source} ↔ {destination} (distance: {distance})")
+        log.info("✓ Route added: %s ↔ %s (distance: %s)", source, destination, distance,
+                 extra={'event': 'route_added', 'source': source, 'destination': destination})
+    
+    def edges(self):
+        """Yield each undirected route once as (source, destination, distance), like CSRGraph.edges."""
+        for source, neighbors in self.graph.items():
+            for destination, distance in neighbors:
+                if str(source) < str(destination):
+                    yield source, destination, distance
     
     def find_shortest_route(self, start, destination):
         """Find shortest route using Dijkstra's algorithm."""
@@ -29,11 +58,13 @@ class AirportGraph:
         distances[start] = 0
         previous = {}
         heap = [(0, start)]
+        settled = 0
         
         while heap:
             current_distance, current_airport = heapq.heappop(heap)
             
             if current_airport == destination:
+                _SETTLED_POINT.observe(settled + 1)
                 # Reconstruct path
                 path = []
                 while current_airport is not None:
@@ -44,6 +75,7 @@ class AirportGraph:
             
             if current_distance > distances[current_airport]:
                 continue
+            settled += 1
             
             for neighbor, weight in self.graph[current_airport]:
                 distance = current_distance + weight
@@ -52,4 +84,211 @@ class AirportGraph:
                     previous[neighbor] = current_airport
                     heapq.heappush(heap, (distance, neighbor))
         
+        _SETTLED_POINT.observe(settled)
         return None, float('inf')  # No path found
+    
+    def shortest_path_tree(self, start, targets=None):
+        """Run Dijkstra from start over the whole graph.
+        
+        Returns (distances, previous) for every reachable airport. If targets
+        is given, the search stops once all of them are settled.
+        """
+        return _shortest_path_tree(self.graph, start, targets)
+    
+    def find_routes_batch(self, pairs, max_workers=None):
+        """Answer many (start, destination) queries with one Dijkstra per origin.
+        
+        Returns a list of (path, distance) aligned with pairs. With
+        max_workers, distinct origins are searched in a process pool.
+        """
+        pairs = list(pairs)
+        by_origin = defaultdict(set)
+        for start, destination in pairs:
+            if start in self.graph and destination in self.graph:
+                by_origin[start].add(destination)
+        
+        if max_workers and len(by_origin) > 1:
+            with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                                     initargs=(dict(self.graph),)) as pool:
+                trees = dict(zip(by_origin, pool.map(_worker_tree, by_origin.items())))
+        else:
+            trees = {start: self.shortest_path_tree(start, targets)
+                     for start, targets in by_origin.items()}
+        
+        results = []
+        for start, destination in pairs:
+            distances, previous = trees.get(start, ({}, {}))
+            results.append(_route_from_tree(distances, previous, destination))
+        return results
+    
+    def find_k_shortest_routes(self, start, destination, k=3, excluded_airports=(), excluded_routes=()):
+        """Find up to k loopless routes in increasing distance (Yen's algorithm).
+        
+        excluded_airports are closed airports; excluded_routes are (a, b)
+        pairs closed in both directions. See k_shortest_routes.
+        """
+        return k_shortest_routes(self.graph, start, destination, k, excluded_airports, excluded_routes)
+
+
+def k_shortest_routes(graph, start, destination, k=3, excluded_airports=(), excluded_routes=()):
+    """Yen's algorithm over an adjacency mapping (airport -> [(neighbor, distance), ...]).
+    
+    Shared by AirportGraph and CSRGraph. A shortest-path tree from the
+    destination is built once and used as an A* bound for every spur
+    search, and spur results are memoized across iterations. Raises
+    ValueError if k < 1.
+    """
+    if k < 1:
+        raise ValueError(f"k must be at least 1, got {k}")
+    closed = set(excluded_airports)
+    closed_routes = {frozenset(route) for route in excluded_routes}
+    if start not in graph or destination not in graph or start in closed or destination in closed:
+        return []
+    
+    to_destination = _restricted_tree(graph, destination, closed, closed_routes)
+    spur_cache = {}
+    
+    def spur_search(spur, blocked_airports, blocked_routes):
+        key = (spur, blocked_airports, blocked_routes)
+        if key not in spur_cache:
+            spur_cache[key] = _restricted_search(
+                graph, spur, destination, closed | blocked_airports,
+                closed_routes | blocked_routes, to_destination)
+        return spur_cache[key]
+    
+    first = spur_search(start, frozenset(), frozenset())
+    if first is None:
+        return []
+    found = [first]
+    candidates = []
+    seen = {tuple(first[0])}
+    
+    while len(found) < k:
+        previous_path, _ = found[-1]
+        root_cost = 0
+        for i in range(len(previous_path) - 1):
+            spur = previous_path[i]
+            root = previous_path[:i + 1]
+            blocked_routes = frozenset(
+                frozenset((path[i], path[i + 1]))
+                for path, _ in found if len(path) > i + 1 and path[:i + 1] == root)
+            spur_result = spur_search(spur, frozenset(root[:-1]), blocked_routes)
+            if spur_result is not None:
+                spur_path, spur_cost = spur_result
+                path = root[:-1] + spur_path
+                if tuple(path) not in seen:
+                    seen.add(tuple(path))
+                    heapq.heappush(candidates, (root_cost + spur_cost, len(path), path))
+            root_cost += min(weight for neighbor, weight in graph[previous_path[i]]
+                             if neighbor == previous_path[i + 1])
+        if not candidates:
+            break
+        cost, _, path = heapq.heappop(candidates)
+        found.append((path, cost))
+    return found
+
+
+def _restricted_tree(graph, start, closed, closed_routes):
+    """Distances from start avoiding closed airports and routes."""
+    distances = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        current_distance, airport = heapq.heappop(heap)
+        if current_distance > distances[airport]:
+            continue
+        for neighbor, weight in graph[airport]:
+            if neighbor in closed or (closed_routes and frozenset((airport, neighbor)) in closed_routes):
+                continue
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                heapq.heappush(heap, (distance, neighbor))
+    _SETTLED_RESTRICTED.observe(len(distances))  # the search runs to exhaustion
+    return distances
+
+
+def _restricted_search(graph, start, destination, closed, closed_routes, bound):
+    """A* from start to destination guided by exact distances in bound.
+    
+    bound holds distances to destination in a less restricted graph, so it
+    is an admissible heuristic; airports missing from it cannot reach the
+    destination and are pruned. Returns (path, distance) or None.
+    """
+    if start in closed or start not in bound:
+        return None
+    distances = {start: 0}
+    previous = {start: None}
+    settled = set()
+    heap = [(bound[start], 0, start)]
+    while heap:
+        _, current_distance, airport = heapq.heappop(heap)
+        if airport in settled:
+            continue
+        settled.add(airport)
+        if airport == destination:
+            _SETTLED_SPUR.observe(len(settled))
+            return _route_from_tree(distances, previous, destination)
+        for neighbor, weight in graph[airport]:
+            if neighbor in closed or neighbor not in bound:
+                continue
+            if closed_routes and frozenset((airport, neighbor)) in closed_routes:
+                continue
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                previous[neighbor] = airport
+                heapq.heappush(heap, (distance + bound[neighbor], distance, neighbor))
+    _SETTLED_SPUR.observe(len(settled))
+    return None
+
+
+def _shortest_path_tree(graph, start, targets=None):
+    remaining = set(targets) if targets is not None else None
+    distances = {start: 0}
+    previous = {start: None}
+    heap = [(0, start)]
+    settled = 0
+    
+    while heap:
+        current_distance, current_airport = heapq.heappop(heap)
+        if current_distance > distances[current_airport]:
+            continue
+        settled += 1
+        if remaining is not None:
+            remaining.discard(current_airport)
+            if not remaining:
+                break
+        for neighbor, weight in graph[current_airport]:
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                previous[neighbor] = current_airport
+                heapq.heappush(heap, (distance, neighbor))
+    
+    _SETTLED_TREE.observe(settled)
+    return distances, previous
+
+
+def _route_from_tree(distances, previous, destination):
+    if destination not in distances:
+        return None, float('inf')
+    path = []
+    airport = destination
+    while airport is not None:
+        path.append(airport)
+        airport = previous[airport]
+    path.reverse()
+    return path, distances[destination]
+
+
+_worker_graph = None
+
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = defaultdict(list, graph)
+
+
+def _worker_tree(item):
+    start, targets = item
+    return _shortest_path_tree(_worker_graph, start, targets)
@@ -1,31 +1,98 @@
 import heapq
+import logging
 from datetime import datetime, timedelta
+from AirportGraph import AirportGraph
+from BulkIngest import normalize_destination, parse_emergency, parse_time, parse_times
 from Flight import Flight
-from Runway import Runway
-
-# Minimal AirportGraph placeholder
-class AirportGraph:
-    def __init__(self):
-        self.graph = {}
-    def add_route(self, src, dest, dist):
-        self.graph[src] = self.graph.get(src, []) + [(dest, dist)]
-    def find_shortest_route(self, start, destination):
-        # Simple placeholder; returns dummy path and distance
-        if start in self.graph:
-            return [start, destination], 10
-        return None, 0
+from FlightIndex import FlightIndex
+from FlightQueue import FlightQueue, sort_key
+from HistoryStore import HistoryStore
+from LandmarkRouter import LandmarkRouter
+from Metrics import timed
+from RouteCache import RouteCache
+from RunwayAssignment import assign_runways
+from RunwayPlanner import RunwayPlanner
+from RunwayPool import RunwayPool
+from Timetable import Timetable
+
+log = logging.getLogger('airport.system')
+
+# current_plan re-plans once the look-ahead horizon has moved this far
+PLAN_REFRESH = timedelta(minutes=1)
+
+# Collections each logged state change can alter (see AirportManagementSystem.versions)
+_CHANGES = {
+    'add': ('history',),
+    'add_many': ('history',),
+    'schedule': ('scheduled',),
+    'assign': ('scheduled', 'runways', 'history'),
+    'depart': ('runways', 'history'),
+    'cancel': ('scheduled', 'runways', 'cancelled', 'history'),
+    'undo': ('scheduled', 'cancelled', 'history'),
+    'escalate': ('scheduled', 'history'),
+    'route': ('routes',),
+}
+
+def flight_filter(status=None, destination=None, emergency=None, departure_from=None, departure_to=None):
+    """Build a predicate over flights (or history records) for listings."""
+    def matches(f):
+        if status is not None and f.status != status:
+            return False
+        if destination is not None and f.destination != destination:
+            return False
+        if emergency is not None and f.is_emergency != emergency:
+            return False
+        if departure_from is not None and f.departure_time < departure_from:
+            return False
+        if departure_to is not None and f.departure_time >= departure_to:
+            return False
+        return True
+    return matches
+
+
+def flight_event(f):
+    """JSON-ready description of a flight for change events."""
+    return {
+        'flight_number': f.flight_number,
+        'destination': f.destination,
+        'departure_time': f.departure_time.isoformat(),
+        'is_emergency': f.is_emergency,
+        'assigned_runway_no': f.assigned_runway_no,
+        'status': f.status,
+    }
+
 
 class AirportManagementSystem:
     """Manages flights, runways, cancellations, and routes."""
 
-    def __init__(self):
+    def __init__(self, runway_count=3, clock=datetime.now, runway_occupancy=timedelta(0),
+                 airport_graph=None, sample_routes=True, hub="JFK"):
+        self.clock = clock  # callable returning the current datetime
         self.flight_queue = []
-        self.scheduled_flights = []
-        self.runways = [Runway(i+1) for i in range(3)]
+        self.scheduled_flights = FlightQueue()
+        self.runways = RunwayPool(runway_count, clock=clock, min_occupancy=runway_occupancy)
         self.canceled_flights = []
-        self.airport_graph = AirportGraph()
-        self._add_sample_routes()
-        self.history = []
+        self.airport_graph = airport_graph if airport_graph is not None else AirportGraph()
+        self.route_cache = RouteCache(self.airport_graph)
+        self.landmark_router = None  # optional LandmarkRouter answering point queries (see use_landmarks)
+        self.hub = hub  # unknown destinations get a default route from here; None leaves the graph alone
+        self.journal = None  # optional Persistence.Journal recording state changes
+        self.changes = None  # optional ChangeFeed receiving incremental events
+        self.planner = None  # RunwayPlanner from the last plan_runways call
+        self.plan_until = None
+        self.plan_hours = None
+        self.plan_wake = {}  # wake_classes the plan was made with
+        self.plan_version = None  # versions['scheduled'] the plan reflects
+        self.timetable = None  # optional Timetable fed with this airport's flights
+        self.timetable_origin = None
+        self.assignment_costs = None  # RunwayAssignment.AssignmentCosts: min-cost allocate_runways
+        # Per-collection state versions; readers can cache anything derived
+        # from a collection until its version moves.
+        self.versions = dict.fromkeys(('scheduled', 'runways', 'cancelled', 'history', 'routes'), 0)
+        if sample_routes:
+            self._add_sample_routes()
+        self.history = HistoryStore()
+        self.flight_index = FlightIndex()
 
     # ---------------- ROUTES ----------------
     def _add_sample_routes(self):
@@ -38,109 +105,392 @@ class AirportManagementSystem:
             ("CDG", "FRA", 1)
         ]
         for src, dst, dist in routes:
-            self.airport_graph.add_route(src, dst, dist)
+            self.add_route(src, dst, dist)
 
+    @timed('add_route')
     def add_route(self, src, dest, distance):
         self.airport_graph.add_route(src, dest, distance)
+        self.route_cache.route_added(src, dest, distance)
+        if self.landmark_router is not None:
+            self.landmark_router.route_added(src, dest, distance)
+        self._log('route', src, dest, distance)
+        if self.timetable is not None:
+            self.timetable.routes_changed()
+        self._emit('route_added', {'src': src, 'dest': dest, 'distance': distance})
+
+    def use_landmarks(self, landmark_count=8, seed=0):
+        """Answer point queries with ALT instead of cached shortest-path trees.
+
+        Suits large networks queried from many different origins, where a
+        whole tree per origin is wasted work. The landmark tables are kept
+        exact by add_route. Needs an AirportGraph backend.
+        """
+        self.landmark_router = LandmarkRouter(self.airport_graph, landmark_count, seed).build()
+        return self.landmark_router
+
+    @timed('find_shortest_route')
+    def find_shortest_route(self, start, destination):
+        """Shortest route (cached, or ALT after use_landmarks); returns (path, distance) like AirportGraph."""
+        if self.landmark_router is not None:
+            return self.landmark_router.find_shortest_route(start, destination)
+        return self.route_cache.find_shortest_route(start, destination)
+
+    @timed('find_routes_batch')
+    def find_routes_batch(self, pairs):
+        """Cached shortest routes for many (start, destination) pairs."""
+        return self.route_cache.find_routes_batch(pairs)
+
+    @timed('find_alternative_routes')
+    def find_alternative_routes(self, start, destination, k=3, excluded_airports=(), excluded_routes=()):
+        """Up to k shortest loopless routes, avoiding closed airports/routes."""
+        return self.airport_graph.find_k_shortest_routes(
+            start, destination, k, excluded_airports, excluded_routes)
 
     def find_route(self, start, destination):
-        path, dist = self.airport_graph.find_shortest_route(start, destination)
+        path, dist = self.find_shortest_route(start, destination)
         if path:
             print(f"Route: {' → '.join(path)} (Distance: {dist})")
         else:
             print("No route found.")
+        return path, dist
+
+    # ---------------- TIMETABLE ----------------
+    def use_timetable(self, timetable, origin=None):
+        """Feed this airport's active flights, leaving from ``origin``, into ``timetable``.
+
+        Several systems can share one Timetable; journeys then change
+        between flights of different airports.
+        """
+        self.timetable = timetable
+        self.timetable_origin = origin or self.hub or "JFK"
+        timetable.add_many([f for _, f in self.history.rows() if isinstance(f, Flight) and f.status != 'Cancelled'],
+                           self.timetable_origin)
+
+    def _timetable(self):
+        if self.timetable is None:
+            self.use_timetable(Timetable(self.route_cache))
+        return self.timetable
+
+    @timed('earliest_arrival')
+    def earliest_arrival(self, start, destination, depart_after=None, transfer=timedelta(minutes=30)):
+        """Earliest arrival by scheduled flights; returns (arrival, legs) like Timetable."""
+        return self._timetable().earliest_arrival(start, destination, depart_after or self.clock(), transfer)
+
+    @timed('journey_profile')
+    def journey_profile(self, start, destination, depart_from=None, depart_to=None,
+                        transfer=timedelta(minutes=30)):
+        """Every non-dominated journey leaving ``start`` in [depart_from, depart_to]."""
+        depart_from = depart_from or self.clock()
+        depart_to = depart_to or depart_from + timedelta(days=1)
+        return self._timetable().profile(start, destination, depart_from, depart_to, transfer)
 
     # ---------------- FLIGHTS ----------------
     def add_flight(self, number, destination, time_str, emergency=False):
-        try:
-            hour, minute = map(int, time_str.split(":"))
-            now = datetime.now()
-            departure_time = datetime(year=now.year, month=now.month, day=now.day, hour=hour, minute=minute)
-            if departure_time <= now:
-                departure_time += timedelta(days=1)
+        departure_time = parse_time(time_str, self.clock())  # same rules as add_flights_bulk
+        if departure_time is None:
+            log.warning("Invalid time format! Use HH:MM", extra={'event': 'invalid_time', 'time_str': time_str})
+            return
+        return self.add_flight_at(number, normalize_destination(destination), departure_time, emergency)
+
+    @timed('add_flight')
+    def add_flight_at(self, number, destination, departure_time, emergency=False):
+        """Queue a flight with an explicit departure datetime.
+
+        Raises ValueError if a flight with this number is still active
+        (waiting, on a runway or cancelled); a departed number may be reused.
+        """
+        if self._active(number):
+            raise ValueError(f'duplicate flight {number}')
+        flight = Flight(number, destination, departure_time, emergency)
+        self._log('add', number, destination, departure_time.timestamp(), emergency)
+        self.history.append(flight)
+        self.flight_index.add(flight)
+        heapq.heappush(self.flight_queue, flight)
+        if self.changes is not None:
+            self.changes.publish('flight_added', flight_event(flight))
+        if self.timetable is not None:
+            self.timetable.add(flight, self.timetable_origin)
+        log.info("Added: %s", flight, extra={'event': 'flight_added', 'flight_number': number})
+        if self.hub is not None and destination not in self.airport_graph:
+            self.add_route(self.hub, destination, 5)
+        return flight
+
+    def _active(self, number):
+        """True if the index holds a live Flight (not a departed history row) for this number."""
+        return not isinstance(self.flight_index.get(number), (int, type(None)))
+
+    @timed('add_flights_bulk')
+    def add_flights_bulk(self, rows):
+        """Queue many flights at once.
+
+        rows is an iterable of (row_number, dict) with flight_no, destination,
+        time_str and optional is_emergency keys (see BulkIngest); a string in
+        place of the dict is a parse error for that row, and any other
+        non-dict is rejected. Times and destinations follow the same rules
+        as add_flight. Times are parsed in
+        one batch, the queue is heapified once and each new destination gets
+        its route once. Bad rows are reported, not raised.
+        """
+        errors = []
+        candidates = []
+        seen = set()
+        for row_number, row in rows:
+            if isinstance(row, str):
+                errors.append({'row': row_number, 'error': row})
+                continue
+            if not isinstance(row, dict):
+                errors.append({'row': row_number, 'error': f'expected an object, got {type(row).__name__}'})
+                continue
+            number = str(row.get('flight_no') or '').strip()
+            destination = normalize_destination(row.get('destination'))
+            if not number or not destination:
+                errors.append({'row': row_number, 'error': 'flight_no and destination are required'})
+            elif number in seen or self._active(number):
+                errors.append({'row': row_number, 'error': f'duplicate flight {number}'})
+            else:
+                seen.add(number)
+                candidates.append((row_number, number, destination, row.get('time_str'),
+                                   parse_emergency(row.get('is_emergency'))))
+
+        departures = parse_times([c[3] for c in candidates], self.clock())
+        new_destinations = set()
+        flights = []
+        for (row_number, number, destination, time_str, emergency), departure_time in zip(candidates, departures):
+            if departure_time is None:
+                errors.append({'row': row_number, 'error': f'invalid time {time_str!r}, use HH:MM'})
+                continue
             flight = Flight(number, destination, departure_time, emergency)
             self.history.append(flight)
-            heapq.heappush(self.flight_queue, flight)
-            print(f"Added: {flight}")
-            if destination not in self.airport_graph.graph:
-                self.airport_graph.add_route("JFK", destination, 5)
-        except ValueError:
-            print("Invalid time format! Use HH:MM")
+            flights.append(flight)
+            if self.hub is not None and destination not in self.airport_graph:
+                new_destinations.add(destination)
+        self._log('add_many', [(f.flight_number, f.destination, f.departure_time.timestamp(), f.is_emergency)
+                               for f in flights])
+        self.flight_index.add_many(flights)
+        self.flight_queue.extend(flights)
+        heapq.heapify(self.flight_queue)
+        added = len(flights)
+        if added:
+            self._emit('flights_added', [flight_event(f) for f in flights])
+            if self.timetable is not None:
+                self.timetable.add_many(flights, self.timetable_origin)
+        for destination in sorted(new_destinations):
+            self.add_route(self.hub, destination, 5)
+        log.info("Bulk added %d flights (%d rejected).", added, len(errors),
+                 extra={'event': 'flights_added', 'added': added, 'rejected': len(errors)})
+        return {'added': added, 'errors': errors}
 
+    @timed('schedule_flights')
     def schedule_flights(self):
         if not self.flight_queue:
-            print("No flights to schedule.")
+            log.info("No flights to schedule.")
             return
         while self.flight_queue:
-            self.scheduled_flights.append(heapq.heappop(self.flight_queue))
-        print(f"Scheduled {len(self.scheduled_flights)} flights.")
+            self.scheduled_flights.push(heapq.heappop(self.flight_queue))
+        self._log('schedule')
+        log.info("Scheduled %d flights.", len(self.scheduled_flights), extra={'event': 'flights_scheduled'})
 
     # ---------------- RUNWAYS ----------------
     def _clear_departed_flights(self):
-        now = datetime.now()
-        for runway in self.runways:
-            if not runway.is_available and runway.current_flight.departure_time <= now:
-                print(f"Flight {runway.current_flight.flight_number} has departed. Clearing {runway}.")
-                runway.release_runway()
+        released = self.runways.release_due()
+        for runway, flight in released:
+            self.record_departure(runway, flight)
+        return released
+
+    def record_departure(self, runway, flight):
+        """Bookkeeping for a flight whose runway has just been released."""
+        self._log('depart', flight.flight_number)
+        flight.status = 'Departed'
+        flight.assigned_runway = None
+        self.flight_index.depart(flight, self.history.row_of(flight))
+        self.history.retire(flight)
+        if self.timetable is not None:
+            self.timetable.remove(flight.flight_number)
+        if self.changes is not None:
+            self.changes.publish('runway_released', {'runway_no': runway.runway_id,
+                                                     'flight_number': flight.flight_number})
+        log.info("Flight %s has departed. Clearing %s.", flight.flight_number, runway,
+                 extra={'event': 'flight_departed', 'flight_number': flight.flight_number})
 
     def _next_available_time(self):
-        now = datetime.now()
-        remaining_times = [
-            (r.current_flight.departure_time - now).total_seconds() / 60
-            for r in self.runways
-            if not r.is_available and r.current_flight.departure_time > now
-        ]
-        return min(remaining_times) if remaining_times else 0
+        return self.runways.next_available_minutes()
 
-    def allocate_runways(self):
+    @timed('allocate_runways')
+    def allocate_runways(self, show_runways=True):
         self._clear_departed_flights()
-        if all(not r.is_available for r in self.runways):
+        if self.runways.free_count == 0:
             wait_minutes = round(self._next_available_time(), 2)
-            print(f"⚠️ All runways are currently occupied. Next available in ~{wait_minutes} minutes.")
+            log.info("⚠️ All runways are currently occupied. Next available in ~%s minutes.", wait_minutes,
+                     extra={'event': 'runways_full'})
             return
         if not self.scheduled_flights:
-            print("No flights waiting for runways.")
+            log.info("No flights waiting for runways.")
             return
-        for flight in self.scheduled_flights[:]:
-            for runway in self.runways:
-                if runway.is_available and runway.assign_flight(flight):
-                    flight.status = 'Runway Assigned'
-                    flight.assigned_runway = runway
-                    flight.assigned_runway_no = runway.runway_id
-                    print(f"{flight.flight_number} → {runway}")
-                    self.scheduled_flights.remove(flight)
-                    break
-        self._show_runways()
+        if self.assignment_costs is not None:
+            self._assign_batch()
+        else:
+            while self.scheduled_flights and self.runways.free_count:
+                self._assign(self.scheduled_flights.pop())
+        if show_runways:
+            self._show_runways()
+
+    def _assign_batch(self, candidates=None):
+        """Seat waiting flights on the free runways as one min-cost matching.
+
+        Only the first ``candidates`` flights in queue order (default: eight
+        per free runway, at least 64) enter the cost matrix. The queue is
+        sorted by priority and departure time, so every emergency is among
+        them, and flights further back wait for a later cycle.
+        """
+        free = self.runways.free_ids()
+        flights = self.scheduled_flights.smallest(candidates or max(64, 8 * len(free)))
+        for flight, runway_id in assign_runways(flights, free, self.clock(), self.assignment_costs):
+            self._assign(self.scheduled_flights.remove(flight.flight_number), runway_id)
+
+    def _assign(self, flight, runway_id=None):
+        runway = self.runways.acquire(flight, runway_id)
+        flight.status = 'Runway Assigned'
+        flight.assigned_runway = runway
+        flight.assigned_runway_no = runway.runway_id
+        self._log('assign', flight.flight_number, runway.runway_id)
+        if self.changes is not None:
+            self.changes.publish('runway_assigned', {'runway_no': runway.runway_id,
+                                                     'flight_number': flight.flight_number})
+        log.info("%s → %s", flight.flight_number, runway,
+                 extra={'event': 'runway_assigned', 'flight_number': flight.flight_number})
+        return runway
+
+    @timed('plan_runways')
+    def plan_runways(self, hours=6, occupancy=None, wake_classes=None):
+        """Plan waiting flights departing in the next ``hours`` into runway slots.
+
+        Unlike allocate_runways this looks ahead: each flight gets the earliest
+        slot from now on that respects occupancy, wake separation
+        (``wake_classes``: {flight_number: 'L'|'M'|'H'}) and the runways still
+        held by assigned flights. The plan is kept and updated by
+        cancel_flight and undo_cancellation.
+        """
+        if occupancy is None:
+            occupancy = self.runways.min_occupancy or timedelta(minutes=2)
+        wake_classes = wake_classes or {}
+        now = self.clock()
+        self.plan_until = now + timedelta(hours=hours)
+        self.plan_hours = hours
+        self.plan_wake = wake_classes
+        self.plan_version = self.versions['scheduled']
+        self.planner = RunwayPlanner(len(self.runways), occupancy, not_before=now.timestamp())
+        for runway_id, release_time in self.runways.release_times().items():
+            flight = self.runways.get(runway_id).current_flight
+            self.planner.hold(flight, runway_id, release_time.timestamp(), wake_classes.get(flight.flight_number))
+        flights = [f for f in self.scheduled_flights.flights() if f.departure_time < self.plan_until]
+        return self.planner.plan(flights, wake_classes)
+
+    def current_plan(self, hours=6, wake_classes=None):
+        """The kept runway plan as slots in start order, re-planned only when stale.
+
+        Cancellations and restores update the plan in place and keep it
+        current. Any other change to the waiting flights (new flights,
+        assignments, escalations), a different ``hours`` or ``wake_classes``,
+        or a horizon that has moved by PLAN_REFRESH triggers a full
+        plan_runways.
+        """
+        wake_classes = wake_classes or {}
+        if (self.planner is None or self.plan_version != self.versions['scheduled'] or hours != self.plan_hours
+                or wake_classes != self.plan_wake
+                or self.clock() + timedelta(hours=hours) - self.plan_until >= PLAN_REFRESH):
+            self.plan_runways(hours, wake_classes=wake_classes)
+        return self.planner.slots()
+
+    def _plan_updated(self, version):
+        """The plan was updated in place; keep it current if it matched ``version``."""
+        if self.plan_version == version:
+            self.plan_version = self.versions['scheduled']
 
     def _show_runways(self):
-        print("\nRunway Status:")
-        for r in self.runways:
-            print(" ", r)
+        if log.isEnabledFor(logging.INFO):
+            log.info("\nRunway Status:\n%s", "\n".join(f"  {r}" for r in self.runways))
 
     # ---------------- CANCELLATIONS ----------------
+    @timed('cancel_flight')
     def cancel_flight(self, number):
-        for f in self.scheduled_flights:
-            if f.flight_number == number:
-                f.status = 'Cancelled'
-                self.scheduled_flights.remove(f)
-                self.canceled_flights.append(f)
-                print(f"Canceled: {number}")
-                return
-        for r in self.runways:
-            if not r.is_available and r.current_flight.flight_number == number:
-                f = r.release_runway()
-                self.canceled_flights.append(f)
-                print(f"Canceled from runway: {number}")
-                return
-        print("Flight not found.")
+        """Cancel a waiting or runway-assigned flight; False if it is not found."""
+        version = self.versions['scheduled']
+        f = self.scheduled_flights.remove(number)
+        if f is not None:
+            self._log('cancel', number)
+            f.status = 'Cancelled'
+            if self.timetable is not None:
+                self.timetable.remove(number)
+            self.canceled_flights.append(f)
+            if self.planner is not None:
+                self.planner.cancel(number)
+                self._plan_updated(version)
+            self._emit('flight_cancelled', {'flight_number': number, 'runway_no': None})
+            log.info("Canceled: %s", number, extra={'event': 'flight_cancelled', 'flight_number': number})
+            return True
+        runway = self.runways.runway_for(number)
+        f = self.runways.release_flight(number)
+        if f is not None:
+            self._log('cancel', number)
+            if self.planner is not None:
+                self.planner.cancel(number)  # frees the runway's hold for waiting flights
+                self._plan_updated(version)
+            f.status = 'Cancelled'
+            if self.timetable is not None:
+                self.timetable.remove(number)
+            f.assigned_runway = None
+            f.assigned_runway_no = None
+            self.canceled_flights.append(f)
+            self._emit('flight_cancelled', {'flight_number': number, 'runway_no': runway.runway_id})
+            log.info("Canceled from runway: %s", number,
+                     extra={'event': 'flight_cancelled', 'flight_number': number})
+            return True
+        log.warning("Flight not found.", extra={'event': 'flight_not_found', 'flight_number': number})
+        return False
 
+    @timed('undo_cancellation')
     def undo_cancellation(self):
         if self.canceled_flights:
             f = self.canceled_flights.pop()
-            self.scheduled_flights.append(f)
-            print(f"Restored: {f}")
+            version = self.versions['scheduled']
+            self._log('undo')
+            f.status = 'Waiting for assigning'
+            self.scheduled_flights.push(f)
+            if self.planner is not None:
+                if f.departure_time < self.plan_until:
+                    self.planner.place(f)
+                self._plan_updated(version)
+            if self.timetable is not None:
+                self.timetable.add(f, self.timetable_origin)
+            self._emit('cancellation_undone', flight_event(f))
+            log.info("Restored: %s", f, extra={'event': 'cancellation_undone', 'flight_number': f.flight_number})
         else:
-            print("No canceled flights to restore.")
+            log.warning("No canceled flights to restore.")
+
+    @timed('escalate_flight')
+    def escalate_flight(self, number):
+        """Promote a waiting flight to emergency priority in place."""
+        f = self.scheduled_flights.get(number)
+        if f is None:
+            log.warning("Flight not found.", extra={'event': 'flight_not_found', 'flight_number': number})
+            return False
+        self._log('escalate', number)
+        f.is_emergency = True
+        f.priority = 1
+        self.scheduled_flights.update(number)
+        self._emit('flight_escalated', flight_event(f))
+        log.info("Escalated to emergency: %s", f, extra={'event': 'flight_escalated', 'flight_number': number})
+        return True
+
+    def _log(self, op, *args):
+        for collection in _CHANGES[op]:
+            self.versions[collection] += 1
+        if self.journal is not None:
+            self.journal.append(op, args)
+
+    def _emit(self, kind, data):
+        if self.changes is not None:
+            self.changes.publish(kind, data)
 
     # ---------------- STATUS ----------------
     def show_status(self):
@@ -148,7 +498,7 @@ class AirportManagementSystem:
         print("\n=== Airport System Status ===")
         print(f" Scheduled flights: {len(self.scheduled_flights)}")
         print(f" Canceled flights: {len(self.canceled_flights)}")
-        print(f" Free runways: {sum(r.is_available for r in self.runways)}")
+        print(f" Free runways: {self.runways.free_count}")
 
         while True:
             print("\nDo you want to see details? Options:")
@@ -190,3 +540,54 @@ class AirportManagementSystem:
 
     def get_scheduled_flights(self):
         return self.scheduled_flights
+
+    def locate_flight(self, number):
+        """Where is flight X? O(1) via the flight index; None if unknown."""
+        f = self.flight_index.get(number)
+        if f is None:
+            return None
+        if isinstance(f, int):
+            f = self.history.get(f)
+            location = 'departed'
+        elif number in self.scheduled_flights:
+            location = 'scheduled queue'
+        elif f.status == 'Runway Assigned':
+            location = f'runway {f.assigned_runway_no}'
+        elif f.status == 'Cancelled':
+            location = 'cancellation log'
+        else:
+            location = 'incoming queue'
+        return {
+            'flight_number': f.flight_number,
+            'destination': f.destination,
+            'departure_time': f.departure_time,
+            'status': f.status,
+            'is_emergency': f.is_emergency,
+            'assigned_runway_no': f.assigned_runway_no,
+            'location': location,
+        }
+
+    def flights_departing_between(self, start=None, end=None, destination=None):
+        """Active flights departing in [start, end), optionally to one destination."""
+        return self.flight_index.departing_between(start, end, destination)
+
+    def list_scheduled(self, cursor=None, limit=100, **filters):
+        """One page of waiting flights in priority order.
+
+        cursor is the sort key of the last flight on the previous page.
+        Returns (flights, next_cursor); next_cursor is None on the last page.
+        """
+        flights = self.scheduled_flights.smallest(limit, after=cursor, predicate=flight_filter(**filters))
+        next_cursor = sort_key(flights[-1]) if len(flights) == limit else None
+        return flights, next_cursor
+
+    def list_history(self, cursor=0, limit=100, **filters):
+        """One page of history; cursor is the next history row to read."""
+        matches = flight_filter(**filters)
+        page = []
+        for row, f in self.history.rows(cursor or 0):
+            if matches(f):
+                page.append(f)
+                if len(page) == limit:
+                    return page, row + 1
+        return page, None
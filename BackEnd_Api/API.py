@@ -1,11 +1,69 @@
 
-from AirportManagementSystem import AirportManagementSystem
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional
+from AirportManagementSystem import AirportManagementSystem, flight_event, flight_filter
+from ChangeFeed import ChangeFeed
+from Metrics import REGISTRY, configure_logging, register_system_gauges
+from Persistence import open_system
+from RunwayAssignment import WAKE_ORDER, AssignmentCosts
+from FlightQueue import decode_cursor, encode_cursor
+from Timetable import Timetable
+from WhatIf import Scenario, compact_state, run_what_if
+from BulkIngest import normalize_destination, rows_from_csv, rows_from_ndjson
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from BackEnd_Api import CommandProcessor as commands
+from BackEnd_Api import ShardDispatcher as shard
+from BackEnd_Api.ResponseCache import ResponseCache, etag_matches
 from BackEnd_Api.DataModels import *
 
-management_system = AirportManagementSystem()
-management_system._add_sample_routes()
+# With AIRPORT_DATA_DIR set, state survives restarts: the latest snapshot is
+# loaded and the write-ahead log tail replayed before serving.
+if os.environ.get('AIRPORT_LOG_LEVEL'):
+    # e.g. AIRPORT_LOG_LEVEL=info for JSON-lines event logs; silent by default
+    configure_logging(os.environ['AIRPORT_LOG_LEVEL'].upper(),structured=True)
+data_dir = os.environ.get('AIRPORT_DATA_DIR')
+management_system = open_system(data_dir) if data_dir else AirportManagementSystem()
+if os.environ.get('AIRPORT_RUNWAY_ASSIGNMENT') == 'optimal':
+    # min-cost batch matching instead of greedy first-free-runway allocation
+    management_system.assignment_costs = AssignmentCosts()
+if os.environ.get('AIRPORT_LANDMARKS'):
+    # e.g. AIRPORT_LANDMARKS=16: ALT point queries for /route/find_route on large networks
+    management_system.use_landmarks(int(os.environ['AIRPORT_LANDMARKS']))
+# Every mutation goes through this single-writer actor. Handlers are async,
+# so read-only handlers run on the event loop between command batches and
+# always see a consistent state.
+processor = commands.CommandProcessor(management_system)
+# Incremental events for dashboards (GET /changes/stream) instead of polling
+management_system.changes = ChangeFeed()
+register_system_gauges(management_system)
+REGISTRY.gauge('airport_snapshot_version','Command batches applied by the processor',lambda: processor.version)
+REGISTRY.gauge('airport_change_feed_sequence','Last change event sequence number',
+               lambda: management_system.changes.sequence)
+# Dashboard GETs are served from encoded bytes until the collection they read changes
+response_cache = ResponseCache()
+REGISTRY.gauge('airport_response_cache_hits','GET responses served from cached bytes',lambda: response_cache.hits)
+REGISTRY.gauge('airport_response_cache_misses','GET responses encoded from state',lambda: response_cache.misses)
+# Journey planning over the scheduled flights of every airport served here
+timetable = Timetable(management_system.route_cache)
+management_system.use_timetable(timetable)
+# Multi-airport mode: AIRPORT_CODES=JFK,LHR,... serves /airports/{code}/... from one
+# independent system per airport, all sharing this route network. With
+# AIRPORT_SHARD_WORKERS=N the airports live in N worker processes instead.
+shard_codes = [c.strip().upper() for c in os.environ.get('AIRPORT_CODES','').split(',') if c.strip()]
+shards = shard.open_shards(shard_codes,management_system.airport_graph,management_system.route_cache,
+                           workers=int(os.environ.get('AIRPORT_SHARD_WORKERS','0')),
+                           timetable=timetable) if shard_codes else None
+# One process pool for every /what_if request, one request running at a time
+what_if_workers = int(os.environ.get('AIRPORT_WHAT_IF_WORKERS',0)) or os.cpu_count() or 1
+what_if_pool = ProcessPoolExecutor(max_workers=what_if_workers)
+what_if_busy = asyncio.Lock()
 app = FastAPI()
 
 # Allow CORS for development and local Next.js
@@ -18,114 +76,410 @@ app.add_middleware(
 )
 
 
+@app.middleware('http')
+async def record_latency(request:Request,call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get('route')
+    REGISTRY.histogram('airport_http_request_seconds','API latency until response headers are sent',
+                       method=request.method,path=route.path if route is not None else 'unmatched'
+                       ).observe(time.perf_counter()-start)
+    return response
+
+@app.get('/metrics')
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(),media_type='text/plain; version=0.0.4')
+
+def _on_departure(runway,flight):
+    management_system.record_departure(runway,flight)
+    if management_system.journal is not None:
+        management_system.journal.sync(force=False)
+    processor.publish()
+
+@app.on_event('startup')
+async def start_background_tasks():
+    app.state.command_task = processor.start()
+    # Free runways as their flights depart instead of on the next allocation call
+    app.state.runway_release_task = asyncio.create_task(
+        management_system.runways.run_release_timer(on_release=_on_departure))
+    if shards is not None:
+        app.state.shard_tasks = shards.start()
+
+@app.on_event('shutdown')
+async def close_journal():
+    if management_system.journal is not None:
+        management_system.journal.close()
+    if shards is not None:
+        shards.close()
+    what_if_pool.shutdown(wait=False,cancel_futures=True)
+
+
 @app.post('/flights/add_flight')
-def add_plane(data:add_flights):
+async def add_plane(data:add_flights):
     try:
-        management_system.add_flight(data.flight_no,data.destination,data.time_str,data.is_emergency)
-        management_system.schedule_flights()
-        return {'status':f'flight No {data.flight_no} added successfully'}
+        added = await processor.submit(commands.add_flight,data.flight_no,data.destination,data.time_str,data.is_emergency)
+    except ValueError as e:
+        raise HTTPException(status_code=409,detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500,detail='flight adding failed')
+    if not added:
+        raise HTTPException(status_code=400,detail=f'invalid time {data.time_str!r}, use HH:MM')
+    return {'status':f'flight No {data.flight_no} added successfully'}
+async def _bulk_rows(request):
+    # Body is CSV (flight_no,destination,time_str,is_emergency header) or NDJSON
+    body = (await request.body()).decode('utf-8')
+    content_type = request.headers.get('content-type','')
+    if 'csv' in content_type:
+        return list(rows_from_csv(body))
+    if 'ndjson' in content_type or 'jsonl' in content_type:
+        return list(rows_from_ndjson(body))
+    raise HTTPException(status_code=415,detail='send text/csv or application/x-ndjson')
+@app.post('/flights/add_flights_bulk')
+async def add_planes_bulk(request:Request):
+    rows = await _bulk_rows(request)
+    try:
+        report = await processor.submit(commands.add_flights_bulk,rows)
+        return {'status':f"{report['added']} flights added",**report}
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'bulk flight adding failed {str(e)}')
 @app.post('/flights/cancel_flight')
-def cancel(data:cancel_flight):
+async def cancel(data:cancel_flight):
     try:
-        management_system.cancel_flight(data.flight_no)
-        return {'status':f'flight {data.flight_no} cancelled'}
+        found = await processor.submit(commands.cancel_flight,data.flight_no)
     except Exception as e:
         raise HTTPException(status_code=500,detail=f'flight could not be cancelled {str(e)}')
+    if not found:
+        raise HTTPException(status_code=404,detail=f'flight {data.flight_no} not found')
+    return {'status':f'flight {data.flight_no} cancelled'}
 @app.get('/flights/cancelled_list')
-def get_cancelled_list():
+async def get_cancelled_list(request:Request):
     try:
-        lst = [f.flight_number for f in management_system.canceled_flights]
-        return {'cancelled_list': lst}
+        return _cached(request,('cancelled',),('cancelled',),
+                       lambda: {'cancelled_list':list(processor.snapshot.cancelled)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f'Could not retrive cancelled flights {str(e)}')
 
 @app.post('/route/add_route')
-def add_route(data:route_add):
+async def add_route(data:route_add):
     try:
-        management_system.add_route(data.src,data.dest,data.distance)
+        await processor.submit(commands.add_route,data.src,data.dest,data.distance)
+        if shards is not None:
+            await shards.broadcast_route(data.src,data.dest,data.distance)
         return {'status':'Route Added successfully'}
     except Exception as e:
         raise HTTPException(status_code=500,detail=f'Route adding failed {str(e)}')
 
 @app.post('/route/find_route')
-def findroute(data:route_find_data):
+async def findroute(data:route_find_data):
     try:
-        path,distance = management_system.airport_graph.find_shortest_route(data.src,data.dest)
+        path,distance = management_system.find_shortest_route(data.src,data.dest)
         return {
             'Path':path,
-            'Distance':distance
+            'Distance':distance if path else None
         }
     except Exception as e:
         raise HTTPException(status_code=500,detail=f'Could not find the route {str(e)}')
+@app.post('/route/find_routes_batch')
+async def findroutes_batch(data:route_batch_data):
+    try:
+        results = management_system.find_routes_batch((p.src,p.dest) for p in data.pairs)
+        return {
+            'data':[
+                {'src':p.src,'dest':p.dest,'Path':path,'Distance':distance if path else None}
+                for p,(path,distance) in zip(data.pairs,results)
+            ]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'Could not find the routes {str(e)}')
+@app.post('/route/find_k_routes')
+async def find_k_routes(data:route_k_find_data):
+    try:
+        routes = management_system.find_alternative_routes(
+            data.src,data.dest,data.k,data.excluded_airports,[tuple(r) for r in data.excluded_routes])
+        return {'data':[{'Path':path,'Distance':distance} for path,distance in routes]}
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'Could not find alternative routes {str(e)}')
+@app.get('/route/timetable')
+async def timetable_route(src:str,dest:str,depart_after:Optional[datetime]=None,until:Optional[datetime]=None,
+                          transfer_minutes:float=Query(30,ge=0)):
+    # Earliest arrival by scheduled flights (Connection Scan). With `until`, every
+    # journey leaving between depart_after and until that no later departure beats.
+    try:
+        transfer = timedelta(minutes=transfer_minutes)
+        if until is None:
+            arrival,legs = management_system.earliest_arrival(src,dest,depart_after,transfer)
+            return {'arrival_time':arrival.isoformat() if arrival else None,'legs':legs}
+        options = management_system.journey_profile(src,dest,depart_after,until,transfer)
+        return {'data':[{'departure_time':departure.isoformat(),'arrival_time':arrival.isoformat(),'legs':legs}
+                        for departure,arrival,legs in options]}
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'timetable query failed {str(e)}')
+@app.get('/route/cache_stats')
+async def route_cache_stats():
+    return management_system.route_cache.stats()
+_flight_dict = flight_event
+def _history_response(f):
+    # Same fields, in the same order, as the FlightResponse model
+    return {
+        'flight_no':f.flight_number,
+        'destination':f.destination,
+        'status':f.status,
+        'assigned_runway':str(f.assigned_runway_no or ''),
+        'Emergency_flight':f.is_emergency,
+        'departure_time':f.departure_time.isoformat(),
+    }
+def _cached(request,key,collections,build):
+    # One dict lookup when nothing in `collections` changed since the last
+    # identical request; 304 when the client already holds these bytes.
+    version = tuple(management_system.versions[name] for name in collections)
+    etag,body = response_cache.get(key,version,build)
+    headers = {'ETag':etag,'Cache-Control':'no-cache'}
+    if etag_matches(request.headers.get('if-none-match'),etag):
+        return Response(status_code=304,headers=headers)
+    return Response(body,media_type='application/json',headers=headers)
+def _filters(status,destination,emergency,departure_from,departure_to):
+    return {'status':status,'destination':destination,'emergency':emergency,
+            'departure_from':departure_from,'departure_to':departure_to}
+_encode_queue_cursor = encode_cursor
+def _decode_queue_cursor(cursor):
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400,detail=f'invalid cursor {cursor!r}')
+def _wake_classes(wake):
+    # 'AA1:H,BA2:L' -> {'AA1':'H','BA2':'L'}; flights not listed plan as 'M'
+    classes = {}
+    for item in (wake or '').split(','):
+        if not item.strip():
+            continue
+        number,_,category = item.partition(':')
+        category = category.strip().upper()
+        if not number.strip() or category not in WAKE_ORDER:
+            raise HTTPException(status_code=400,detail=f'invalid wake class {item!r}, expected FLIGHT:L|M|H')
+        classes[number.strip()] = category
+    return classes
+def _ndjson(items,serialize):
+    for item in items:
+        yield json.dumps(serialize(item)) + '\n'
+async def _history_ndjson(filters,page_size=500):
+    # Read history a page at a time so each read is atomic with respect to
+    # the command processor; row cursors stay valid across batches.
+    cursor = 0
+    while cursor is not None:
+        flights,cursor = management_system.list_history(cursor,page_size,**filters)
+        for f in flights:
+            yield json.dumps(_flight_dict(f)) + '\n'
+        await asyncio.sleep(0)
+
 @app.get('/flights/list_scheduled_flights')
-def get_flights():
-    try:
-        flights = management_system.get_scheduled_flights()
-        flight_data = [
-            {
-                'flight_number': f.flight_number,
-                'destination': f.destination,
-                'departure_time': f.departure_time.isoformat(),
-                'is_emergency': f.is_emergency,
-                'assigned_runway_no': f.assigned_runway_no,
-                'status': f.status,
-            }
-            for f in flights
-        ]
-        return {'data': flight_data}
+async def get_flights(request:Request,cursor:Optional[str]=None,limit:Optional[int]=Query(None,ge=1,le=1000),
+                status:Optional[str]=None,destination:Optional[str]=None,emergency:Optional[bool]=None,
+                departure_from:Optional[datetime]=None,departure_to:Optional[datetime]=None):
+    after = _decode_queue_cursor(cursor)  # 400 before the 500 handler below
+    try:
+        filters = _filters(status,destination,emergency,departure_from,departure_to)
+        def build():
+            if limit is None and cursor is None:
+                matches = flight_filter(**filters)
+                return {'data':[_flight_dict(f) for f in processor.snapshot.scheduled if matches(f)]}
+            flights,next_cursor = management_system.list_scheduled(after,limit or 100,**filters)
+            return {'data':[_flight_dict(f) for f in flights],'next_cursor':_encode_queue_cursor(next_cursor)}
+        return _cached(request,('scheduled',cursor,limit,*filters.values()),('scheduled',),build)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f'Error fetching flights: {str(e)}')
+@app.get('/flights/list_scheduled_flights/stream')
+async def stream_flights(status:Optional[str]=None,destination:Optional[str]=None,emergency:Optional[bool]=None,
+                   departure_from:Optional[datetime]=None,departure_to:Optional[datetime]=None):
+    matches = flight_filter(**_filters(status,destination,emergency,departure_from,departure_to))
+    flights = (f for f in processor.snapshot.scheduled if matches(f))
+    return StreamingResponse(_ndjson(flights,_flight_dict),media_type='application/x-ndjson')
 @app.get('/flight/get_all_flights')
-def list_all():
-    try:
-        flights = management_system.history
-        flight_data = [
-            FlightResponse(
-                flight_no=f.flight_number,
-                destination=f.destination,
-                departure_time=f.departure_time,
-                status=f.status,
-                assigned_runway=f.assigned_runway,
-                Emergency_flight=f.is_emergency
-            )
-            for f in flights
-        ]
-        return {'data':flight_data}
+async def list_all(request:Request,cursor:Optional[int]=Query(None,ge=0),limit:Optional[int]=Query(None,ge=1,le=1000),
+             status:Optional[str]=None,destination:Optional[str]=None,emergency:Optional[bool]=None,
+             departure_from:Optional[datetime]=None,departure_to:Optional[datetime]=None):
+    try:
+        filters = _filters(status,destination,emergency,departure_from,departure_to)
+        def build():
+            if limit is None and cursor is None:
+                matches = flight_filter(**filters)
+                return {'data':[_history_response(f) for f in management_system.history if matches(f)]}
+            flights,next_cursor = management_system.list_history(cursor,limit or 100,**filters)
+            return {'data':[_history_response(f) for f in flights],'next_cursor':next_cursor}
+        return _cached(request,('history',cursor,limit,*filters.values()),('history',),build)
     except Exception as e:
         raise HTTPException(status_code=500,detail=f'Error getting history flights {str(e)}')
+@app.get('/flight/get_all_flights/stream')
+async def stream_all(status:Optional[str]=None,destination:Optional[str]=None,emergency:Optional[bool]=None,
+               departure_from:Optional[datetime]=None,departure_to:Optional[datetime]=None):
+    filters = _filters(status,destination,emergency,departure_from,departure_to)
+    return StreamingResponse(_history_ndjson(filters),media_type='application/x-ndjson')
+@app.get('/flights/status/{flight_no}')
+async def flight_status(flight_no:str):
+    location = management_system.locate_flight(flight_no)
+    if location is None:
+        raise HTTPException(status_code=404,detail=f'flight {flight_no} not found')
+    location['departure_time'] = location['departure_time'].isoformat()
+    return location
+@app.get('/flights/departing')
+async def flights_departing(start:Optional[datetime]=None,end:Optional[datetime]=None,destination:Optional[str]=None):
+    try:
+        flights = management_system.flights_departing_between(start,end,destination)
+        return {'data':[_flight_dict(f) for f in flights]}
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'Error fetching departures {str(e)}')
 @app.get('/flights/assign_runway')
-def runway_allocation():
+async def runway_allocation():
     try:
-        management_system.allocate_runways()
+        await processor.submit(commands.allocate_runways)
         return {'status':'Allocation successful'}
     except Exception as e:
         raise  HTTPException(status_code=500,detail=f'runway allocation failed {str(e)}')
+def _state_event():
+    snapshot = processor.snapshot
+    return 'snapshot',{
+        'runways':[{'runway_no':runway_no,'flight_no':flight_no} for runway_no,flight_no in snapshot.runways],
+        'cancelled_list':list(snapshot.cancelled),
+        'scheduled':[_flight_dict(f) for f in snapshot.scheduled],
+    }
+@app.get('/changes/stream')
+async def change_stream(request:Request,since:Optional[int]=Query(None,ge=0)):
+    # SSE: a 'snapshot' event first (unless resuming), then flight_added,
+    # flights_added, runway_assigned, runway_released, flight_cancelled,
+    # cancellation_undone, flight_escalated and route_added events.
+    # Browsers resume with Last-Event-ID automatically.
+    last_event_id = request.headers.get('last-event-id')
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    return StreamingResponse(management_system.changes.stream(since,snapshot=_state_event),
+                             media_type='text/event-stream',
+                             headers={'Cache-Control':'no-cache','X-Accel-Buffering':'no'})
+@app.get('/runways/plan')
+async def runway_plan(hours:float=Query(6,gt=0,le=48),wake:Optional[str]=None):
+    # Look-ahead plan: a runway time slot for every waiting flight in the next `hours`,
+    # after the runways still held by assigned flights. `wake` lists wake categories
+    # (e.g. 'AA1:H,BA2:L') for wake separation. Served from the kept plan (cancel/undo
+    # update it in place); re-planned only when stale.
+    wake_classes = _wake_classes(wake)
+    try:
+        slots = await processor.submit(commands.plan_runways,hours,wake_classes)
+        return {'data':slots}
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'runway planning failed {str(e)}')
+@app.get('/what_if')
+async def what_if(runs:int=Query(1000,ge=1,le=10000),delay_probability:float=Query(0.2,ge=0,le=1),
+                  mean_delay_minutes:float=Query(20,ge=0),runway_closure_probability:float=Query(0.3,ge=0,le=1),
+                  closure_hours:float=Query(2,ge=0),airport_closure_probability:float=Query(0.05,ge=0,le=1),
+                  seed:int=0):
+    # State is captured between command batches; the runs execute in the shared
+    # worker pool off the event loop. A second concurrent request gets 429.
+    if what_if_busy.locked():
+        raise HTTPException(status_code=429,detail='a what-if run is already in progress')
+    try:
+        async with what_if_busy:
+            scenario = Scenario(delay_probability,timedelta(minutes=mean_delay_minutes),runway_closure_probability,
+                                timedelta(hours=closure_hours),airport_closure_probability)
+            state = compact_state(management_system)
+            report = await asyncio.get_running_loop().run_in_executor(
+                None,run_what_if,state,runs,scenario,what_if_workers,seed,what_if_pool)
+        return report.summary()
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'what-if run failed {str(e)}')
 @app.get('/runways/status')
-def runway_info():
+async def runway_info(request:Request):
     try:
-        runways = management_system.runways
-        lst = [RunwayResponse(
-            runway_no=r.runway_id,
-            flight_no=r.current_flight_name
-        )for r in runways]
-        return {
-            'data':lst
-        }
+        return _cached(request,('runways',),('runways',),lambda: {
+            'data':[{'runway_no':runway_no,'flight_no':flight_no} for runway_no,flight_no in processor.snapshot.runways]
+        })
     except Exception as e:
         raise HTTPException(status_code=500,detail='COuld,nt get info')
 
 
-
-
-
-
-
-
-
-
-
-
-
-
+# ---------------- MULTI-AIRPORT ----------------
+# Each airport has its own single writer, so a busy hub does not hold up the
+# others. Routes are network-wide: /route/* above serves every airport.
+def _shard(code):
+    code = code.upper()
+    if shards is None or code not in shards:
+        raise HTTPException(status_code=404,detail=f'airport {code} is not served here')
+    return code
+async def _connect(code,destinations):
+    # The shared network is only changed here, through the main processor
+    for destination in destinations:
+        if await processor.submit(commands.connect_destination,code,destination):
+            await shards.broadcast_route(code,destination,5)
+@app.get('/airports')
+async def airports():
+    return {'data':shards.codes if shards is not None else []}
+@app.post('/airports/{code}/flights/add_flight')
+async def shard_add_plane(code:str,data:add_flights):
+    code = _shard(code)
+    try:
+        added = await shards.submit(code,commands.add_flight,data.flight_no,data.destination,data.time_str,data.is_emergency)
+        if added:
+            # Connect only destinations of accepted flights, spelled as they were stored
+            await _connect(code,[normalize_destination(data.destination)])
+    except ValueError as e:
+        raise HTTPException(status_code=409,detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500,detail='flight adding failed')
+    if not added:
+        raise HTTPException(status_code=400,detail=f'invalid time {data.time_str!r}, use HH:MM')
+    return {'status':f'flight No {data.flight_no} added successfully at {code}'}
+@app.post('/airports/{code}/flights/add_flights_bulk')
+async def shard_add_planes_bulk(code:str,request:Request):
+    code = _shard(code)
+    rows = await _bulk_rows(request)
+    try:
+        report = await shards.submit(code,commands.add_flights_bulk,rows)
+        rejected = {error['row'] for error in report['errors']}
+        await _connect(code,sorted({normalize_destination(row.get('destination')) for number,row in rows
+                                    if number not in rejected}))
+        return {'status':f"{report['added']} flights added at {code}",**report}
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'bulk flight adding failed {str(e)}')
+@app.post('/airports/{code}/flights/cancel_flight')
+async def shard_cancel(code:str,data:cancel_flight):
+    code = _shard(code)
+    try:
+        found = await shards.submit(code,commands.cancel_flight,data.flight_no)
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'flight could not be cancelled {str(e)}')
+    if not found:
+        raise HTTPException(status_code=404,detail=f'flight {data.flight_no} not found at {code}')
+    return {'status':f'flight {data.flight_no} cancelled at {code}'}
+@app.get('/airports/{code}/flights/assign_runway')
+async def shard_runway_allocation(code:str):
+    code = _shard(code)
+    try:
+        await shards.submit(code,commands.allocate_runways)
+        return {'status':'Allocation successful'}
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'runway allocation failed {str(e)}')
+@app.get('/airports/{code}/runways/plan')
+async def shard_runway_plan(code:str,hours:float=Query(6,gt=0,le=48),wake:Optional[str]=None):
+    code = _shard(code)
+    wake_classes = _wake_classes(wake)
+    try:
+        return {'data':await shards.submit(code,commands.plan_runways,hours,wake_classes)}
+    except Exception as e:
+        raise HTTPException(status_code=500,detail=f'runway planning failed {str(e)}')
+@app.get('/airports/{code}/runways/status')
+async def shard_runway_info(code:str):
+    code = _shard(code)
+    runways = await shards.query(code,shard.runway_status)
+    return {'data':[RunwayResponse(runway_no=runway_no,flight_no=flight_no) for runway_no,flight_no in runways]}
+@app.get('/airports/{code}/flights/list_scheduled_flights')
+async def shard_get_flights(code:str):
+    code = _shard(code)
+    return {'data':await shards.query(code,shard.scheduled_flights)}
+@app.get('/airports/{code}/flights/cancelled_list')
+async def shard_cancelled_list(code:str):
+    code = _shard(code)
+    return {'cancelled_list':await shards.query(code,shard.cancelled_list)}
+@app.get('/airports/{code}/flights/status/{flight_no}')
+async def shard_flight_status(code:str,flight_no:str):
+    code = _shard(code)
+    location = await shards.query(code,shard.flight_status,flight_no)
+    if location is None:
+        raise HTTPException(status_code=404,detail=f'flight {flight_no} not found at {code}')
+    return location
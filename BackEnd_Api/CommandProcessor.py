@@ -0,0 +1,156 @@
+"""
+CommandProcessor.py
+Single-writer actor that owns the AirportManagementSystem for the API.
+"""
+
+import asyncio
+
+
+class Snapshot:
+    """Read-only view of the system published after each command batch.
+
+    Runway and cancellation lists are copied when the snapshot is taken.
+    The scheduled-flight list is larger, so it is built on first read and
+    memoized; that read happens on the event loop before the next batch can
+    run, so it still reflects exactly this version.
+    """
+
+    __slots__ = ('version', 'runways', 'cancelled', '_system', '_scheduled')
+
+    def __init__(self, version, system):
+        self.version = version
+        self.runways = tuple((r.runway_id, r.current_flight_name) for r in system.runways)
+        self.cancelled = tuple(f.flight_number for f in system.canceled_flights)
+        self._system = system
+        self._scheduled = None
+
+    @property
+    def scheduled(self):
+        if self._scheduled is None:
+            self._scheduled = tuple(self._system.get_scheduled_flights())
+            self._system = None
+        return self._scheduled
+
+
+class CommandProcessor:
+    """Serializes every mutation of one AirportManagementSystem.
+
+    Handlers ``await submit(command, *args)``; commands are plain callables
+    taking the system as first argument. One asyncio task drains the queue,
+    taking up to ``max_batch`` queued commands at a time. Within a batch,
+    consecutive adds share one ``schedule_flights``, run before the next
+    command of another kind (so a cancel or plan sees flights added earlier
+    in the same batch) and at the end of the batch. Repeated allocation
+    requests collapse into a single ``allocate_runways`` at the end. When
+    the system has a journal, the batch is made durable with one fsync
+    before any caller is answered; then a new ``Snapshot`` is published.
+    If the batch-wide steps fail, every caller in the batch gets the error;
+    callers that were cancelled meanwhile are skipped.
+    """
+
+    def __init__(self, system, max_batch=256):
+        self.system = system
+        self.max_batch = max_batch
+        self.version = 0
+        self.snapshot = Snapshot(0, system)
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def submit(self, command, *args):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((command, args, future))
+        return await future
+
+    def publish(self):
+        """Publish a new snapshot (also used by background tasks that mutate)."""
+        self.version += 1
+        self.snapshot = Snapshot(self.version, self.system)
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                outcomes = self._apply(batch)
+                if self.system.journal is not None:
+                    self.system.journal.sync()  # group commit for the whole batch
+            except Exception as e:
+                # schedule_flights or the fsync failed: fail this batch, keep serving
+                outcomes = [(future, None, e) for _, _, future in batch]
+            for future, result, error in outcomes:
+                if future.done():
+                    continue  # the caller was cancelled while the command was queued
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+            self.publish()
+
+    def _apply(self, batch):
+        """Run one batch; returns (future, result, error) to resolve after sync."""
+        system = self.system
+        outcomes = []
+        deferred = []
+        for command, args, future in batch:
+            if command is allocate_runways:
+                deferred.append(future)
+                continue
+            if command not in _ADDS and system.flight_queue:
+                system.schedule_flights()
+            try:
+                outcomes.append((future, command(system, *args), None))
+            except Exception as e:
+                outcomes.append((future, None, e))
+        if system.flight_queue:
+            system.schedule_flights()
+        if deferred:
+            try:
+                system.allocate_runways()
+                error = None
+            except Exception as e:
+                error = e
+            outcomes.extend((future, None, error) for future in deferred)
+        return outcomes
+
+
+# ---------------- COMMANDS ----------------
+def add_flight(system, number, destination, time_str, emergency):
+    """True if the flight was queued, False if its time was invalid."""
+    return system.add_flight(number, destination, time_str, emergency) is not None
+
+
+def add_flights_bulk(system, rows):
+    return system.add_flights_bulk(rows)
+
+
+def cancel_flight(system, number):
+    return system.cancel_flight(number)
+
+
+_ADDS = (add_flight, add_flights_bulk)  # commands that only fill system.flight_queue
+
+
+def add_route(system, source, destination, distance):
+    system.add_route(source, destination, distance)
+
+
+def allocate_runways(system):
+    system.allocate_runways()
+
+
+def plan_runways(system, hours, wake_classes=None):
+    return [slot.as_dict() for slot in system.current_plan(hours, wake_classes)]
+
+
+def connect_destination(system, hub, destination):
+    """Default hub route for a destination the network does not know yet; True if added."""
+    if destination in system.airport_graph:
+        return False
+    system.add_route(hub, destination, 5)
+    return True
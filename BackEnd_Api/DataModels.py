@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
 
 class add_flights(BaseModel):
     flight_no:str
@@ -14,6 +16,14 @@ class route_add(BaseModel):
 class route_find_data(BaseModel):
     src:str
     dest:str
+class route_batch_data(BaseModel):
+    pairs:List[route_find_data]
+class route_k_find_data(BaseModel):
+    src:str
+    dest:str
+    k:int = Field(3,ge=1,le=10)  # each extra route costs several Dijkstra searches
+    excluded_airports:List[str] = []
+    excluded_routes:List[List[str]] = []
 class FlightResponse(BaseModel):
     flight_no:str
     destination:str
@@ -0,0 +1,70 @@
+"""
+ResponseCache.py
+Encoded JSON response bodies cached by state version, with ETags for conditional GETs.
+"""
+
+import json
+import time
+import zlib
+from collections import OrderedDict
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard encoder
+    orjson = None
+
+
+def encode_json(payload):
+    """Compact UTF-8 JSON bytes, as FastAPI's JSONResponse would render them."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def etag_matches(if_none_match, etag):
+    """True if an If-None-Match header value names ``etag`` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in if_none_match.split(','))
+
+
+class ResponseCache:
+    """LRU of encoded bodies keyed by request, valid while the state version holds.
+
+    ``get(key, version, build)`` calls ``build()`` and encodes its result
+    only when ``key`` is new or its ``version`` moved on; otherwise it is a
+    dictionary lookup. The ETag combines a per-process epoch (versions
+    restart at zero after a restart), the key and the version, so a client
+    revalidating an old ETag gets 304 exactly when the body would be the same.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self._entries = OrderedDict()  # key -> (version, etag, body)
+        self._epoch = f'{time.time_ns():x}'
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, version, build):
+        """Return (etag, body) for ``key`` at ``version``."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1], entry[2]
+        self.misses += 1
+        body = encode_json(build())
+        etag = f'"{self._epoch}-{zlib.crc32(repr(key).encode()):x}-{".".join(map(str, version))}"'
+        self._entries[key] = (version, etag, body)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return etag, body
+
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,198 @@
+"""
+ShardDispatcher.py
+One independent AirportManagementSystem per airport code, behind a common async interface.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from AirportManagementSystem import AirportManagementSystem, flight_event
+from BackEnd_Api.CommandProcessor import CommandProcessor
+
+
+def _shard_system(graph, runway_count, route_cache=None):
+    # hub=None: a shard never edits the shared network itself; the front end
+    # adds routes for new destinations (see _connect in API.py).
+    system = AirportManagementSystem(runway_count, airport_graph=graph, sample_routes=False, hub=None)
+    if route_cache is not None:
+        system.route_cache = route_cache
+    return system
+
+
+class LocalShards:
+    """All airports in this process, each behind its own CommandProcessor.
+
+    Every shard has its own queue, batches and runway release timer, so a
+    busy hub no longer delays commands for other airports. The route graph
+    and its RouteCache are one shared object: adding a route is seen by all
+    shards immediately and invalidates cached trees once. So is the
+    optional Timetable, so journeys can change between airports.
+    """
+
+    def __init__(self, codes, graph, route_cache, runway_count=3, timetable=None):
+        self.graph = graph
+        self.systems = {code: _shard_system(graph, runway_count, route_cache) for code in codes}
+        if timetable is not None:
+            for code, system in self.systems.items():
+                system.use_timetable(timetable, code)
+        self.processors = {code: CommandProcessor(system) for code, system in self.systems.items()}
+        self._tasks = []
+
+    def __contains__(self, code):
+        return code in self.systems
+
+    @property
+    def codes(self):
+        return list(self.systems)
+
+    def start(self):
+        for code, processor in self.processors.items():
+            runways = self.systems[code].runways
+            self._tasks.append(processor.start())
+            self._tasks.append(asyncio.create_task(runways.run_release_timer(on_release=self._releaser(code))))
+        return self._tasks
+
+    def _releaser(self, code):
+        system, processor = self.systems[code], self.processors[code]
+
+        def on_release(runway, flight):
+            system.record_departure(runway, flight)
+            processor.publish()
+        return on_release
+
+    async def submit(self, code, command, *args):
+        """Run a mutating command through the airport's command processor."""
+        return await self.processors[code].submit(command, *args)
+
+    async def query(self, code, query, *args):
+        """Run a read-only query; it sees the state between two batches."""
+        return query(self.systems[code], *args)
+
+    async def broadcast_route(self, source, destination, distance):
+        pass  # the graph is shared, so the route is already visible everywhere
+
+    def close(self):
+        for task in self._tasks:
+            task.cancel()
+
+
+class ProcessShards:
+    """Airports hosted in ``workers`` worker processes.
+
+    Airport codes are spread round-robin over single-process pools; a pool
+    runs one call at a time, so each airport still has a single writer,
+    while airports on different workers run on different cores. Each worker
+    receives the route graph once, through the pool initializer, and keeps
+    one RouteCache shared by its airports. Route additions made by the front
+    end are broadcast to every worker. Departed flights' runways are
+    released before each call instead of by a timer.
+    """
+
+    def __init__(self, codes, graph, runway_count=3, workers=None):
+        self.graph = graph
+        self.runway_count = runway_count
+        workers = max(1, min(workers or os.cpu_count() or 1, len(codes)))
+        self.placement = {code: i % workers for i, code in enumerate(codes)}
+        self._groups = [[code for code in codes if self.placement[code] == i] for i in range(workers)]
+        self._pools = []
+
+    def __contains__(self, code):
+        return code in self.placement
+
+    @property
+    def codes(self):
+        return list(self.placement)
+
+    def start(self):
+        # The graph is copied into the workers here, after startup routes exist
+        self._pools = [ProcessPoolExecutor(max_workers=1, initializer=_init_worker,
+                                           initargs=(group, self.graph, self.runway_count))
+                       for group in self._groups]
+        return []
+
+    async def submit(self, code, command, *args):
+        return await self._call(self.placement[code], _run_command, code, command, args)
+
+    async def query(self, code, query, *args):
+        return await self._call(self.placement[code], _run_query, code, query, args)
+
+    async def broadcast_route(self, source, destination, distance):
+        await asyncio.gather(*(self._call(worker, _add_route, source, destination, distance)
+                               for worker in range(len(self._pools))))
+
+    async def _call(self, worker, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._pools[worker], function, *args)
+
+    def close(self):
+        for pool in self._pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def open_shards(codes, graph, route_cache, runway_count=3, workers=0, timetable=None):
+    """LocalShards when ``workers`` is 0, otherwise ProcessShards over that many processes.
+
+    Only in-process airports feed ``timetable``; worker-hosted ones keep
+    their flights to themselves.
+    """
+    codes = list(dict.fromkeys(codes))
+    if workers:
+        return ProcessShards(codes, graph, runway_count, workers)
+    return LocalShards(codes, graph, route_cache, runway_count, timetable)
+
+
+# ---------------- WORKER PROCESS ----------------
+_SYSTEMS = {}
+
+
+def _init_worker(codes, graph, runway_count):
+    from Metrics import quiet_logging
+    from RouteCache import RouteCache
+
+    route_cache = RouteCache(graph)
+    with quiet_logging():
+        for code in codes:
+            _SYSTEMS[code] = _shard_system(graph, runway_count, route_cache)
+
+
+def _run_command(code, command, args):
+    system = _SYSTEMS[code]
+    system._clear_departed_flights()
+    result = command(system, *args)
+    if system.flight_queue:
+        system.schedule_flights()  # as CommandProcessor does after each batch
+    return result
+
+
+def _run_query(code, query, args):
+    system = _SYSTEMS[code]
+    system._clear_departed_flights()
+    return query(system, *args)
+
+
+def _add_route(source, destination, distance):
+    system = next(iter(_SYSTEMS.values()), None)
+    if system is not None:
+        system.airport_graph.add_route(source, destination, distance)
+        system.route_cache.route_added(source, destination, distance)
+
+
+# ---------------- QUERIES ----------------
+# Read-only and returning plain data, so they can cross a process boundary.
+def runway_status(system):
+    return [(r.runway_id, r.current_flight_name) for r in system.runways]
+
+
+def scheduled_flights(system):
+    return [flight_event(f) for f in system.get_scheduled_flights()]
+
+
+def cancelled_list(system):
+    return [f.flight_number for f in system.canceled_flights]
+
+
+def flight_status(system, number):
+    location = system.locate_flight(number)
+    if location is not None:
+        location['departure_time'] = location['departure_time'].isoformat()
+    return location
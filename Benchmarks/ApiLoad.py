@@ -0,0 +1,168 @@
+"""
+ApiLoad.py
+In-process load driver for the FastAPI app: calls it over ASGI, no server or sockets.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+
+from Benchmarks.Workload import DESTINATIONS
+from Metrics import percentile
+
+
+async def _request(app, method, path, body=None):
+    """Send one HTTP request straight into an ASGI app; returns the status code."""
+    route, _, query = path.partition('?')
+    payload = json.dumps(body).encode() if body is not None else b''
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+        'method': method, 'scheme': 'http', 'path': route, 'raw_path': route.encode(),
+        'query_string': query.encode(), 'root_path': '',
+        'headers': [(b'host', b'bench'), (b'content-type', b'application/json'),
+                    (b'content-length', str(len(payload)).encode())],
+        'client': ('bench', 0), 'server': ('bench', 80),
+    }
+    finished = asyncio.Event()
+    delivered = False
+    status = None
+
+    async def receive():
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {'type': 'http.request', 'body': payload, 'more_body': False}
+        await finished.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        finished.set()
+    return status
+
+
+async def _lifespan(app):
+    """Run the app's startup handlers; returns a coroutine function that shuts it down."""
+    messages = asyncio.Queue()
+    started = asyncio.get_running_loop().create_future()
+    stopped = asyncio.get_running_loop().create_future()
+
+    async def receive():
+        return await messages.get()
+
+    async def send(message):
+        if message['type'].startswith('lifespan.startup') and not started.done():
+            started.set_result(message['type'])
+        elif message['type'].startswith('lifespan.shutdown') and not stopped.done():
+            stopped.set_result(message['type'])
+
+    task = asyncio.create_task(app({'type': 'lifespan', 'asgi': {'version': '3.0'}}, receive, send))
+    await messages.put({'type': 'lifespan.startup'})
+    if await started != 'lifespan.startup.complete':
+        raise RuntimeError("API startup failed")
+
+    async def shutdown():
+        await messages.put({'type': 'lifespan.shutdown'})
+        await asyncio.wait_for(stopped, 10)
+        task.cancel()
+    return shutdown
+
+
+def _workload(rng, index, added):
+    """Pick the next request: (endpoint label, method, path, body)."""
+    roll = rng.random()
+    if roll < 0.30 or not added:
+        number = f"LD{index}"
+        added.append(number)
+        body = {'flight_no': number, 'destination': rng.choice(DESTINATIONS),
+                'time_str': f"{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+                'is_emergency': rng.random() < 0.02}
+        return 'POST /flights/add_flight', 'POST', '/flights/add_flight', body
+    if roll < 0.45:
+        return 'GET /flights/list_scheduled_flights', 'GET', '/flights/list_scheduled_flights?limit=50', None
+    if roll < 0.55:
+        return 'GET /runways/status', 'GET', '/runways/status', None
+    if roll < 0.62:
+        return 'GET /flights/assign_runway', 'GET', '/flights/assign_runway', None
+    if roll < 0.70:
+        number = rng.choice(added)
+        return 'GET /flights/status/{flight_no}', 'GET', f'/flights/status/{number}', None
+    if roll < 0.76:
+        number = added.pop(rng.randrange(len(added)))
+        return 'POST /flights/cancel_flight', 'POST', '/flights/cancel_flight', {'flight_no': number}
+    if roll < 0.90:
+        src, dest = rng.sample(DESTINATIONS, 2)
+        return 'POST /route/find_route', 'POST', '/route/find_route', {'src': src, 'dest': dest}
+    if roll < 0.97:
+        return 'GET /flights/cancelled_list', 'GET', '/flights/cancelled_list', None
+    return 'GET /metrics', 'GET', '/metrics', None
+
+
+async def _drive(app, requests, concurrency, seed):
+    rng = random.Random(seed)
+    plan = []
+    added = []
+    for index in range(requests):
+        plan.append(_workload(rng, index, added))
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    position = 0
+
+    async def worker():
+        nonlocal position
+        while position < len(plan):
+            label, method, path, body = plan[position]
+            position += 1
+            started = time.perf_counter()
+            status = await _request(app, method, path, body)
+            latencies[label].append(time.perf_counter() - started)
+            if status is None or status >= 400:
+                errors[label] += 1
+
+    shutdown = await _lifespan(app)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        wall = time.perf_counter() - started
+        await shutdown()
+    return latencies, errors, wall
+
+
+def run_api_load(requests=2000, concurrency=32, seed=0):
+    """Replay a seeded request mix against BackEnd_Api.API and summarize latency.
+
+    Returns {'requests', 'concurrency', 'wall_seconds', 'requests_per_second',
+    'endpoints': {label: {count, errors, p50_ms, p99_ms, max_ms}}}. Latency
+    includes time queued behind the command processor, as a client would see.
+    """
+    from BackEnd_Api.API import app
+    from Metrics import quiet_logging
+
+    with quiet_logging():
+        latencies, errors, wall = asyncio.run(_drive(app, requests, concurrency, seed))
+    endpoints = {}
+    for label, values in sorted(latencies.items()):
+        values.sort()
+        endpoints[label] = {
+            'count': len(values),
+            'errors': errors[label],
+            'p50_ms': round(percentile(values, 50) * 1000, 3),
+            'p99_ms': round(percentile(values, 99) * 1000, 3),
+            'max_ms': round(values[-1] * 1000, 3),
+        }
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'wall_seconds': round(wall, 3),
+        'requests_per_second': round(requests / wall) if wall else None,
+        'endpoints': endpoints,
+    }
@@ -0,0 +1,92 @@
+"""
+Assignment.py
+Greedy allocate_runways against min-cost batch assignment: time per cycle and cost.
+
+Run from the repository root:
+    python -m Benchmarks.Assignment
+    python -m Benchmarks.Assignment --sizes 200x24 500x48 --cycles 20
+"""
+
+import argparse
+import json
+import time
+from datetime import timedelta
+
+from AirportManagementSystem import AirportManagementSystem
+from Benchmarks.Workload import BENCH_START, random_assignment_costs, random_flights
+from Metrics import quiet_logging
+from RunwayAssignment import total_cost
+
+DEFAULT_SIZES = ((100, 12), (200, 24), (500, 48), (1000, 64))
+
+
+def run_cycle(flights, runway_count, costs=None):
+    """One allocation cycle on a fresh system; returns (seconds, [(flight, runway_id)])."""
+    with quiet_logging():
+        system = AirportManagementSystem(runway_count=runway_count, clock=lambda: BENCH_START)
+        for number, destination, departure, emergency in flights:
+            system.add_flight_at(number, destination, departure, emergency)
+        system.schedule_flights()
+        system.assignment_costs = costs
+        started = time.perf_counter()
+        system.allocate_runways(show_runways=False)
+        seconds = time.perf_counter() - started
+    return seconds, [(r.current_flight, r.runway_id) for r in system.runways if r.current_flight is not None]
+
+
+def compare_assignment(waiting, runway_count, cycles=10, seed=0, emergency_ratio=0.05):
+    """Average per cycle, for both modes: time, cost of the suitable pairs, taxi minutes,
+    unsuitable pairs and emergencies seated. Departures fall within an hour either side
+    of the clock, so some flights are overdue and some are not due yet."""
+    runway_ids = list(range(1, runway_count + 1))
+    totals = {mode: {'ms': 0.0, 'cost': 0.0, 'taxi_minutes': 0.0, 'unsuitable': 0, 'emergencies_seated': 0}
+              for mode in ('greedy', 'optimal')}
+    for cycle in range(cycles):
+        flights = random_flights(waiting, seed=seed + cycle, emergency_ratio=emergency_ratio,
+                                 start=BENCH_START - timedelta(hours=1), span=timedelta(hours=2))
+        costs = random_assignment_costs(flights, runway_count, seed=seed + cycle)
+        for mode in totals:
+            seconds, pairs = run_cycle(flights, runway_count, costs if mode == 'optimal' else None)
+            cost, unsuitable = total_cost(pairs, runway_ids, BENCH_START, costs)
+            totals[mode]['ms'] += seconds * 1000
+            totals[mode]['cost'] += cost
+            totals[mode]['taxi_minutes'] += sum(costs.taxi_minutes[costs.stands[f.flight_number]][r]
+                                                for f, r in pairs)
+            totals[mode]['unsuitable'] += unsuitable
+            totals[mode]['emergencies_seated'] += sum(f.is_emergency for f, _ in pairs)
+    return {
+        'waiting': waiting,
+        'runways': runway_count,
+        'cycles': cycles,
+        **{mode: {key: round(value / cycles, 3) for key, value in stats.items()} for mode, stats in totals.items()},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Greedy vs min-cost runway assignment")
+    parser.add_argument('--sizes', nargs='+', help="WAITINGxRUNWAYS, e.g. 500x48")
+    parser.add_argument('--cycles', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+    sizes = [tuple(map(int, size.lower().split('x'))) for size in args.sizes] if args.sizes else DEFAULT_SIZES
+
+    results = []
+    for waiting, runway_count in sizes:
+        result = compare_assignment(waiting, runway_count, args.cycles, args.seed)
+        results.append(result)
+        for mode in ('greedy', 'optimal'):
+            stats = result[mode]
+            print(f"{waiting:>6} flights x {runway_count:<4} {mode:>8}: {stats['ms']:8.2f} ms/cycle  "
+                  f"cost {stats['cost']:9.1f}  taxi {stats['taxi_minutes']:7.1f} min  "
+                  f"unsuitable {stats['unsuitable']:4.1f}  emergencies seated {stats['emergencies_seated']:4.1f}",
+                  flush=True)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(results, handle, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Landmarks.py
+Plain Dijkstra against ALT (A* with landmarks): preprocessing, time and airports settled per query.
+
+Run from the repository root:
+    python -m Benchmarks.Landmarks
+    python -m Benchmarks.Landmarks --airports 50000 --landmarks 24 --queries 500
+"""
+
+import argparse
+import json
+import time
+
+from Benchmarks.Workload import random_graph, random_queries
+from LandmarkRouter import LandmarkRouter
+
+
+def compare_routing(airports, landmark_count=16, queries=200, seed=0):
+    """Build a router on a seeded ``random_graph`` and answer the same queries both ways.
+
+    Returns per-query averages (ms and airports settled) for each mode, plus the
+    preprocessing time. Raises AssertionError if ALT and Dijkstra ever disagree."""
+    graph = random_graph(airports, seed=seed)
+    router = LandmarkRouter(graph, landmark_count=landmark_count, seed=seed)
+    started = time.perf_counter()
+    router.build()
+    preprocessing = time.perf_counter() - started
+    pairs = random_queries(graph, queries, seed=seed + 1)
+
+    started = time.perf_counter()
+    baseline = [graph.find_shortest_route(a, b)[1] for a, b in pairs]
+    dijkstra_seconds = time.perf_counter() - started
+
+    settled = 0
+    results = []
+    started = time.perf_counter()
+    for a, b in pairs:
+        results.append(router.find_shortest_route(a, b)[1])
+        settled += router.last_settled
+    alt_seconds = time.perf_counter() - started
+
+    dijkstra_settled = 0
+    for a, b in pairs:
+        router.dijkstra_route(a, b)
+        dijkstra_settled += router.last_settled
+
+    assert all(x == y or abs(x - y) < 1e-6 for x, y in zip(baseline, results))
+    count = len(pairs) or 1
+    return {
+        'airports': len(graph.graph),
+        'landmarks': len(router.landmarks),
+        'queries': len(pairs),
+        'preprocessing_s': round(preprocessing, 3),
+        'dijkstra': {'ms': round(dijkstra_seconds * 1000 / count, 3), 'settled': round(dijkstra_settled / count, 1)},
+        'alt': {'ms': round(alt_seconds * 1000 / count, 3), 'settled': round(settled / count, 1)},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dijkstra vs ALT point-to-point routing")
+    parser.add_argument('--airports', type=int, default=10_000)
+    parser.add_argument('--landmarks', type=int, default=16)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    result = compare_routing(args.airports, args.landmarks, args.queries, args.seed)
+    print(f"Preprocessing: {result['preprocessing_s']:.2f}s for {result['airports']} airports, "
+          f"{result['landmarks']} landmarks")
+    for mode in ('dijkstra', 'alt'):
+        stats = result[mode]
+        print(f"{mode:>8}: {stats['ms']:.2f} ms/query, {stats['settled']:.0f} airports settled")
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(result, handle, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Suite.py
+Core operation benchmarks at 10^2..10^6 scale with JSON output and comparison.
+
+Run from the repository root:
+    python -m Benchmarks.Suite --scales 100 1000 10000 --output bench.json
+    python -m Benchmarks.Suite --compare bench.json          # fails on regressions
+    python -m Benchmarks.Suite --api --api-requests 5000     # adds the API load run
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from AirportManagementSystem import AirportManagementSystem
+from Benchmarks.Workload import BENCH_START, query_count, random_flights, random_graph, random_queries
+from Metrics import quiet_logging
+
+DEFAULT_SCALES = (100, 1_000, 10_000, 100_000)
+
+
+def _system(runway_count=3, airport_graph=None):
+    return AirportManagementSystem(runway_count=runway_count, clock=lambda: BENCH_START,
+                                   airport_graph=airport_graph, sample_routes=airport_graph is None)
+
+
+def _loaded_system(flights, runway_count=3, schedule=True):
+    system = _system(runway_count)
+    for number, destination, departure, emergency in flights:
+        system.add_flight_at(number, destination, departure, emergency)
+    if schedule:
+        system.schedule_flights()
+    return system
+
+
+# ---------------- BENCHMARKS ----------------
+# Each takes (scale, seed, flights) and returns (operations, seconds); setup
+# is not timed.
+def bench_add_flight(scale, seed, flights):
+    system = _system()
+    add = system.add_flight_at
+    started = time.perf_counter()
+    for number, destination, departure, emergency in flights:
+        add(number, destination, departure, emergency)
+    return len(flights), time.perf_counter() - started
+
+
+def bench_schedule_flights(scale, seed, flights):
+    system = _loaded_system(flights, schedule=False)
+    started = time.perf_counter()
+    system.schedule_flights()
+    return len(flights), time.perf_counter() - started
+
+
+def bench_allocate_runways(scale, seed, flights):
+    runway_count = max(3, min(scale // 10, 100_000))
+    system = _loaded_system(flights, runway_count)
+    started = time.perf_counter()
+    system.allocate_runways(show_runways=False)
+    return runway_count, time.perf_counter() - started
+
+
+def bench_cancel_flight(scale, seed, flights):
+    system = _loaded_system(flights)
+    numbers = [f[0] for f in random.Random(seed).sample(flights, max(1, scale // 10))]
+    started = time.perf_counter()
+    for number in numbers:
+        system.cancel_flight(number)
+    return len(numbers), time.perf_counter() - started
+
+
+def bench_undo_cancellation(scale, seed, flights):
+    system = _loaded_system(flights)
+    count = max(1, scale // 10)
+    for number, *_ in random.Random(seed).sample(flights, count):
+        system.cancel_flight(number)
+    started = time.perf_counter()
+    for _ in range(count):
+        system.undo_cancellation()
+    return count, time.perf_counter() - started
+
+
+def bench_find_shortest_route(scale, seed, flights):
+    """Cached route queries through the system (RouteCache over AirportGraph)."""
+    graph = random_graph(scale, seed=seed)
+    system = _system(airport_graph=graph)
+    queries = random_queries(graph, query_count(scale), seed=seed)
+    started = time.perf_counter()
+    for start, destination in queries:
+        system.find_shortest_route(start, destination)
+    return len(queries), time.perf_counter() - started
+
+
+def bench_dijkstra(scale, seed, flights):
+    """Uncached point-to-point Dijkstra on AirportGraph, for reference."""
+    graph = random_graph(scale, seed=seed)
+    queries = random_queries(graph, query_count(scale), seed=seed + 1)
+    started = time.perf_counter()
+    for start, destination in queries:
+        graph.find_shortest_route(start, destination)
+    return len(queries), time.perf_counter() - started
+
+
+BENCHMARKS = {
+    'add_flight': bench_add_flight,
+    'schedule_flights': bench_schedule_flights,
+    'allocate_runways': bench_allocate_runways,
+    'cancel_flight': bench_cancel_flight,
+    'undo_cancellation': bench_undo_cancellation,
+    'find_shortest_route': bench_find_shortest_route,
+    'dijkstra': bench_dijkstra,
+}
+
+
+def run_suite(scales=DEFAULT_SCALES, names=None, seed=0, repeat=3, emergency_ratio=0.02,
+              distribution="uniform", progress=None):
+    """Run every benchmark at every scale; keeps the fastest of ``repeat`` runs."""
+    results = []
+    for scale in scales:
+        flights = random_flights(scale, seed=seed, emergency_ratio=emergency_ratio, distribution=distribution)
+        for name in names or BENCHMARKS:
+            best = None
+            for _ in range(repeat if scale <= 100_000 else 1):
+                gc.collect()
+                with quiet_logging():
+                    operations, seconds = BENCHMARKS[name](scale, seed, flights)
+                if best is None or seconds < best[1]:
+                    best = (operations, seconds)
+            operations, seconds = best
+            result = {
+                'benchmark': name,
+                'scale': scale,
+                'operations': operations,
+                'seconds': round(seconds, 6),
+                'us_per_op': round(seconds * 1e6 / operations, 3),
+                'ops_per_second': round(operations / seconds) if seconds else None,
+            }
+            results.append(result)
+            if progress:
+                progress(result)
+    return results
+
+
+def environment(seed):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+    }
+
+
+def compare(previous, current, threshold=0.2):
+    """Rows of (benchmark, scale, old us/op, new us/op, ratio) and the regressions among them."""
+    old = {(r['benchmark'], r['scale']): r for r in previous.get('results', [])}
+    rows = []
+    regressions = []
+    for result in current.get('results', []):
+        before = old.get((result['benchmark'], result['scale']))
+        if before is None:
+            continue
+        ratio = result['us_per_op'] / before['us_per_op'] if before['us_per_op'] else float('inf')
+        row = (result['benchmark'], result['scale'], before['us_per_op'], result['us_per_op'], ratio)
+        rows.append(row)
+        if ratio > 1 + threshold:
+            regressions.append(row)
+    for endpoint, stats in current.get('api', {}).get('endpoints', {}).items():
+        before = previous.get('api', {}).get('endpoints', {}).get(endpoint)
+        if before and before['p99_ms']:
+            ratio = stats['p99_ms'] / before['p99_ms']
+            row = (f"api {endpoint} p99", None, before['p99_ms'], stats['p99_ms'], ratio)
+            rows.append(row)
+            if ratio > 1 + threshold:
+                regressions.append(row)
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Airport Management System benchmarks")
+    parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES),
+                        help="problem sizes, e.g. 100 1000 10000 100000 1000000")
+    parser.add_argument('--benchmarks', nargs='+', choices=sorted(BENCHMARKS), help="subset to run")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help="runs per benchmark; the fastest is kept")
+    parser.add_argument('--emergency-ratio', type=float, default=0.02)
+    parser.add_argument('--distribution', choices=('uniform', 'peaks', 'burst'), default='uniform')
+    parser.add_argument('--api', action='store_true', help="also run the in-process API load driver")
+    parser.add_argument('--api-requests', type=int, default=2000)
+    parser.add_argument('--api-concurrency', type=int, default=32)
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="earlier JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed slowdown before failing")
+    args = parser.parse_args(argv)
+
+    def show(result):
+        print(f"{result['benchmark']:>20} n={result['scale']:<8} {result['us_per_op']:>12.3f} us/op "
+              f"({result['operations']} ops in {result['seconds']:.4f}s)", flush=True)
+
+    report = {'environment': environment(args.seed)}
+    report['results'] = run_suite(args.scales, args.benchmarks, args.seed, args.repeat,
+                                  args.emergency_ratio, args.distribution, show)
+    if args.api:
+        from Benchmarks.ApiLoad import run_api_load
+        report['api'] = run_api_load(args.api_requests, args.api_concurrency, args.seed)
+        for endpoint, stats in report['api']['endpoints'].items():
+            print(f"{endpoint:>45} p50 {stats['p50_ms']:8.3f} ms  p99 {stats['p99_ms']:8.3f} ms  "
+                  f"n={stats['count']} errors={stats['errors']}")
+
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            previous = json.load(handle)
+        rows, regressions = compare(previous, report, args.threshold)
+        for name, scale, before, after, ratio in rows:
+            flag = "  REGRESSION" if ratio > 1 + args.threshold else ""
+            print(f"{name:>30} n={scale or '-':<8} {before:>12.3f} -> {after:>12.3f} ({ratio:5.2f}x){flag}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Workload.py
+Seeded synthetic flights and route graphs for benchmarks.
+"""
+
+import math
+import random
+from datetime import datetime, timedelta
+
+from AirportGraph import AirportGraph
+from Metrics import quiet_logging
+
+DESTINATIONS = ("LAX", "LHR", "SFO", "CDG", "NRT", "FRA")
+BENCH_START = datetime(2030, 1, 1)  # fixed so runs do not depend on today's date
+
+# Departure banks (hour of day, spread in hours, weight) for the 'peaks' distribution
+PEAKS = ((7.5, 1.5, 0.4), (12.5, 2.0, 0.2), (18.0, 1.5, 0.4))
+
+
+def random_flights(count, seed=0, emergency_ratio=0.02, distribution="uniform",
+                   start=BENCH_START, span=timedelta(days=1), destinations=DESTINATIONS):
+    """Return ``count`` (flight_no, destination, departure_time, emergency) tuples.
+
+    distribution is 'uniform' over ``span``, 'peaks' (morning, midday and
+    evening banks from PEAKS, wrapped into the day) or 'burst' (everything
+    within the first tenth of the span). The same seed always yields the
+    same flights.
+    """
+    rng = random.Random(seed)
+    seconds = span.total_seconds()
+    flights = []
+    for i in range(count):
+        if distribution == "uniform":
+            offset = rng.random() * seconds
+        elif distribution == "peaks":
+            hour, spread, _ = rng.choices(PEAKS, weights=[p[2] for p in PEAKS])[0]
+            offset = (rng.gauss(hour, spread) % 24) * 3600 * seconds / 86400
+        elif distribution == "burst":
+            offset = rng.random() * seconds / 10
+        else:
+            raise ValueError(f"unknown distribution {distribution!r}")
+        departure = start + timedelta(seconds=int(offset) + 60)
+        flights.append((f"BF{i}", rng.choice(destinations), departure, rng.random() < emergency_ratio))
+    return flights
+
+
+def random_graph(airports, seed=0, neighbors=4):
+    """Connected-ish random geometric AirportGraph with ``airports`` nodes N0..N{n-1}.
+
+    Airports are random points on a plane, each linked to its ``neighbors``
+    nearest airports (found through a grid of cells).
+    """
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(airports)]
+    cells = max(1, int(math.sqrt(airports / 2)))
+    grid = {}
+    for i, (x, y) in enumerate(points):
+        grid.setdefault((int(x * cells), int(y * cells)), []).append(i)
+    graph = AirportGraph()
+    with quiet_logging():
+        for i, (x, y) in enumerate(points):
+            cx, cy = int(x * cells), int(y * cells)
+            nearby = [j for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                      for j in grid.get((cx + dx, cy + dy), []) if j != i]
+            nearby.sort(key=lambda j: (points[j][0] - x) ** 2 + (points[j][1] - y) ** 2)
+            for j in nearby[:neighbors]:
+                if i < j:
+                    weight = round(math.dist(points[i], points[j]) * 1000, 3)
+                    graph.add_route(f"N{i}", f"N{j}", weight)
+    return graph
+
+
+def random_queries(graph, count, seed=0):
+    """``count`` random (start, destination) airport pairs from ``graph``."""
+    rng = random.Random(seed)
+    airports = list(graph.graph)
+    return [(rng.choice(airports), rng.choice(airports)) for _ in range(count)]
+
+
+def query_count(scale):
+    """Route queries to time at a given graph size (fewer as graphs grow)."""
+    return max(20, min(1000, int(200_000 / max(1, math.sqrt(scale) * 10))))
+
+
+def random_assignment_costs(flights, runway_count, seed=0, stands=8):
+    """Seeded AssignmentCosts for ``flights``: stand-to-runway taxi times,
+    a third of the runways limited to medium wake, 20% heavy and 20% light flights."""
+    from RunwayAssignment import AssignmentCosts
+
+    rng = random.Random(seed)
+    runway_ids = range(1, runway_count + 1)
+    taxi = {stand: {r: rng.uniform(2, 15) for r in runway_ids} for stand in range(stands)}
+    max_wake = {r: 'M' for r in runway_ids if r % 3 == 0}
+    stand_of = {}
+    wake = {}
+    for number, *_ in flights:
+        stand_of[number] = rng.randrange(stands)
+        wake[number] = rng.choices('HML', weights=(2, 6, 2))[0]
+    return AssignmentCosts(taxi, stand_of, max_wake, wake)
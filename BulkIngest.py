@@ -0,0 +1,111 @@
+"""
+BulkIngest.py
+Parsing helpers for loading many flights at once (CSV / NDJSON, HH:MM times).
+"""
+
+import csv
+import io
+import json
+import re
+from datetime import timedelta
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to a plain loop
+    np = None
+
+FIELDS = ('flight_no', 'destination', 'time_str', 'is_emergency')
+_TRUE = {'1', 'true', 'yes', 'y', 't'}
+_TIME = re.compile(r'([0-9]{1,2}):([0-9]{2})')  # H:MM or HH:MM, ASCII digits only
+
+
+def rows_from_csv(text):
+    """Yield (row_number, dict) from CSV with a flight_no,destination,time_str[,is_emergency] header."""
+    reader = csv.DictReader(io.StringIO(text))
+    for number, row in enumerate(reader, start=1):
+        yield number, row
+
+
+def rows_from_ndjson(text):
+    """Yield (row_number, dict) from newline-delimited JSON; bad lines yield an error string."""
+    for number, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, f"invalid JSON: {e}"
+            continue
+        if isinstance(row, dict):
+            yield number, row
+        else:
+            yield number, f"expected a JSON object, got {type(row).__name__}"
+
+
+def normalize_destination(value):
+    """Airport code as stored in the route graph (bulk and single adds agree)."""
+    return str(value or '').strip().upper()
+
+
+def parse_emergency(value):
+    if isinstance(value, bool):
+        return value
+    return str(value or '').strip().lower() in _TRUE
+
+
+def parse_time(time_str, now):
+    """Single-value parse_times: the next departure after now, or None."""
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return _parse_one(time_str, midnight, (now - midnight).total_seconds())
+
+
+def parse_times(time_strs, now):
+    """Parse "HH:MM" strings to the next matching departure datetime after now.
+
+    "H:MM" is accepted too, as is surrounding whitespace; anything else
+    (signs, non-ASCII digits, hour 24, minute 60) is invalid. Returns a
+    list aligned with time_strs holding a datetime, or None for an invalid
+    time. Uses NumPy to validate and convert the common zero-padded form
+    in one pass when it is installed; the result is the same either way.
+    """
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    now_seconds = (now - midnight).total_seconds()
+    if np is None or not time_strs:
+        return [_parse_one(t, midnight, now_seconds) for t in time_strs]
+
+    # NumPy drops trailing NULs, so such strings take the exact (rejecting) path
+    raw = np.array([t.strip() if isinstance(t, str) and '\x00' not in t else '' for t in time_strs], dtype=str)
+    padded = np.char.str_len(raw) == 5
+    codes = np.zeros((len(raw), 5), dtype=np.int64)
+    if padded.any():
+        codes[padded] = np.array(raw[padded], dtype='U5').view(np.uint32).reshape(-1, 5)
+    digits = codes - ord('0')
+    digit_ok = ((digits[:, [0, 1, 3, 4]] >= 0) & (digits[:, [0, 1, 3, 4]] <= 9)).all(axis=1)
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 3] * 10 + digits[:, 4]
+    valid = padded & digit_ok & (codes[:, 2] == ord(':')) & (hours < 24) & (minutes < 60)
+    seconds = (hours * 60 + minutes) * 60
+    seconds = np.where(seconds <= now_seconds, seconds + 86400, seconds)
+
+    results = []
+    for i, ok in enumerate(valid.tolist()):
+        if ok:
+            results.append(midnight + timedelta(seconds=int(seconds[i])))
+        elif padded[i]:
+            results.append(None)
+        else:
+            results.append(_parse_one(time_strs[i], midnight, now_seconds))  # e.g. "9:30"
+    return results
+
+
+def _parse_one(time_str, midnight, now_seconds):
+    match = _TIME.fullmatch(time_str.strip()) if isinstance(time_str, str) else None
+    if match is None:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour > 23 or minute > 59:
+        return None
+    departure = midnight.replace(hour=hour, minute=minute)
+    if (departure - midnight).total_seconds() <= now_seconds:
+        departure += timedelta(days=1)
+    return departure
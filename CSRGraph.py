@@ -0,0 +1,283 @@
+"""
+CSRGraph.py
+Compact airport graph using interned integer ids and CSR adjacency arrays.
+"""
+
+import csv
+import heapq
+import math
+import mmap
+import struct
+from array import array
+from collections import defaultdict
+
+from AirportGraph import k_shortest_routes
+
+_MAGIC = b"AGCSR1\0\0"
+_HEADER = struct.Struct("<8sqqq")  # magic, airports, edges, names byte length
+
+
+class CSRGraph:
+    """Read-optimized alternative to AirportGraph for large route networks.
+
+    Airport codes are interned to integer ids. Adjacency is stored in
+    compressed sparse row form: ``offsets[i]:offsets[i + 1]`` slices
+    ``targets`` and ``weights`` for airport ``i``. Parallel edges are merged
+    (shortest distance wins). Routes added after the build go into a small
+    overlay until ``compact()`` folds them into the arrays.
+
+    ``find_shortest_route``, ``shortest_path_tree`` and
+    ``find_k_shortest_routes`` keep the same contract as AirportGraph, so
+    the class can be passed to AirportManagementSystem.
+    """
+
+    def __init__(self, codes=(), offsets=None, targets=None, weights=None):
+        self.codes = list(codes)
+        self.ids = {code: i for i, code in enumerate(self.codes)}
+        self.offsets = offsets if offsets is not None else array("q", [0] * (len(self.codes) + 1))
+        self.targets = targets if targets is not None else array("q")
+        self.weights = weights if weights is not None else array("d")
+        self._overlay = defaultdict(list)  # id -> [(neighbor_id, distance), ...]
+        self._mapping = None
+
+    # ---------------- BUILDING ----------------
+    @classmethod
+    def from_edges(cls, edges):
+        """Build from an iterable of (source, destination, distance) routes."""
+        ids = {}
+        codes = []
+        best = {}
+        for source, destination, distance in edges:
+            for code in (source, destination):
+                if code not in ids:
+                    ids[code] = len(codes)
+                    codes.append(code)
+            u, v = ids[source], ids[destination]
+            if u == v:
+                continue
+            key = (u, v) if u < v else (v, u)
+            if key not in best or distance < best[key]:
+                best[key] = distance
+
+        degree = [0] * (len(codes) + 1)
+        for u, v in best:
+            degree[u + 1] += 1
+            degree[v + 1] += 1
+        for i in range(len(codes)):
+            degree[i + 1] += degree[i]
+        offsets = array("q", degree)
+        targets = array("q", [0] * offsets[-1])
+        weights = array("d", [0.0] * offsets[-1])
+        cursor = list(degree[:-1])
+        for (u, v), distance in best.items():
+            targets[cursor[u]], weights[cursor[u]] = v, distance
+            cursor[u] += 1
+            targets[cursor[v]], weights[cursor[v]] = u, distance
+            cursor[v] += 1
+        return cls(codes, offsets, targets, weights)
+
+    @classmethod
+    def from_csv(cls, routes_path, airports_path=None, default_distance=1):
+        """Bulk-import routes from CSV.
+
+        Accepts either ``source,destination,distance`` rows or the OpenFlights
+        ``routes.dat`` layout (source code in column 3, destination in 5).
+        When an OpenFlights ``airports.dat`` file is given, distances are the
+        great-circle kilometres between the airports.
+        """
+        coordinates = {}
+        if airports_path:
+            with open(airports_path, newline="", encoding="utf-8") as handle:
+                for row in csv.reader(handle):
+                    try:
+                        coordinates[row[4]] = (float(row[6]), float(row[7]))
+                    except (IndexError, ValueError):
+                        continue
+
+        def edges():
+            with open(routes_path, newline="", encoding="utf-8") as handle:
+                for row in csv.reader(handle):
+                    if len(row) == 3:
+                        try:
+                            yield row[0], row[1], float(row[2])
+                        except ValueError:
+                            continue  # header line
+                        continue
+                    if len(row) < 5:
+                        continue
+                    source, destination = row[2], row[4]
+                    if source in coordinates and destination in coordinates:
+                        yield source, destination, _haversine(coordinates[source], coordinates[destination])
+                    else:
+                        yield source, destination, default_distance
+
+        return cls.from_edges(edges())
+
+    def add_route(self, source, destination, distance=1):
+        """Add a bidirectional route to the overlay (see ``compact``)."""
+        u, v = self._intern(source), self._intern(destination)
+        self._overlay[u].append((v, distance))
+        self._overlay[v].append((u, distance))
+
+    def compact(self):
+        """Fold overlay routes into the CSR arrays."""
+        if not self._overlay:
+            return self
+        rebuilt = CSRGraph.from_edges(self.edges())
+        self.__init__(rebuilt.codes, rebuilt.offsets, rebuilt.targets, rebuilt.weights)
+        return self
+
+    def edges(self):
+        """Yield each undirected route once as (source, destination, distance)."""
+        for u in range(len(self.codes)):
+            for v, distance in self._neighbors(u):
+                if u < v:
+                    yield self.codes[u], self.codes[v], distance
+
+    # ---------------- BINARY FORMAT ----------------
+    def save(self, path):
+        self.compact()
+        names = "\n".join(self.codes).encode("utf-8")
+        padding = b"\0" * (-len(names) % 8)
+        with open(path, "wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, len(self.codes), len(self.targets), len(names)))
+            handle.write(names + padding)
+            handle.write(self.offsets.tobytes())
+            handle.write(self.targets.tobytes())
+            handle.write(self.weights.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a file written by ``save``; arrays are not copied."""
+        with open(path, "rb") as handle:
+            mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, airports, edges, names_length = _HEADER.unpack_from(mapping, 0)
+        if magic != _MAGIC:
+            mapping.close()
+            raise ValueError(f"{path} is not a CSR airport graph")
+        view = memoryview(mapping)
+        position = _HEADER.size
+        codes = bytes(view[position:position + names_length]).decode("utf-8").split("\n") if airports else []
+        position += names_length + (-names_length % 8)
+        offsets = view[position:position + 8 * (airports + 1)].cast("q")
+        position += 8 * (airports + 1)
+        targets = view[position:position + 8 * edges].cast("q")
+        position += 8 * edges
+        weights = view[position:position + 8 * edges].cast("d")
+        graph = cls(codes, offsets, targets, weights)
+        graph._mapping = mapping
+        return graph
+
+    # ---------------- QUERIES ----------------
+    def __contains__(self, airport):
+        return airport in self.ids
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def graph(self):
+        """Membership view, for callers written against AirportGraph.graph."""
+        return self.ids
+
+    def find_shortest_route(self, start, destination):
+        """Find shortest route using Dijkstra's algorithm over the CSR arrays."""
+        if start not in self.ids or destination not in self.ids:
+            return None, float('inf')
+        source, target = self.ids[start], self.ids[destination]
+        distances, previous = self._dijkstra(source, target)
+        if target not in distances:
+            return None, float('inf')
+        return self._path(previous, target), distances[target]
+
+    def shortest_path_tree(self, start):
+        """Same contract as AirportGraph.shortest_path_tree (codes, not ids)."""
+        distances, previous = self._dijkstra(self.ids[start])
+        codes = self.codes
+        return ({codes[i]: d for i, d in distances.items()},
+                {codes[i]: (codes[p] if p is not None else None) for i, p in previous.items()})
+
+    def find_k_shortest_routes(self, start, destination, k=3, excluded_airports=(), excluded_routes=()):
+        """Same contract as AirportGraph.find_k_shortest_routes (Yen's algorithm)."""
+        return k_shortest_routes(_CodeAdjacency(self), start, destination, k, excluded_airports, excluded_routes)
+
+    # ---------------- INTERNALS ----------------
+    def _intern(self, code):
+        if code not in self.ids:
+            if self._mapping is not None:
+                # mmapped arrays are read-only; copy them before growing
+                self.offsets = array("q", self.offsets)
+                self.targets = array("q", self.targets)
+                self.weights = array("d", self.weights)
+                self._mapping = None
+            self.ids[code] = len(self.codes)
+            self.codes.append(code)
+            self.offsets.append(self.offsets[-1])
+        return self.ids[code]
+
+    def _neighbors(self, u):
+        targets, weights = self.targets, self.weights
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            yield targets[i], weights[i]
+        if u in self._overlay:
+            yield from self._overlay[u]
+
+    def _dijkstra(self, source, target=None):
+        offsets, targets, weights, overlay = self.offsets, self.targets, self.weights, self._overlay
+        inf = math.inf
+        best = [inf] * len(self.codes)
+        best[source] = 0
+        distances = {}
+        previous = {source: None}
+        heap = [(0, source)]
+        while heap:
+            current_distance, u = heapq.heappop(heap)
+            if u in distances:
+                continue
+            distances[u] = current_distance
+            if u == target:
+                break
+            start, end = offsets[u], offsets[u + 1]
+            edges = zip(targets[start:end], weights[start:end])
+            if u in overlay:
+                edges = list(edges) + overlay[u]
+            for v, weight in edges:
+                distance = current_distance + weight
+                if distance < best[v]:
+                    best[v] = distance
+                    previous[v] = u
+                    heapq.heappush(heap, (distance, v))
+        return distances, previous
+
+    def _path(self, previous, target):
+        path = []
+        node = target
+        while node is not None:
+            path.append(self.codes[node])
+            node = previous[node]
+        path.reverse()
+        return path
+
+
+class _CodeAdjacency:
+    """``adjacency[code] -> [(neighbor_code, distance)]`` over a CSRGraph, for shared algorithms."""
+
+    __slots__ = ('csr',)
+
+    def __init__(self, csr):
+        self.csr = csr
+
+    def __contains__(self, code):
+        return code in self.csr.ids
+
+    def __getitem__(self, code):
+        codes = self.csr.codes
+        return [(codes[v], distance) for v, distance in self.csr._neighbors(self.csr.ids[code])]
+
+
+def _haversine(a, b):
+    lat1, lon1 = map(math.radians, a)
+    lat2, lon2 = map(math.radians, b)
+    h = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * 6371.0 * math.asin(math.sqrt(h))
@@ -0,0 +1,100 @@
+"""
+ChangeFeed.py
+Sequenced change events with a replay buffer, encoded once for all subscribers.
+"""
+
+import asyncio
+import json
+from collections import deque
+
+
+def encode_event(sequence, kind, data):
+    """Server-Sent Events frame for one event."""
+    payload = json.dumps(data, separators=(',', ':'))
+    return f"id: {sequence}\nevent: {kind}\ndata: {payload}\n\n".encode()
+
+
+class ChangeFeed:
+    """Incremental state-change events for live dashboards.
+
+    ``publish`` numbers each event, encodes it as an SSE frame once and keeps
+    the last ``capacity`` frames. Subscribers share the encoded bytes: a
+    waiting subscriber wakes on one shared future and writes every frame it
+    missed in a single chunk, so a slow client costs a join, not a
+    re-serialization. A client resumes from its last sequence number; if
+    that has fallen out of the buffer, ``since`` returns None and the
+    client must reload full state.
+    """
+
+    def __init__(self, capacity=10_000):
+        self.sequence = 0
+        self._frames = deque(maxlen=capacity)  # (sequence, encoded frame)
+        self._waiter = None
+
+    def __len__(self):
+        return len(self._frames)
+
+    def publish(self, kind, data):
+        self.sequence += 1
+        self._frames.append((self.sequence, encode_event(self.sequence, kind, data)))
+        if self._waiter is not None:
+            if not self._waiter.done():
+                self._waiter.set_result(None)
+            self._waiter = None
+        return self.sequence
+
+    def since(self, sequence):
+        """Frames after ``sequence`` in order, or None if some were dropped."""
+        if sequence >= self.sequence:
+            return []
+        if not self._frames or self._frames[0][0] > sequence + 1:
+            return None
+        frames = []
+        for number, frame in reversed(self._frames):
+            if number <= sequence:
+                break
+            frames.append(frame)
+        frames.reverse()
+        return frames
+
+    async def wait(self, sequence, timeout=None):
+        """Wait until an event after ``sequence`` exists; False on timeout."""
+        while self.sequence <= sequence:
+            if self._waiter is None:
+                self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._waiter), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    async def stream(self, sequence, snapshot=None, heartbeat=15.0):
+        """Yield SSE chunks from ``sequence`` on, forever.
+
+        ``snapshot`` is a callable returning (kind, data) describing full
+        state; it is sent first when there is nothing to resume from, or
+        when the client has fallen too far behind.
+        """
+        frames = None if sequence is None else self.since(sequence)
+        if frames is None:
+            sequence = self.sequence
+            if snapshot is not None:
+                kind, data = snapshot()
+                yield encode_event(sequence, kind, data)
+        else:
+            sequence += len(frames)
+            if frames:
+                yield b"".join(frames)
+        while True:
+            if not await self.wait(sequence, heartbeat):
+                yield b": keepalive\n\n"
+                continue
+            frames = self.since(sequence)
+            if frames is None:
+                sequence = self.sequence
+                if snapshot is not None:
+                    kind, data = snapshot()
+                    yield encode_event(sequence, kind, data)
+                continue
+            sequence += len(frames)
+            yield b"".join(frames)
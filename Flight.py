@@ -9,6 +9,9 @@ from datetime import datetime
 class Flight:
     """Represents a flight with priority and departure time."""
     
+    __slots__ = ('flight_number', 'status', 'destination', 'departure_time', 'is_emergency',
+                 'assigned_runway_no', 'assigned_runway', 'priority')
+    
     def __init__(self, flight_number, destination, departure_time, is_emergency=False,status='Waiting for assigning'):
         self.flight_number = flight_number
         self.status = status
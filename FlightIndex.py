@@ -0,0 +1,97 @@
+"""
+FlightIndex.py
+Secondary indexes over flights: by number, departure time and destination.
+"""
+
+from bisect import bisect_left, insort
+
+
+class FlightIndex:
+    """Lookup structures kept in step with AirportManagementSystem.
+
+    - hash index: flight_number -> Flight (active) or history row (departed)
+    - sorted index of (departure_time, flight_number) for range queries
+    - per-destination sorted indexes of the same tuples
+
+    The sorted indexes cover active flights only (waiting, assigned,
+    cancelled); departed flights are served by the history listing.
+    """
+
+    def __init__(self):
+        self._by_number = {}
+        self._by_departure = []
+        self._by_destination = {}
+
+    def __len__(self):
+        return len(self._by_number)
+
+    def __contains__(self, flight_number):
+        return flight_number in self._by_number
+
+    def get(self, flight_number):
+        """Return the active Flight, a departed flight's history row, or None."""
+        return self._by_number.get(flight_number)
+
+    def add(self, flight):
+        previous = self._by_number.get(flight.flight_number)
+        if previous is not None and not isinstance(previous, int):
+            self._unlink(previous)
+        self._by_number[flight.flight_number] = flight
+        key = (flight.departure_time, flight.flight_number)
+        insort(self._by_departure, key)
+        insort(self._by_destination.setdefault(flight.destination, []), key)
+
+    def add_many(self, flights):
+        """Index a batch of new flights with one merge per sorted index."""
+        flights = list(flights)
+        for flight in flights:
+            previous = self._by_number.get(flight.flight_number)
+            if previous is not None and not isinstance(previous, int):
+                self._unlink(previous)
+            self._by_number[flight.flight_number] = flight
+        keys = [(flight.departure_time, flight.flight_number) for flight in flights]
+        self._by_departure.extend(keys)
+        self._by_departure.sort()  # Timsort merges the two sorted runs
+        touched = set()
+        for flight, key in zip(flights, keys):
+            self._by_destination.setdefault(flight.destination, []).append(key)
+            touched.add(flight.destination)
+        for destination in touched:
+            self._by_destination[destination].sort()
+
+    def depart(self, flight, history_row):
+        """Drop a departed flight from the range indexes, keeping its row."""
+        if self._by_number.get(flight.flight_number) is flight:
+            self._unlink(flight)
+            self._by_number[flight.flight_number] = history_row
+
+    def add_departed(self, flight_number, history_row):
+        """Record a departed flight known only by its history row."""
+        previous = self._by_number.get(flight_number)
+        if previous is None or isinstance(previous, int):
+            self._by_number[flight_number] = history_row
+
+    def departing_between(self, start=None, end=None, destination=None):
+        """Active flights with start <= departure_time < end, in time order."""
+        keys = self._by_departure if destination is None else self._by_destination.get(destination, [])
+        low = bisect_left(keys, (start,)) if start is not None else 0
+        high = bisect_left(keys, (end,)) if end is not None else len(keys)
+        return [self._by_number[number] for _, number in keys[low:high]]
+
+    def destination(self, destination):
+        return self.departing_between(destination=destination)
+
+    def _unlink(self, flight):
+        key = (flight.departure_time, flight.flight_number)
+        _remove_sorted(self._by_departure, key)
+        keys = self._by_destination.get(flight.destination)
+        if keys is not None:
+            _remove_sorted(keys, key)
+            if not keys:
+                del self._by_destination[flight.destination]
+
+
+def _remove_sorted(keys, key):
+    position = bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
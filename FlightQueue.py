@@ -0,0 +1,162 @@
+"""
+FlightQueue.py
+Indexed priority queue of flights keyed by flight number.
+"""
+
+import heapq
+from datetime import datetime
+
+
+def sort_key(flight):
+    """Total order matching Flight.__lt__, with flight number as tie-breaker."""
+    return flight.priority, flight.departure_time, flight.flight_number
+
+
+def encode_cursor(key):
+    """Opaque text form of a sort_key, for pagination cursors."""
+    if key is None:
+        return None
+    priority, departure_time, flight_number = key
+    return f'{priority}|{departure_time.isoformat()}|{flight_number}'
+
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor; None for an empty cursor, ValueError if malformed."""
+    if not cursor:
+        return None
+    parts = cursor.split('|', 2)
+    if len(parts) != 3:
+        raise ValueError(f'malformed cursor {cursor!r}')
+    priority, departure, flight_number = parts
+    departure_time = datetime.fromisoformat(departure)
+    if departure_time.tzinfo is not None:
+        raise ValueError(f'malformed cursor {cursor!r}')  # departure times are naive
+    return int(priority), departure_time, flight_number
+
+
+class FlightQueue:
+    """Binary min-heap of flights with a position index for O(log n) updates.
+
+    Flights are ordered with ``Flight.__lt__`` (priority, departure_time).
+    The index maps ``flight_number`` to the flight's slot in the heap so that
+    cancellation and reprioritization do not need a linear scan.
+    """
+
+    def __init__(self, flights=None):
+        self._heap = []
+        self._index = {}  # flight_number -> position in self._heap
+        for flight in flights or []:
+            self.push(flight)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __contains__(self, flight_number):
+        return flight_number in self._index
+
+    def __iter__(self):
+        """Iterate flights in priority order without modifying the queue."""
+        return iter(sorted(self._heap))
+
+    def flights(self):
+        """All queued flights in heap (not priority) order; O(n), no sorting."""
+        return list(self._heap)
+
+    def smallest(self, count, after=None, predicate=None):
+        """Return up to ``count`` flights in priority order without popping.
+
+        ``after`` is a ``sort_key`` value; only flights ordered strictly after
+        it are returned, which makes it usable as a pagination cursor.
+        Costs O(n log count) rather than a full sort.
+        """
+        flights = self._heap
+        if after is not None:
+            flights = (f for f in flights if sort_key(f) > after)
+        if predicate is not None:
+            flights = (f for f in flights if predicate(f))
+        return heapq.nsmallest(count, flights, key=sort_key)
+
+    # ---------------- QUEUE OPERATIONS ----------------
+    def push(self, flight):
+        """Add a flight; replaces any queued flight with the same number."""
+        if flight.flight_number in self._index:
+            self.remove(flight.flight_number)
+        self._heap.append(flight)
+        self._index[flight.flight_number] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self):
+        """Return the highest-priority flight without removing it."""
+        return self._heap[0] if self._heap else None
+
+    def pop(self):
+        """Remove and return the highest-priority flight."""
+        if not self._heap:
+            return None
+        return self._remove_at(0)
+
+    def get(self, flight_number):
+        """Return the queued flight with this number, or None."""
+        position = self._index.get(flight_number)
+        return self._heap[position] if position is not None else None
+
+    def remove(self, flight_number):
+        """Remove a flight by number and return it, or None if not queued."""
+        position = self._index.get(flight_number)
+        if position is None:
+            return None
+        return self._remove_at(position)
+
+    def update(self, flight_number):
+        """Restore heap order after a queued flight's priority or time changed."""
+        position = self._index.get(flight_number)
+        if position is None:
+            return False
+        self._sift_down(self._sift_up(position))
+        return True
+
+    # ---------------- HEAP INTERNALS ----------------
+    def _remove_at(self, position):
+        last = len(self._heap) - 1
+        if position != last:
+            self._swap(position, last)
+        flight = self._heap.pop()
+        del self._index[flight.flight_number]
+        if position < len(self._heap):
+            self._sift_down(self._sift_up(position))
+        return flight
+
+    def _swap(self, i, j):
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._index[heap[i].flight_number] = i
+        self._index[heap[j].flight_number] = j
+
+    def _sift_up(self, position):
+        heap = self._heap
+        while position > 0:
+            parent = (position - 1) // 2
+            if not heap[position] < heap[parent]:
+                break
+            self._swap(position, parent)
+            position = parent
+        return position
+
+    def _sift_down(self, position):
+        heap = self._heap
+        size = len(heap)
+        while True:
+            smallest = position
+            left = 2 * position + 1
+            right = left + 1
+            if left < size and heap[left] < heap[smallest]:
+                smallest = left
+            if right < size and heap[right] < heap[smallest]:
+                smallest = right
+            if smallest == position:
+                return position
+            self._swap(position, smallest)
+            position = smallest
@@ -0,0 +1,202 @@
+"""
+HistoryStore.py
+Columnar, array-backed record of every flight the system has seen.
+"""
+
+import zlib
+from array import array
+from collections import namedtuple
+from datetime import datetime
+
+FlightRecord = namedtuple(
+    "FlightRecord",
+    ["flight_number", "destination", "departure_time", "status", "is_emergency", "assigned_runway_no"])
+
+STATUSES = ['Waiting for assigning', 'Runway Assigned', 'Cancelled', 'Departed']
+_NO_RUNWAY = 0
+
+
+class _Chunk:
+    """Frozen block of rows: each column packed to bytes and zlib-compressed."""
+
+    def __init__(self, numbers, destinations, departures, statuses, emergencies, runways):
+        self.size = len(numbers)
+        self.numbers = zlib.compress("\n".join(numbers).encode("utf-8"))
+        self.columns = zlib.compress(b"".join(
+            column.tobytes() for column in (departures, destinations, runways, statuses, emergencies)))
+
+    def rows(self):
+        numbers = zlib.decompress(self.numbers).decode("utf-8").split("\n")
+        raw = zlib.decompress(self.columns)
+        departures = array("q")
+        destinations = array("I")
+        runways = array("H")
+        statuses = array("B")
+        emergencies = array("B")
+        offset = 0
+        for column in (departures, destinations, runways, statuses, emergencies):
+            width = column.itemsize * self.size
+            column.frombytes(raw[offset:offset + width])
+            offset += width
+        return zip(numbers, destinations, departures, statuses, emergencies, runways)
+
+
+class HistoryStore:
+    """Append-only flight history with interned, enum-coded columns.
+
+    Flights that can still change (waiting, assigned, cancelled) stay live:
+    their row is read from the Flight object itself. ``retire`` copies the
+    final state into the columns and drops the object. Older rows are frozen
+    into compressed chunks, so memory per departed flight is a few bytes.
+    """
+
+    def __init__(self, chunk_size=4096):
+        self.chunk_size = chunk_size
+        self._chunks = []
+        self._chunked_rows = 0
+        self._destinations = []  # interned destination strings
+        self._destination_ids = {}
+        self._status_ids = {status: i for i, status in enumerate(STATUSES)}
+        self._statuses = list(STATUSES)
+        # hot columns (rows not yet frozen into a chunk)
+        self._numbers = []
+        self._destination_col = array("I")
+        self._departures = array("q")
+        self._status_col = array("B")
+        self._emergencies = array("B")
+        self._runways = array("H")
+        self._live = {}  # row -> Flight
+        self._live_rows = {}  # id(flight) -> row
+        self._late = {}  # chunked row -> (status code, runway) retired after freezing
+
+    def __len__(self):
+        return self._chunked_rows + len(self._numbers)
+
+    def __iter__(self):
+        return self.records()
+
+    # ---------------- WRITES ----------------
+    def append(self, flight):
+        row = len(self)
+        self._numbers.append(flight.flight_number)
+        self._destination_col.append(self._intern(flight.destination))
+        self._departures.append(int(flight.departure_time.timestamp()))
+        self._status_col.append(self._status_code(flight.status))
+        self._emergencies.append(1 if flight.is_emergency else 0)
+        self._runways.append(flight.assigned_runway_no or _NO_RUNWAY)
+        self._live[row] = flight
+        self._live_rows[id(flight)] = row
+        return row
+
+    def append_record(self, record):
+        """Append an already-final row (used when restoring a snapshot)."""
+        row = len(self)
+        self._numbers.append(record.flight_number)
+        self._destination_col.append(self._intern(record.destination))
+        self._departures.append(int(record.departure_time.timestamp()))
+        self._status_col.append(self._status_code(record.status))
+        self._emergencies.append(1 if record.is_emergency else 0)
+        self._runways.append(record.assigned_runway_no or _NO_RUNWAY)
+        self._spill()
+        return row
+
+    def retire(self, flight):
+        """Freeze a flight's final state into the columns and release it."""
+        row = self._live_rows.pop(id(flight), None)
+        if row is None:
+            return
+        del self._live[row]
+        status, runway = self._status_code(flight.status), flight.assigned_runway_no or _NO_RUNWAY
+        local = row - self._chunked_rows
+        if local >= 0:
+            self._status_col[local] = status
+            self._runways[local] = runway
+        else:
+            self._late[row] = (status, runway)
+        self._spill()
+
+    # ---------------- READS ----------------
+    def records(self, start=0):
+        """Yield Flight objects (live rows) or FlightRecords from ``start``."""
+        for _, record in self.rows(start):
+            yield record
+
+    def row_of(self, flight):
+        """History row of a live flight, or None."""
+        return self._live_rows.get(id(flight))
+
+    def get(self, row):
+        """Random access to one row (decompresses its chunk if frozen)."""
+        for _, record in self.rows(row):
+            return record
+        raise IndexError(row)
+
+    def rows(self, start=0):
+        """Yield (row, record) pairs from row ``start`` onwards."""
+        row = 0
+        for chunk in self._chunks:
+            if row + chunk.size <= start:
+                row += chunk.size
+                continue
+            for number, destination, departure, status, emergency, runway in chunk.rows():
+                if row >= start:
+                    if row in self._live:
+                        yield row, self._live[row]
+                    else:
+                        if row in self._late:
+                            status, runway = self._late[row]
+                        yield row, self._record(number, destination, departure, status, emergency, runway)
+                row += 1
+        for local in range(max(start - self._chunked_rows, 0), len(self._numbers)):
+            row = self._chunked_rows + local
+            if row in self._live:
+                yield row, self._live[row]
+            else:
+                yield row, self._record(self._numbers[local], self._destination_col[local],
+                                        self._departures[local], self._status_col[local],
+                                        self._emergencies[local], self._runways[local])
+
+    def memory_bytes(self):
+        """Approximate bytes held by the columnar storage."""
+        hot = sum(column.itemsize * len(column) for column in (
+            self._destination_col, self._departures, self._status_col, self._emergencies, self._runways))
+        hot += sum(len(number) + 49 for number in self._numbers)
+        cold = sum(len(chunk.numbers) + len(chunk.columns) for chunk in self._chunks)
+        cold += 100 * len(self._late)
+        return hot + cold
+
+    # ---------------- INTERNALS ----------------
+    def _record(self, number, destination, departure, status, emergency, runway):
+        return FlightRecord(number, self._destinations[destination], datetime.fromtimestamp(departure),
+                            self._statuses[status], bool(emergency), runway or None)
+
+    def _intern(self, destination):
+        code = self._destination_ids.get(destination)
+        if code is None:
+            code = self._destination_ids[destination] = len(self._destinations)
+            self._destinations.append(destination)
+        return code
+
+    def _status_code(self, status):
+        code = self._status_ids.get(status)
+        if code is None:
+            code = self._status_ids[status] = len(self._statuses)
+            self._statuses.append(status)
+        return code
+
+    def _spill(self):
+        """Freeze the oldest hot rows into a compressed chunk.
+
+        Rows that are still live keep reading from their Flight object, and
+        the few that retire after freezing are kept in a small override map.
+        """
+        size = self.chunk_size
+        while len(self._numbers) >= 2 * size:
+            self._chunks.append(_Chunk(self._numbers[:size], self._destination_col[:size],
+                                       self._departures[:size], self._status_col[:size],
+                                       self._emergencies[:size], self._runways[:size]))
+            del self._numbers[:size]
+            for column in (self._destination_col, self._departures, self._status_col,
+                           self._emergencies, self._runways):
+                del column[:size]
+            self._chunked_rows += size
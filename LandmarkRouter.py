@@ -0,0 +1,144 @@
+"""
+LandmarkRouter.py
+A* with landmarks (ALT) on top of AirportGraph.
+"""
+
+import heapq
+import random
+
+from AirportGraph import settled_histogram
+
+_SETTLED_ALT = settled_histogram('alt')
+_SETTLED_POINT = settled_histogram('point')
+
+
+class LandmarkRouter:
+    """Goal-directed point-to-point routing using precomputed landmark distances.
+
+    ``build()`` picks landmarks by farthest-point selection and stores the
+    exact distance from each landmark to every airport. By the triangle
+    inequality, ``max |d(L, target) - d(L, v)|`` is an admissible and
+    consistent lower bound on ``d(v, target)``, so A* settles far fewer
+    airports than plain Dijkstra. Routes are bidirectional, so one distance
+    table per landmark is enough.
+
+    ``route_added`` repairs the tables incrementally: a new edge can only
+    shorten distances, so only the region it improves is re-relaxed.
+    """
+
+    def __init__(self, graph, landmark_count=8, seed=0):
+        self.graph = graph
+        self.landmark_count = landmark_count
+        self.seed = seed
+        self.landmarks = []
+        self.tables = []  # one {airport: distance} dict per landmark
+        self.last_settled = 0
+
+    def build(self):
+        """Select landmarks and compute their distance tables."""
+        airports = list(self.graph.graph)
+        self.landmarks, self.tables = [], []
+        if not airports:
+            return self
+        rng = random.Random(self.seed)
+        candidate = rng.choice(airports)
+        nearest = {}  # airport -> distance to the closest chosen landmark
+        for _ in range(min(self.landmark_count, len(airports))):
+            table, _ = self.graph.shortest_path_tree(candidate)
+            self.landmarks.append(candidate)
+            self.tables.append(table)
+            for airport, distance in table.items():
+                if distance < nearest.get(airport, float('inf')):
+                    nearest[airport] = distance
+            candidate = max(nearest, key=nearest.get)
+            if nearest[candidate] == 0:
+                break
+        return self
+
+    def route_added(self, source, destination, distance):
+        """Keep landmark tables exact after ``graph.add_route``."""
+        for table in self.tables:
+            self._relax_from(table, source, destination, distance)
+            self._relax_from(table, destination, source, distance)
+
+    # ---------------- QUERIES ----------------
+    def find_shortest_route(self, start, destination):
+        """Same contract as AirportGraph.find_shortest_route."""
+        if start not in self.graph or destination not in self.graph:
+            return None, float('inf')
+        if not self.tables:
+            self.build()
+        return self._search(start, destination, self._heuristic_to(destination), _SETTLED_ALT)
+
+    def dijkstra_route(self, start, destination):
+        """Plain Dijkstra through the same search loop (for comparison)."""
+        if start not in self.graph or destination not in self.graph:
+            return None, float('inf')
+        return self._search(start, destination, lambda airport: 0, _SETTLED_POINT)
+
+    # ---------------- INTERNALS ----------------
+    def _heuristic_to(self, destination):
+        bounds = [(table, table[destination]) for table in self.tables if destination in table]
+
+        def heuristic(airport):
+            best = 0
+            for table, to_destination in bounds:
+                from_landmark = table.get(airport)
+                if from_landmark is not None:
+                    gap = to_destination - from_landmark
+                    if gap < 0:
+                        gap = -gap
+                    if gap > best:
+                        best = gap
+            return best
+        return heuristic
+
+    def _search(self, start, destination, heuristic, histogram):
+        adjacency = self.graph.graph
+        distances = {start: 0}
+        previous = {start: None}
+        settled = set()
+        heap = [(heuristic(start), 0, start)]
+        while heap:
+            _, current_distance, airport = heapq.heappop(heap)
+            if airport in settled:
+                continue
+            settled.add(airport)
+            if airport == destination:
+                self.last_settled = len(settled)
+                histogram.observe(self.last_settled)
+                path = []
+                while airport is not None:
+                    path.append(airport)
+                    airport = previous[airport]
+                path.reverse()
+                return path, current_distance
+            for neighbor, weight in adjacency[airport]:
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = distance
+                    previous[neighbor] = airport
+                    heapq.heappush(heap, (distance + heuristic(neighbor), distance, neighbor))
+        self.last_settled = len(settled)
+        histogram.observe(self.last_settled)
+        return None, float('inf')
+
+    def _relax_from(self, table, source, destination, distance):
+        if source not in table:
+            return
+        candidate = table[source] + distance
+        if candidate >= table.get(destination, float('inf')):
+            return
+        table[destination] = candidate
+        heap = [(candidate, destination)]
+        adjacency = self.graph.graph
+        while heap:
+            current_distance, airport = heapq.heappop(heap)
+            if current_distance > table[airport]:
+                continue
+            for neighbor, weight in adjacency[airport]:
+                improved = current_distance + weight
+                if improved < table.get(neighbor, float('inf')):
+                    table[neighbor] = improved
+                    heapq.heappush(heap, (improved, neighbor))
+
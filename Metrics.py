@@ -0,0 +1,241 @@
+"""
+Metrics.py
+Low-overhead counters, gauges and histograms with Prometheus text output, plus logging setup.
+"""
+
+import contextlib
+import functools
+import json
+import logging
+import sys
+import time
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000, 10000, 100000)
+
+
+class Counter:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Gauge:
+    """Value read from a callback at scrape time, so it costs nothing between scrapes."""
+
+    __slots__ = ('callback',)
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    @property
+    def value(self):
+        return self.callback()
+
+
+class Histogram:
+    """Fixed-bucket histogram; observe() is one bisect and three additions."""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self):
+        return _Timer(self)
+
+
+class _Timer:
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class Registry:
+    """Named metric families, each holding one metric per label set."""
+
+    def __init__(self):
+        self._families = {}  # name -> (kind, help, {labels: metric})
+
+    def counter(self, name, help='', **labels):
+        return self._get(name, 'counter', help, labels, Counter)
+
+    def histogram(self, name, help='', buckets=LATENCY_BUCKETS, **labels):
+        return self._get(name, 'histogram', help, labels, lambda: Histogram(buckets))
+
+    def gauge(self, name, help, callback, **labels):
+        """Register (or replace) a gauge computed by ``callback`` at scrape time."""
+        family = self._family(name, 'gauge', help)
+        family[_label_key(labels)] = Gauge(callback)
+        return family[_label_key(labels)]
+
+    def _get(self, name, kind, help, labels, factory):
+        family = self._family(name, kind, help)
+        key = _label_key(labels)
+        metric = family.get(key)
+        if metric is None:
+            metric = family[key] = factory()
+        return metric
+
+    def _family(self, name, kind, help):
+        entry = self._families.get(name)
+        if entry is None:
+            entry = self._families[name] = (kind, help, {})
+        elif entry[0] != kind:
+            raise ValueError(f"metric {name} is a {entry[0]}, not a {kind}")
+        return entry[2]
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for name, (kind, help, family) in sorted(self._families.items()):
+            if help:
+                lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, metric in family.items():
+                if kind == 'histogram':
+                    cumulative = 0
+                    for bound, count in zip(metric.buckets + ('+Inf',), metric.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', str(bound)),))} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {metric.sum}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {metric.count}")
+                else:
+                    try:
+                        value = metric.value
+                    except Exception:
+                        continue  # a gauge whose source is gone is skipped
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def timed(operation, registry=REGISTRY):
+    """Decorator recording call latency in airport_operation_seconds{operation=...}."""
+    histogram = registry.histogram('airport_operation_seconds',
+                                   'Latency of AirportManagementSystem operations', operation=operation)
+
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def register_system_gauges(system, registry=REGISTRY):
+    """Queue depth, runway, graph and history gauges for one AirportManagementSystem."""
+    registry.gauge('airport_incoming_flights', 'Flights added but not yet scheduled',
+                   lambda: len(system.flight_queue))
+    registry.gauge('airport_waiting_flights', 'Scheduled flights waiting for a runway',
+                   lambda: len(system.scheduled_flights))
+    registry.gauge('airport_cancelled_flights', 'Flights on the cancellation stack',
+                   lambda: len(system.canceled_flights))
+    registry.gauge('airport_runways', 'Runways in the pool', lambda: len(system.runways))
+    registry.gauge('airport_free_runways', 'Runways currently free', lambda: system.runways.free_count)
+    registry.gauge('airport_graph_airports', 'Airports in the route graph',
+                   lambda: len(system.airport_graph.graph))
+    registry.gauge('airport_graph_routes', 'Routes in the route graph',
+                   lambda: sum(len(n) for n in system.airport_graph.graph.values()) // 2)
+    registry.gauge('airport_history_flights', 'Flights recorded in history', lambda: len(system.history))
+
+
+def percentile(values, q):
+    """Linear-interpolated percentile of an already sorted list (0.0 when empty)."""
+    if not values:
+        return 0.0
+    rank = (len(values) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# ---------------- LOGGING ----------------
+# Library modules log to the "airport" logger; nothing is emitted (and no
+# message is formatted) until an application calls configure_logging.
+logging.getLogger('airport').addHandler(logging.NullHandler())
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, event, message and extra fields."""
+
+    _STANDARD = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in self._STANDARD:
+                entry[key] = value
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level=logging.INFO, structured=False, stream=None):
+    """Show airport log messages: plain text (CLI) or JSON lines (services)."""
+    logger = logging.getLogger('airport')
+    for handler in list(logger.handlers):
+        if not isinstance(handler, logging.NullHandler):
+            logger.removeHandler(handler)
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if structured else logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+@contextlib.contextmanager
+def quiet_logging(level=logging.WARNING):
+    """Raise the airport logger's threshold for a bulk replay or simulation."""
+    logger = logging.getLogger('airport')
+    previous = logger.level
+    logger.setLevel(max(level, logger.getEffectiveLevel()))
+    try:
+        yield
+    finally:
+        logger.setLevel(previous)
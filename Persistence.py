@@ -0,0 +1,259 @@
+"""
+Persistence.py
+Write-ahead log plus periodic snapshots for AirportManagementSystem.
+"""
+
+import os
+import pickle
+import struct
+import time
+import zlib
+from datetime import datetime
+
+from AirportManagementSystem import AirportManagementSystem
+from Flight import Flight
+from Metrics import quiet_logging
+
+SNAPSHOT_FILE = "snapshot.bin"
+LOG_FILE = "wal.log"
+_RECORD = struct.Struct("<I")  # length prefix of one pickled log record
+_SNAPSHOT_MAGIC = b"AMSSNAP1"
+
+
+class Journal:
+    """Append-only log of state changes with batched fsync.
+
+    ``AirportManagementSystem._log`` calls ``append`` for every state change
+    (flight added, scheduled, assigned, departed, cancelled, restored,
+    escalated, route added). Records are buffered and made durable by
+    ``sync()``; the API's command processor calls it once per batch, so one
+    fsync covers many writes. After ``checkpoint_every`` records the next
+    ``sync()`` writes a snapshot and truncates the log, which bounds
+    recovery time regardless of uptime.
+    """
+
+    def __init__(self, system, directory, checkpoint_every=50_000, sync_interval=0.05):
+        self.system = system
+        self.directory = directory
+        self.checkpoint_every = checkpoint_every
+        self.sync_interval = sync_interval
+        self.sequence = 0
+        self._since_checkpoint = 0
+        self._buffer = []
+        self._last_sync = time.monotonic()
+        self._file = open(os.path.join(directory, LOG_FILE), "ab")
+
+    def append(self, op, args):
+        self.sequence += 1
+        payload = pickle.dumps((self.sequence, op, args), protocol=pickle.HIGHEST_PROTOCOL)
+        self._buffer.append(_RECORD.pack(len(payload)) + payload)
+        self._since_checkpoint += 1
+
+    def sync(self, force=True):
+        """Write buffered records and fsync (skipped inside sync_interval unless forced)."""
+        if not self._buffer:
+            return
+        if not force and time.monotonic() - self._last_sync < self.sync_interval:
+            return
+        self._file.write(b"".join(self._buffer))
+        self._buffer.clear()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+        if self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """Write a snapshot covering everything logged so far, then truncate the log."""
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer.clear()
+            self._file.flush()
+        write_snapshot(self.system, self.directory, self.sequence)
+        self._file.close()
+        self._file = open(os.path.join(self.directory, LOG_FILE), "wb")
+        os.fsync(self._file.fileno())
+        self._since_checkpoint = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        self.sync()
+        self._file.close()
+
+
+# ---------------- SNAPSHOTS ----------------
+def snapshot_state(system):
+    """Capture the system as plain tuples (no object graph)."""
+    routes = list(system.airport_graph.edges())
+
+    incoming = {f.flight_number for f in system.flight_queue}
+    flights = []
+    history = []
+    for _, record in system.history.rows():
+        if isinstance(record, Flight):
+            if record.flight_number in system.scheduled_flights:
+                location = 'scheduled'
+            elif record.flight_number in incoming:
+                location = 'incoming'
+            elif system.runways.runway_for(record.flight_number) is not None:
+                location = 'runway'
+            else:
+                location = 'other'  # cancelled (order kept below)
+            flights.append((record.flight_number, record.destination, record.departure_time.timestamp(),
+                            record.is_emergency, record.priority, record.status,
+                            record.assigned_runway_no, location))
+            history.append(None)
+        else:
+            history.append((record.flight_number, record.destination, record.departure_time.timestamp(),
+                            record.status, record.is_emergency, record.assigned_runway_no))
+    return {
+        'runway_count': len(system.runways),
+        'routes': routes,
+        'flights': flights,
+        'history': history,
+        'cancelled': [f.flight_number for f in system.canceled_flights],
+    }
+
+
+def restore_state(state, **system_kwargs):
+    """Rebuild an AirportManagementSystem from ``snapshot_state`` output."""
+    from HistoryStore import FlightRecord
+
+    system_kwargs = dict(system_kwargs, runway_count=state['runway_count'], sample_routes=False)
+    system = AirportManagementSystem(**system_kwargs)
+    with quiet_logging():
+        for source, destination, distance in state['routes']:
+            system.add_route(source, destination, distance)
+
+    live = {}
+    placements = []
+    for number, destination, departure, emergency, priority, status, runway_no, location in state['flights']:
+        flight = Flight(number, destination, datetime.fromtimestamp(departure), emergency, status)
+        flight.priority = priority
+        flight.assigned_runway_no = runway_no
+        live[number] = flight
+        placements.append((flight, location))
+
+    flights_iter = iter(state['flights'])
+    for row in state['history']:
+        if row is None:
+            flight = live[next(flights_iter)[0]]
+            system.history.append(flight)
+            system.flight_index.add(flight)
+        else:
+            number, destination, departure, status, emergency, runway_no = row
+            record = FlightRecord(number, destination, datetime.fromtimestamp(departure), status,
+                                  emergency, runway_no)
+            system.flight_index.add_departed(number, system.history.append_record(record))
+
+    for flight, location in placements:
+        if location == 'scheduled':
+            system.scheduled_flights.push(flight)
+        elif location == 'incoming':
+            system.flight_queue.append(flight)
+        elif location == 'runway':
+            flight.assigned_runway = system.runways.acquire(flight, flight.assigned_runway_no)
+    system.flight_queue.sort()
+    system.canceled_flights = [live[number] for number in state['cancelled']]
+    return system
+
+
+def write_snapshot(system, directory, sequence):
+    payload = zlib.compress(pickle.dumps(snapshot_state(system), protocol=pickle.HIGHEST_PROTOCOL))
+    path = os.path.join(directory, SNAPSHOT_FILE)
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(_SNAPSHOT_MAGIC + struct.pack("<Q", sequence) + payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+def read_snapshot(directory):
+    """Return (sequence, state) or (0, None) if there is no snapshot."""
+    path = os.path.join(directory, SNAPSHOT_FILE)
+    if not os.path.exists(path):
+        return 0, None
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if data[:8] != _SNAPSHOT_MAGIC:
+        raise ValueError(f"{path} is not an airport snapshot")
+    sequence, = struct.unpack_from("<Q", data, 8)
+    return sequence, pickle.loads(zlib.decompress(data[16:]))
+
+
+# ---------------- RECOVERY ----------------
+def read_log(directory):
+    """Yield (sequence, op, args) records; stops at a torn final record."""
+    path = os.path.join(directory, LOG_FILE)
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as handle:
+        data = handle.read()
+    position = 0
+    while position + _RECORD.size <= len(data):
+        length, = _RECORD.unpack_from(data, position)
+        start = position + _RECORD.size
+        if start + length > len(data):
+            break
+        yield pickle.loads(data[start:start + length])
+        position = start + length
+
+
+def replay(system, op, args):
+    """Re-apply one logged state change."""
+    if op == 'add':
+        number, destination, departure, emergency = args
+        system.add_flight_at(number, destination, datetime.fromtimestamp(departure), emergency)
+    elif op == 'add_many':
+        for number, destination, departure, emergency in args[0]:
+            system.add_flight_at(number, destination, datetime.fromtimestamp(departure), emergency)
+    elif op == 'schedule':
+        system.schedule_flights()
+    elif op == 'assign':
+        number, runway_id = args
+        system._assign(system.scheduled_flights.remove(number), runway_id)
+    elif op == 'depart':
+        runway = system.runways.runway_for(args[0])
+        system.record_departure(runway, system.runways.release(runway.runway_id))
+    elif op == 'cancel':
+        system.cancel_flight(args[0])
+    elif op == 'undo':
+        system.undo_cancellation()
+    elif op == 'escalate':
+        system.escalate_flight(args[0])
+    elif op == 'route':
+        system.add_route(*args)
+    else:
+        raise ValueError(f"unknown log record {op!r}")
+
+
+def open_system(directory, **system_kwargs):
+    """Load the latest snapshot, replay the log tail and attach a Journal.
+
+    A brand-new directory starts from a fresh system (with sample routes)
+    and immediately writes its first snapshot.
+    """
+    os.makedirs(directory, exist_ok=True)
+    sequence, state = read_snapshot(directory)
+    fresh = state is None
+    if fresh:
+        with quiet_logging():
+            system = AirportManagementSystem(**system_kwargs)
+    else:
+        system = restore_state(state, **system_kwargs)
+    # Default hub routes were logged as their own 'route' records; adding
+    # them again while replaying 'add' would duplicate the edges.
+    hub, system.hub = system.hub, None
+    with quiet_logging():
+        for record_sequence, op, args in read_log(directory):
+            if record_sequence > sequence:
+                replay(system, op, args)
+                sequence = record_sequence
+    system.hub = hub
+    system.journal = Journal(system, directory)
+    system.journal.sequence = sequence
+    if fresh:
+        system.journal.checkpoint()
+    return system
+
@@ -0,0 +1,105 @@
+"""
+RouteCache.py
+LRU cache of shortest-path trees in front of AirportGraph.
+"""
+
+from collections import OrderedDict
+
+
+class _PathTree:
+    """Shortest-path tree from one origin plus memoized paths to destinations."""
+
+    def __init__(self, distances, previous):
+        self.distances = distances
+        self.previous = previous
+        self.paths = {}  # destination -> (path, distance)
+
+    def route_to(self, destination):
+        if destination in self.paths:
+            return self.paths[destination]
+        if destination not in self.distances:
+            result = (None, float('inf'))
+        else:
+            path = []
+            airport = destination
+            while airport is not None:
+                path.append(airport)
+                airport = self.previous[airport]
+            path.reverse()
+            result = (path, self.distances[destination])
+        self.paths[destination] = result
+        return result
+
+
+class RouteCache:
+    """Memoizes (src, dest) shortest routes, sharing one tree per origin.
+
+    Trees are evicted least-recently-used once ``capacity`` origins are held.
+    ``route_added`` drops only the trees whose distances the new edge can
+    actually shorten, so unrelated origins stay warm.
+    """
+
+    def __init__(self, graph, capacity=256):
+        self.graph = graph
+        self.capacity = capacity
+        self._trees = OrderedDict()  # origin -> _PathTree
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._trees)
+
+    def find_shortest_route(self, start, destination):
+        """Same contract as AirportGraph.find_shortest_route."""
+        if start not in self.graph or destination not in self.graph:
+            return None, float('inf')
+        tree = self._trees.get(start)
+        if tree is not None and destination in tree.paths:
+            self.hits += 1
+            self._trees.move_to_end(start)
+            return tree.paths[destination]
+        self.misses += 1
+        if tree is None:
+            tree = _PathTree(*self.graph.shortest_path_tree(start))
+            self._trees[start] = tree
+            if len(self._trees) > self.capacity:
+                self._trees.popitem(last=False)
+        else:
+            self._trees.move_to_end(start)
+        return tree.route_to(destination)
+
+    def find_routes_batch(self, pairs):
+        """Answer many queries, grouped by origin so each tree is built once."""
+        pairs = list(pairs)
+        order = sorted(range(len(pairs)), key=lambda i: str(pairs[i][0]))
+        results = [None] * len(pairs)
+        for i in order:
+            results[i] = self.find_shortest_route(*pairs[i])
+        return results
+
+    def route_added(self, source, destination, distance):
+        """Invalidate trees that a new bidirectional edge could improve."""
+        stale = []
+        for origin, tree in self._trees.items():
+            to_source = tree.distances.get(source)
+            to_destination = tree.distances.get(destination)
+            if to_source is None and to_destination is None:
+                continue  # edge is outside this origin's component
+            if (to_destination is None or to_source is None
+                    or to_source + distance < to_destination
+                    or to_destination + distance < to_source):
+                stale.append(origin)
+        for origin in stale:
+            del self._trees[origin]
+
+    def clear(self):
+        self._trees.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'cached_origins': len(self._trees),
+        }
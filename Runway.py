@@ -27,6 +27,7 @@ class Runway:
         if not self.is_available:
             flight = self.current_flight
             self.current_flight = None
+            self.current_flight_name = ""
             self.is_available = True
             return flight
         return None
@@ -0,0 +1,258 @@
+"""
+RunwayAssignment.py
+Min-cost batch assignment of waiting flights to free runways (Hungarian algorithm).
+"""
+
+import heapq
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to plain Python loops
+    np = None
+
+INF = float('inf')
+WAKE_ORDER = {'L': 0, 'M': 1, 'H': 2}
+
+
+class AssignmentCosts:
+    """Cost, in minutes, of sending a flight to a runway in this cycle.
+
+    - ``taxi_minutes``: {stand: {runway_id: minutes}} taxi time from a
+      stand to each runway; ``stands`` maps flight numbers to stands
+      (flights without one use the ``None`` stand, default 0 minutes)
+    - ``max_wake``: {runway_id: 'L'|'M'|'H'} heaviest wake category a
+      runway can take; heavier flights may not use it
+    - ``wake_classes``: {flight_number: category}, 'M' by default as in
+      RunwayPlanner
+    - ``wait_weight``: cost per minute a flight is already past its
+      departure time, so overdue flights are chosen first
+
+    Flight.priority is not a cost but a hard constraint: a flight is never
+    left waiting for one with a larger priority number when a suitable
+    runway exists for it.
+    """
+
+    def __init__(self, taxi_minutes=None, stands=None, max_wake=None, wake_classes=None, wait_weight=1.0):
+        self.taxi_minutes = taxi_minutes or {}
+        self.stands = stands or {}
+        self.max_wake = max_wake or {}
+        self.wake_classes = wake_classes or {}
+        self.wait_weight = wait_weight
+
+    def matrix(self, flights, runway_ids, now):
+        """flights × runways cost rows (list of lists, or a NumPy array) with inf where unsuitable."""
+        stand_ids = {}
+        for f in flights:
+            stand_ids.setdefault(self.stands.get(f.flight_number), len(stand_ids))
+        taxi = [[self.taxi_minutes.get(stand, {}).get(r, 0.0) for r in runway_ids] for stand in stand_ids]
+        caps = [WAKE_ORDER[self.max_wake.get(r, 'H')] for r in runway_ids]
+        stand_of = [stand_ids[self.stands.get(f.flight_number)] for f in flights]
+        wake = [WAKE_ORDER[self.wake_classes.get(f.flight_number, 'M')] for f in flights]
+        stamp = now.timestamp()
+        overdue = [(stamp - f.departure_time.timestamp()) / 60 for f in flights]
+        if np is not None:
+            cost = np.asarray(taxi, dtype=float).reshape(len(stand_ids), len(runway_ids))[stand_of]
+            cost -= self.wait_weight * np.asarray(overdue)[:, None]
+            cost[np.asarray(wake)[:, None] > np.asarray(caps)[None, :]] = INF
+            return cost
+        weight = self.wait_weight
+        return [[INF if w > cap else t - weight * late for t, cap in zip(taxi[s], caps)]
+                for s, w, late in zip(stand_of, wake, overdue)]
+
+
+def assign_runways(flights, runway_ids, now, costs=None):
+    """Min-cost matching of ``flights`` to ``runway_ids``; returns [(flight, runway_id)].
+
+    At most one flight per runway and one runway per flight. Among all
+    matchings that seat as many flights of each priority level as
+    possible (most urgent level first), the one with the lowest total cost
+    wins; unsuitable pairs are never returned.
+    """
+    if not flights or not runway_ids:
+        return []
+    costs = costs or AssignmentCosts()
+    cost = costs.matrix(flights, runway_ids, now)
+    weighted = _priority_weighted(cost, [f.priority for f in flights])
+    return [(flights[i], runway_ids[j]) for i, j in min_cost_assignment(weighted) if cost[i][j] != INF]
+
+
+def total_cost(pairs, runway_ids, now, costs=None):
+    """(cost, unsuitable pairs) of any assignment under ``costs``, e.g. the greedy one."""
+    costs = costs or AssignmentCosts()
+    flights = [f for f, _ in pairs]
+    cost = costs.matrix(flights, runway_ids, now)
+    column = {r: j for j, r in enumerate(runway_ids)}
+    total = 0.0
+    unsuitable = 0
+    for i, (_, runway_id) in enumerate(pairs):
+        value = float(cost[i][column[runway_id]])
+        if value == INF:
+            unsuitable += 1
+        else:
+            total += value
+    return total, unsuitable
+
+
+def _priority_weighted(cost, priorities):
+    """Make priority lexicographic: one more seated flight of a better level outweighs any cost.
+
+    Each level above the worst gets a bonus larger than the spread of all
+    finite costs of a whole matching. Unsuitable pairs get a penalty larger
+    than every bonus, so they are only matched when nothing else is left,
+    and assign_runways drops them.
+    """
+    levels = sorted(set(priorities), reverse=True)  # worst level first
+    size = min(len(priorities), len(cost[0]))
+    if np is not None:
+        cost = np.array(cost, dtype=float)
+        finite = np.isfinite(cost)
+        spread = float(cost[finite].max() - cost[finite].min()) if finite.any() else 0.0
+        step = (spread + 1) * (size + 1)
+        rank = np.asarray([levels.index(p) for p in priorities], dtype=float)
+        cost -= (step * rank)[:, None]
+        cost[~finite] = step * (len(levels) + 1) * (size + 1)
+        return cost
+    values = [value for row in cost for value in row if value != INF]
+    spread = max(values) - min(values) if values else 0.0
+    step = (spread + 1) * (size + 1)
+    forbidden = step * (len(levels) + 1) * (size + 1)
+    weighted = []
+    for row, priority in zip(cost, priorities):
+        bonus = step * levels.index(priority)
+        weighted.append([forbidden if value == INF else value - bonus for value in row])
+    return weighted
+
+
+def min_cost_assignment(cost):
+    """Hungarian algorithm on a rectangular matrix of finite costs; returns (row, column) pairs.
+
+    Every row or every column (whichever side is smaller) is matched. With
+    k on the smaller side some optimal matching uses, in each of those k
+    lines, one of its own k cheapest entries (any other could be swapped
+    for a free one that is no dearer), so the larger side is first cut down
+    to the union of those. The shortest augmenting path form then runs in
+    O(k² n), with the inner loop vectorized when NumPy is available.
+    """
+    rows = len(cost)
+    if not rows or not len(cost[0]):
+        return []
+    transposed = rows > len(cost[0])
+    if np is not None:
+        matrix = np.asarray(cost, dtype=float)
+        if transposed:
+            matrix = matrix.T
+        k, n = matrix.shape
+        keep = np.arange(n)
+        if n > 2 * k:
+            keep = np.unique(np.argpartition(matrix, k - 1, axis=1)[:, :k])
+            matrix = matrix[:, keep]
+        pairs = [(i, int(keep[j])) for i, j in _hungarian_numpy(matrix)]
+    else:
+        matrix = [list(column) for column in zip(*cost)] if transposed else cost
+        k, n = len(matrix), len(matrix[0])
+        keep = list(range(n))
+        if n > 2 * k:
+            keep = sorted({j for row in matrix for j in heapq.nsmallest(k, range(n), key=row.__getitem__)})
+            matrix = [[row[j] for j in keep] for row in matrix]
+        pairs = [(i, keep[j]) for i, j in _hungarian_python(matrix)]
+    return sorted((j, i) for i, j in pairs) if transposed else sorted(pairs)
+
+
+def _hungarian_numpy(cost):
+    """k × n (k <= n) assignment with potentials; returns [(row, column)]."""
+    k, n = cost.shape
+    u = np.zeros(k + 1)
+    v = np.zeros(n + 1)
+    match = np.zeros(n + 1, dtype=np.int64)  # column -> row (1-based), 0 = free; column 0 is virtual
+    way = np.zeros(n + 1, dtype=np.int64)
+    padded = np.zeros((k + 1, n + 1))
+    padded[1:, 1:] = cost
+    # Row reduction: start from row minima and seat each row whose cheapest
+    # column is still free; only the rest need augmenting paths.
+    u[1:] = cost.min(axis=1)
+    seated = np.zeros(k + 1, dtype=bool)
+    for i, j in enumerate(cost.argmin(axis=1).tolist(), start=1):
+        if not match[j + 1]:
+            match[j + 1] = i
+            seated[i] = True
+    for i in range(1, k + 1):
+        if seated[i]:
+            continue
+        match[0] = i
+        j0 = 0
+        minv = np.full(n + 1, INF)
+        used = np.zeros(n + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            free = ~used
+            reduced = padded[i0] - u[i0] - v
+            better = free & (reduced < minv)
+            minv[better] = reduced[better]
+            way[better] = j0
+            masked = np.where(free, minv, INF)
+            j1 = int(masked.argmin())
+            delta = masked[j1]
+            u[match[used]] += delta
+            v[used] -= delta
+            minv[free] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+    return [(int(match[j]) - 1, j - 1) for j in range(1, n + 1) if match[j]]
+
+
+def _hungarian_python(cost):
+    k, n = len(cost), len(cost[0])
+    u = [0.0] * (k + 1)
+    v = [0.0] * (n + 1)
+    match = [0] * (n + 1)
+    way = [0] * (n + 1)
+    seated = [False] * (k + 1)
+    for i, row in enumerate(cost, start=1):
+        u[i] = min(row)
+        j = row.index(u[i]) + 1
+        if not match[j]:
+            match[j] = i
+            seated[i] = True
+    for i in range(1, k + 1):
+        if seated[i]:
+            continue
+        match[0] = i
+        j0 = 0
+        minv = [INF] * (n + 1)
+        used = [False] * (n + 1)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = INF
+            j1 = 0
+            for j in range(1, n + 1):
+                if not used[j]:
+                    reduced = row[j - 1] - ui0 - v[j]
+                    if reduced < minv[j]:
+                        minv[j] = reduced
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(n + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+    return [(match[j] - 1, j - 1) for j in range(1, n + 1) if match[j]]
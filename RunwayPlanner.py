@@ -0,0 +1,250 @@
+"""
+RunwayPlanner.py
+Time-slot runway planner with per-runway reservations and wake separation.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+
+# Extra gap (seconds) a follower needs after the leader's occupancy ends,
+# keyed by (leader, follower) wake category: H(eavy), M(edium), L(ight).
+# A light leader needs no extra gap before any follower.
+WAKE_SEPARATION = {
+    ('H', 'H'): 60,
+    ('H', 'M'): 60,
+    ('H', 'L'): 120,
+    ('M', 'M'): 0,
+    ('M', 'L'): 60,
+}
+
+
+class Slot:
+    """One reserved [start, end) block on a runway."""
+
+    __slots__ = ('flight', 'runway_id', 'start', 'end', 'wake')
+
+    def __init__(self, flight, runway_id, start, end, wake):
+        self.flight = flight
+        self.runway_id = runway_id
+        self.start = start  # POSIX seconds
+        self.end = end
+        self.wake = wake
+
+    @property
+    def delay(self):
+        """Seconds between the flight's departure time and its slot."""
+        return self.start - self.flight.departure_time.timestamp()
+
+    def as_dict(self):
+        return {
+            'flight_number': self.flight.flight_number,
+            'runway_no': self.runway_id,
+            'start': datetime.fromtimestamp(self.start).isoformat(),
+            'end': datetime.fromtimestamp(self.end).isoformat(),
+            'wake': self.wake,
+            'delay_minutes': round(self.delay / 60, 1),
+        }
+
+    def __str__(self):
+        start = datetime.fromtimestamp(self.start).strftime('%H:%M')
+        end = datetime.fromtimestamp(self.end).strftime('%H:%M')
+        return f"Runway {self.runway_id}: {self.flight.flight_number} {start}-{end}"
+
+
+class RunwayPlanner:
+    """Plans departures into future runway time slots.
+
+    Each runway keeps its reserved blocks sorted by start time. Blocks on a
+    runway never overlap, so the interval tree reduces to a sorted array
+    searched with bisect, plus a sorted index of the gaps between blocks
+    that are at least ``occupancy`` long. Finding a flight's earliest slot
+    checks the gap at its departure time and otherwise bisects straight to
+    the next gap long enough to hold it, so a congested runway costs
+    O(log n) rather than a walk over its backlog. A flight is placed on the
+    runway offering the earliest feasible start at or after its departure
+    time, honouring ``occupancy`` and ``WAKE_SEPARATION`` with both
+    neighbours.
+
+    No slot starts before ``not_before`` (POSIX seconds, normally the
+    current time), so overdue flights are planned from now rather than into
+    the past. ``hold`` marks a runway busy until its assigned flight
+    releases it; call it before ``plan``.
+
+    ``cancel`` frees a block (a held runway included) and re-places only
+    the delayed flights planned after it, in priority order, so they can
+    move into the space; ``place`` re-adds a restored flight. Neither
+    re-plans the whole day.
+    """
+
+    def __init__(self, runway_count=3, occupancy=timedelta(minutes=2), separation=None, not_before=None):
+        self.occupancy = occupancy.total_seconds()
+        self.separation = WAKE_SEPARATION if separation is None else separation
+        self.not_before = not_before
+        self._starts = {i + 1: [] for i in range(runway_count)}  # runway_id -> sorted starts
+        self._blocks = {i + 1: [] for i in range(runway_count)}  # runway_id -> Slots by start
+        self._gaps = {i + 1: [] for i in range(runway_count)}  # runway_id -> sorted gap starts
+        self._slots = {}  # flight_number -> Slot
+        self._holds = {}  # flight_number -> Slot of a flight already on its runway
+        self._delayed = {}  # flight_number -> Slot starting after its departure time
+        self._wake = {}  # flight_number -> wake category, kept across cancel/restore
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, flight_number):
+        return flight_number in self._slots
+
+    def get(self, flight_number):
+        return self._slots.get(flight_number)
+
+    def runway_slots(self, runway_id):
+        return list(self._blocks[runway_id])
+
+    def slots(self):
+        """All reserved slots ordered by start time, then runway."""
+        return sorted(self._slots.values(), key=lambda s: (s.start, s.runway_id))
+
+    # ---------------- PLANNING ----------------
+    def hold(self, flight, runway_id, until, wake=None):
+        """Mark a runway busy until ``until`` (POSIX seconds) for a flight already assigned to it.
+
+        The block starts at ``not_before``, or one occupancy before ``until``
+        when the planner has no current time.
+        """
+        start = self.not_before if self.not_before is not None else until - self.occupancy
+        if until <= start:
+            return None
+        slot = Slot(flight, runway_id, start, until, wake or 'M')
+        self._insert(slot, bisect_right(self._starts[runway_id], start))
+        self._holds[flight.flight_number] = slot
+        return slot
+
+    def plan(self, flights, wake_classes=None):
+        """Place flights in priority order (Flight.__lt__); returns their Slots."""
+        wake_classes = wake_classes or {}
+        return [self.place(f, wake_classes.get(f.flight_number)) for f in sorted(flights)]
+
+    def place(self, flight, wake=None, not_before=None):
+        """Reserve the earliest feasible slot for one flight.
+
+        ``wake`` defaults to the category the flight was last planned with,
+        or 'M'.
+        """
+        wake = wake or self._wake.get(flight.flight_number, 'M')
+        self._wake[flight.flight_number] = wake
+        if flight.flight_number in self._slots:
+            self.cancel(flight.flight_number, replan=False)
+        ready = flight.departure_time.timestamp()
+        if not_before is None:
+            not_before = self.not_before
+        if not_before is not None:
+            ready = max(ready, not_before)
+        best_start, best_runway, best_position = None, None, None
+        for runway_id in self._blocks:
+            start, position = self._earliest(runway_id, ready, wake)
+            if best_start is None or start < best_start:
+                best_start, best_runway, best_position = start, runway_id, position
+                if start == ready:
+                    break
+        slot = Slot(flight, best_runway, best_start, best_start + self.occupancy, wake)
+        self._insert(slot, best_position)
+        self._slots[flight.flight_number] = slot
+        if best_start > flight.departure_time.timestamp():
+            self._delayed[flight.flight_number] = slot
+        return slot
+
+    def cancel(self, flight_number, replan=True):
+        """Free a flight's slot; with replan, move delayed flights into the gap.
+
+        Returns the Slots of flights that moved.
+        """
+        slot = self._slots.pop(flight_number, None) or self._holds.pop(flight_number, None)
+        if slot is None:
+            return []
+        self._delayed.pop(flight_number, None)
+        self._remove(slot)
+        if not replan:
+            return []
+        # Every slot was the earliest feasible one when placed, so a flight
+        # can only move if its window [departure, slot) touches freed space.
+        margin = self.occupancy + max(self.separation.values(), default=0)
+        freed_start, freed_end = slot.start, slot.end
+        moved = []
+        candidates = sorted(s.flight for s in self._delayed.values() if s.start > slot.start)
+        for flight in candidates:
+            previous = self._slots[flight.flight_number]
+            if previous.start + margin <= freed_start or flight.departure_time.timestamp() >= freed_end + margin:
+                continue
+            del self._slots[flight.flight_number]
+            del self._delayed[flight.flight_number]
+            self._remove(previous)
+            replaced = self.place(flight, previous.wake)
+            if replaced.start < previous.start:
+                moved.append(replaced)
+                freed_end = max(freed_end, previous.end)
+        return moved
+
+    def _earliest(self, runway_id, ready, wake):
+        """Earliest feasible start >= ready on one runway, and its insert position."""
+        starts = self._starts[runway_id]
+        blocks = self._blocks[runway_id]
+        separation = self.separation
+        position = bisect_right(starts, ready)
+        start = ready
+        if position:
+            leader = blocks[position - 1]
+            start = max(start, leader.end + separation.get((leader.wake, wake), 0))
+        if position == len(blocks):
+            return start, position
+        follower = blocks[position]
+        if start + self.occupancy + separation.get((wake, follower.wake), 0) <= follower.start:
+            return start, position
+
+        # Jump to the gaps after the follower; shorter gaps can never fit.
+        gaps = self._gaps[runway_id]
+        for index in range(bisect_left(gaps, follower.end), len(gaps)):
+            gap_start = gaps[index]
+            position = bisect_left(starts, gap_start)
+            leader, follower = blocks[position - 1], blocks[position]
+            start = gap_start + separation.get((leader.wake, wake), 0)
+            if start + self.occupancy + separation.get((wake, follower.wake), 0) <= follower.start:
+                return start, position
+        leader = blocks[-1]
+        return max(ready, leader.end + separation.get((leader.wake, wake), 0)), len(blocks)
+
+    def _insert(self, slot, position):
+        runway_id = slot.runway_id
+        blocks = self._blocks[runway_id]
+        if position:
+            self._drop_gap(runway_id, blocks[position - 1].end)
+            self._add_gap(runway_id, blocks[position - 1].end, slot.start)
+        if position < len(blocks):
+            self._add_gap(runway_id, slot.end, blocks[position].start)
+        self._starts[runway_id].insert(position, slot.start)
+        blocks.insert(position, slot)
+
+    def _remove(self, slot):
+        runway_id = slot.runway_id
+        starts = self._starts[runway_id]
+        blocks = self._blocks[runway_id]
+        position = bisect_right(starts, slot.start) - 1
+        while blocks[position] is not slot:
+            position -= 1
+        del starts[position]
+        del blocks[position]
+        self._drop_gap(runway_id, slot.end)
+        if position:
+            leader = blocks[position - 1]
+            self._drop_gap(runway_id, leader.end)
+            if position < len(blocks):
+                self._add_gap(runway_id, leader.end, blocks[position].start)
+
+    def _add_gap(self, runway_id, start, end):
+        if end - start >= self.occupancy:
+            insort(self._gaps[runway_id], start)
+
+    def _drop_gap(self, runway_id, start):
+        gaps = self._gaps[runway_id]
+        index = bisect_left(gaps, start)
+        if index < len(gaps) and gaps[index] == start:
+            del gaps[index]
@@ -0,0 +1,171 @@
+"""
+RunwayPool.py
+Pool of runways with a free-list and a departure-time heap.
+"""
+
+import asyncio
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from Runway import Runway
+
+log = logging.getLogger('airport.runways')
+
+
+class RunwayPool:
+    """Tracks free and occupied runways so allocation and release are O(log r).
+
+    Free runways are kept in a min-heap of runway ids (lowest id is handed out
+    first). Occupied runways are kept in a min-heap keyed by the departure time
+    of their current flight, but never less than ``min_occupancy`` after
+    assignment. Entries made stale by a cancellation are skipped
+    lazily using a per-runway generation counter.
+    """
+
+    def __init__(self, count=3, clock=datetime.now, min_occupancy=timedelta(0)):
+        self.clock = clock
+        self.min_occupancy = min_occupancy  # shortest time a runway is held
+        self._runways = {i + 1: Runway(i + 1) for i in range(count)}
+        self._free = list(self._runways)
+        heapq.heapify(self._free)
+        self._busy = []  # (release_time, runway_id, generation)
+        self._generation = {runway_id: 0 for runway_id in self._runways}
+        self._by_flight = {}  # flight_number -> runway_id
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return iter(self._runways.values())
+
+    def __len__(self):
+        return len(self._runways)
+
+    def get(self, runway_id):
+        return self._runways.get(runway_id)
+
+    @property
+    def free_count(self):
+        return len(self._free)
+
+    def free_ids(self):
+        """Ids of the free runways, lowest first."""
+        with self._lock:
+            return sorted(self._free)
+
+    def runway_for(self, flight_number):
+        """Return the runway currently holding this flight, or None."""
+        runway_id = self._by_flight.get(flight_number)
+        return self._runways[runway_id] if runway_id is not None else None
+
+    # ---------------- ALLOCATION ----------------
+    def acquire(self, flight, runway_id=None):
+        """Assign a flight to the lowest-numbered free runway (or runway_id).
+
+        Returns the runway, or None if no suitable runway is free.
+        """
+        with self._lock:
+            if not self._free:
+                return None
+            if runway_id is None:
+                runway = self._runways[heapq.heappop(self._free)]
+            elif runway_id in self._free:
+                self._free.remove(runway_id)
+                heapq.heapify(self._free)
+                runway = self._runways[runway_id]
+            else:
+                return None
+            runway.assign_flight(flight)
+            self._generation[runway.runway_id] += 1
+            release_time = max(flight.departure_time, self.clock() + self.min_occupancy)
+            heapq.heappush(self._busy, (release_time, runway.runway_id,
+                                        self._generation[runway.runway_id]))
+            self._by_flight[flight.flight_number] = runway.runway_id
+            return runway
+
+    def release(self, runway_id):
+        """Release a runway early (e.g. on cancellation) and return its flight."""
+        with self._lock:
+            return self._release(self._runways[runway_id])
+
+    def release_flight(self, flight_number):
+        """Release whichever runway holds this flight; returns the flight or None."""
+        with self._lock:
+            runway_id = self._by_flight.get(flight_number)
+            if runway_id is None:
+                return None
+            return self._release(self._runways[runway_id])
+
+    def release_due(self, now=None):
+        """Release every runway whose flight has departed by ``now``.
+
+        Returns a list of (runway, flight) pairs in departure order.
+        """
+        now = now or self.clock()
+        released = []
+        with self._lock:
+            while self._busy and self._busy[0][0] <= now:
+                _, runway_id, generation = heapq.heappop(self._busy)
+                if generation != self._generation[runway_id]:
+                    continue
+                runway = self._runways[runway_id]
+                released.append((runway, self._release(runway)))
+        return released
+
+    def next_release_time(self):
+        """Departure time of the earliest occupied runway, or None."""
+        with self._lock:
+            self._drop_stale()
+            return self._busy[0][0] if self._busy else None
+
+    def release_times(self):
+        """Map runway_id -> scheduled release time for every occupied runway."""
+        with self._lock:
+            return {runway_id: release_time for release_time, runway_id, generation in self._busy
+                    if generation == self._generation[runway_id]}
+
+    def next_available_minutes(self, now=None):
+        """Minutes until the next runway frees up (0 if none is pending)."""
+        next_time = self.next_release_time()
+        if next_time is None:
+            return 0
+        now = now or self.clock()
+        return max((next_time - now).total_seconds() / 60, 0)
+
+    # ---------------- BACKGROUND RELEASE ----------------
+    async def run_release_timer(self, on_release=None, max_sleep=1.0):
+        """Release departed runways in the background instead of on request.
+
+        Sleeps until the next scheduled departure (capped at ``max_sleep`` so
+        newly assigned earlier flights are picked up) and releases due runways.
+        ``on_release`` is called with each (runway, flight) pair; an exception
+        from it is logged and the timer keeps running.
+        """
+        while True:
+            for runway, flight in self.release_due():
+                if on_release:
+                    try:
+                        on_release(runway, flight)
+                    except Exception:
+                        log.exception("Release callback failed", extra={
+                            'event': 'release_callback_failed', 'runway': runway.runway_id,
+                            'flight_number': flight.flight_number})
+            next_time = self.next_release_time()
+            delay = max_sleep
+            if next_time is not None:
+                delay = min(max((next_time - self.clock()).total_seconds(), 0), max_sleep)
+            await asyncio.sleep(delay)
+
+    # ---------------- INTERNALS ----------------
+    def _release(self, runway):
+        flight = runway.release_runway()
+        if flight is None:
+            return None
+        self._generation[runway.runway_id] += 1
+        self._by_flight.pop(flight.flight_number, None)
+        heapq.heappush(self._free, runway.runway_id)
+        return flight
+
+    def _drop_stale(self):
+        while self._busy and self._busy[0][2] != self._generation[self._busy[0][1]]:
+            heapq.heappop(self._busy)
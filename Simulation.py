@@ -0,0 +1,196 @@
+"""
+Simulation.py
+Discrete-event simulation of airport traffic on a virtual clock.
+"""
+
+import heapq
+import time
+from datetime import datetime, timedelta
+
+from AirportManagementSystem import AirportManagementSystem
+from Metrics import quiet_logging
+
+
+class VirtualClock:
+    """Clock that only moves when the simulation advances it."""
+
+    def __init__(self, start):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance_to(self, moment):
+        if moment > self.now:
+            self.now = moment
+
+
+class SimulationReport:
+    """Counters and time series collected during a simulation run."""
+
+    def __init__(self, runway_count):
+        self.runway_count = runway_count
+        self.arrivals = 0
+        self.departures = 0
+        self.cancellations = 0
+        self.emergencies = 0
+        self.max_queue_depth = 0
+        self.busy_runway_minutes = 0.0
+        self.start = None
+        self.end = None
+        self.wall_seconds = 0.0
+        self.samples = []  # (time, queue_depth, busy_runways)
+
+    @property
+    def simulated_hours(self):
+        if self.start is None or self.end is None:
+            return 0.0
+        return (self.end - self.start).total_seconds() / 3600
+
+    @property
+    def throughput_per_hour(self):
+        hours = self.simulated_hours
+        return self.departures / hours if hours else 0.0
+
+    @property
+    def runway_utilization(self):
+        total = self.simulated_hours * 60 * self.runway_count
+        return self.busy_runway_minutes / total if total else 0.0
+
+    def summary(self):
+        return {
+            'arrivals': self.arrivals,
+            'departures': self.departures,
+            'cancellations': self.cancellations,
+            'emergencies': self.emergencies,
+            'max_queue_depth': self.max_queue_depth,
+            'simulated_hours': round(self.simulated_hours, 2),
+            'throughput_per_hour': round(self.throughput_per_hour, 2),
+            'runway_utilization': round(self.runway_utilization, 4),
+            'wall_seconds': round(self.wall_seconds, 3),
+        }
+
+
+class AirportSimulation:
+    """Replays arrivals, cancellations and emergencies against the real system.
+
+    Events are kept in a heap ordered by virtual time. Runway turnover is
+    driven by the system's RunwayPool: whenever the next departure comes
+    before the next queued event, the clock jumps straight to it.
+    """
+
+    ARRIVAL = 'arrival'
+    CANCEL = 'cancel'
+    EMERGENCY = 'emergency'
+
+    def __init__(self, start=None, runway_count=3, runway_occupancy=timedelta(minutes=2),
+                 sample_interval=timedelta(minutes=15)):
+        start = start or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.clock = VirtualClock(start)
+        self.system = AirportManagementSystem(runway_count=runway_count, clock=self.clock,
+                                              runway_occupancy=runway_occupancy)
+        self.sample_interval = sample_interval
+        self._events = []
+        self._sequence = 0
+
+    # ---------------- EVENT QUEUE ----------------
+    def _push(self, when, kind, data):
+        heapq.heappush(self._events, (when, self._sequence, kind, data))
+        self._sequence += 1
+
+    def add_arrival(self, when, number, destination, departure_time, emergency=False):
+        """A flight becomes ready to be scheduled at ``when``."""
+        self._push(when, self.ARRIVAL, (number, destination, departure_time, emergency))
+
+    def add_cancellation(self, when, number):
+        self._push(when, self.CANCEL, number)
+
+    def add_emergency(self, when, number):
+        self._push(when, self.EMERGENCY, number)
+
+    # ---------------- RUN ----------------
+    def run(self, until=None):
+        """Process every event (up to ``until``) and return a SimulationReport."""
+        system = self.system
+        runways = system.runways
+        report = SimulationReport(len(runways))
+        report.start = self.clock.now
+        next_sample = self.clock.now
+        last_time = self.clock.now
+        busy = 0
+        wall_start = time.perf_counter()
+
+        with quiet_logging():
+            while True:
+                next_event = self._events[0][0] if self._events else None
+                next_release = runways.next_release_time()
+                if next_event is None and next_release is None:
+                    break
+                if next_event is None or (next_release is not None and next_release < next_event):
+                    moment = next_release
+                else:
+                    moment = next_event
+                if until is not None and moment > until:
+                    break
+                moment = max(moment, self.clock.now)
+
+                while next_sample <= moment:
+                    report.samples.append((next_sample, len(system.scheduled_flights), busy))
+                    next_sample += self.sample_interval
+                report.busy_runway_minutes += busy * (moment - last_time).total_seconds() / 60
+                self.clock.advance_to(moment)
+                last_time = moment
+
+                report.departures += len(system._clear_departed_flights())
+                while self._events and self._events[0][0] <= moment:
+                    _, _, kind, data = heapq.heappop(self._events)
+                    self._apply(kind, data, report)
+                if system.flight_queue:
+                    system.schedule_flights()
+                if system.scheduled_flights and runways.free_count:
+                    system.allocate_runways(show_runways=False)
+
+                busy = len(runways) - runways.free_count
+                report.max_queue_depth = max(report.max_queue_depth, len(system.scheduled_flights))
+
+        report.end = self.clock.now
+        report.wall_seconds = time.perf_counter() - wall_start
+        return report
+
+    def _apply(self, kind, data, report):
+        if kind == self.ARRIVAL:
+            number, destination, departure_time, emergency = data
+            self.system.add_flight_at(number, destination, departure_time, emergency)
+            report.arrivals += 1
+        elif kind == self.CANCEL:
+            if data in self.system.scheduled_flights or self.system.runways.runway_for(data):
+                self.system.cancel_flight(data)
+                report.cancellations += 1
+        elif kind == self.EMERGENCY:
+            if self.system.escalate_flight(data):
+                report.emergencies += 1
+
+
+def random_day(simulation, flight_count, seed=0, emergency_ratio=0.02, cancel_ratio=0.01,
+               escalate_ratio=0.005):
+    """Fill a simulation with a seeded day of random traffic."""
+    import random
+    rng = random.Random(seed)
+    start = simulation.clock.now
+    destinations = ["LAX", "LHR", "SFO", "CDG", "NRT", "FRA"]
+    for i in range(flight_count):
+        departure = start + timedelta(seconds=rng.randrange(24 * 3600))
+        ready = departure - timedelta(minutes=rng.randint(5, 120))
+        number = f"SIM{i}"
+        simulation.add_arrival(max(ready, start), number, rng.choice(destinations),
+                               departure, rng.random() < emergency_ratio)
+        if rng.random() < cancel_ratio:
+            simulation.add_cancellation(ready + timedelta(minutes=rng.randint(1, 30)), number)
+        elif rng.random() < escalate_ratio:
+            simulation.add_emergency(ready + timedelta(minutes=rng.randint(1, 30)), number)
+
+
+if __name__ == "__main__":
+    sim = AirportSimulation(runway_count=150)
+    random_day(sim, 100_000)
+    print(sim.run().summary())
@@ -0,0 +1,209 @@
+"""
+Timetable.py
+Departure-sorted connection array over scheduled flights with Connection Scan queries.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+INF = float('inf')
+
+
+class Timetable:
+    """Every active flight as a connection (origin, destination, departure, arrival).
+
+    Connections live in parallel arrays sorted by departure time, so a
+    query is one forward (earliest arrival) or backward (profile) scan
+    starting at a binary-searched position. A flight's flying time is its
+    shortest route distance times ``minutes_per_unit``. ``add`` and
+    ``remove`` keep the arrays sorted in place. ``add_many`` appends and
+    re-sorts once. A route change only marks the arrays stale; they are
+    rebuilt with new flying times before the next query.
+    """
+
+    def __init__(self, route_cache, minutes_per_unit=60):
+        self.route_cache = route_cache  # anything with find_shortest_route(start, destination)
+        self.seconds_per_unit = minutes_per_unit * 60
+        self._flights = {}  # flight_number -> (origin, flight)
+        self._departures = array('d')
+        self._arrivals = array('d')
+        self._origins = []
+        self._destinations = []
+        self._numbers = []
+        self._stale = False
+
+    def __len__(self):
+        self._refresh()
+        return len(self._numbers)
+
+    # ---------------- UPDATES ----------------
+    def add(self, flight, origin):
+        self._flights[flight.flight_number] = (origin, flight)
+        if self._stale:
+            return
+        connection = self._connection(origin, flight)
+        if connection is None:
+            return
+        departure = connection[0]
+        i = bisect_right(self._departures, departure)
+        self._departures.insert(i, departure)
+        self._arrivals.insert(i, connection[1])
+        self._origins.insert(i, origin)
+        self._destinations.insert(i, flight.destination)
+        self._numbers.insert(i, flight.flight_number)
+
+    def add_many(self, flights, origin):
+        for flight in flights:
+            self._flights[flight.flight_number] = (origin, flight)
+        self._stale = True
+
+    def remove(self, number):
+        entry = self._flights.pop(number, None)
+        if entry is None or self._stale:
+            return
+        departure = entry[1].departure_time.timestamp()
+        i = bisect_left(self._departures, departure)
+        while i < len(self._numbers) and self._departures[i] == departure:
+            if self._numbers[i] == number:
+                del self._departures[i]
+                del self._arrivals[i]
+                del self._origins[i]
+                del self._destinations[i]
+                del self._numbers[i]
+                return
+            i += 1
+
+    def routes_changed(self):
+        self._stale = True
+
+    def _connection(self, origin, flight):
+        """(departure, arrival) timestamps, or None if the destination is unreachable."""
+        if origin == flight.destination:
+            return None
+        _, distance = self.route_cache.find_shortest_route(origin, flight.destination)
+        if distance == INF:
+            return None
+        departure = flight.departure_time.timestamp()
+        return departure, departure + distance * self.seconds_per_unit
+
+    def _refresh(self):
+        if not self._stale:
+            return
+        rows = []
+        for number, (origin, flight) in self._flights.items():
+            connection = self._connection(origin, flight)
+            if connection is not None:
+                rows.append((connection[0], connection[1], origin, flight.destination, number))
+        rows.sort(key=lambda row: row[0])
+        self._departures = array('d', (row[0] for row in rows))
+        self._arrivals = array('d', (row[1] for row in rows))
+        self._origins = [row[2] for row in rows]
+        self._destinations = [row[3] for row in rows]
+        self._numbers = [row[4] for row in rows]
+        self._stale = False
+
+    # ---------------- QUERIES ----------------
+    def earliest_arrival(self, source, target, depart_after, transfer=timedelta(minutes=30)):
+        """Earliest arrival at ``target`` leaving ``source`` at or after ``depart_after``.
+
+        Connection Scan: one pass over connections departing after
+        ``depart_after``, stopping once departures pass the best arrival
+        found. Changing flights needs ``transfer`` on the ground. Returns
+        (arrival datetime, legs), or (None, []) if ``target`` cannot be
+        reached.
+        """
+        self._refresh()
+        if source == target:
+            return depart_after, []
+        departures, arrivals = self._departures, self._arrivals
+        origins, destinations = self._origins, self._destinations
+        change = transfer.total_seconds()
+        ready = {source: depart_after.timestamp()}  # earliest boarding time per airport
+        reached = {}  # airport -> earliest arrival
+        via = {}  # airport -> index of the connection arriving there
+        best = INF
+        for i in range(bisect_left(departures, ready[source]), len(departures)):
+            departure = departures[i]
+            if departure >= best:
+                break
+            boarding = ready.get(origins[i])
+            if boarding is None or boarding > departure:
+                continue
+            destination = destinations[i]
+            arrival = arrivals[i]
+            if destination != source and arrival < reached.get(destination, INF):
+                reached[destination] = arrival
+                ready[destination] = arrival + change
+                via[destination] = i
+                if destination == target:
+                    best = arrival
+        if best == INF:
+            return None, []
+        legs = []
+        airport = target
+        while airport != source:
+            i = via[airport]
+            legs.append(self._leg(i))
+            airport = origins[i]
+        legs.reverse()
+        return datetime.fromtimestamp(best), legs
+
+    def profile(self, source, target, start, end, transfer=timedelta(minutes=30)):
+        """Every non-dominated journey leaving ``source`` between ``start`` and ``end``.
+
+        Profile Connection Scan: one backward pass keeps, per airport, the
+        (departure, arrival at ``target``) pairs no later departure beats.
+        Returns a list of (departure, arrival, legs) in departure order;
+        each later option arrives strictly later than the one before.
+        """
+        self._refresh()
+        departures, arrivals = self._departures, self._arrivals
+        origins, destinations = self._origins, self._destinations
+        change = transfer.total_seconds()
+        latest = end.timestamp()
+        # airport -> ([-departure], [arrival at target], [(connection, next entry)]);
+        # appended in falling departure order, so each list is bisectable
+        profiles = {}
+        for i in range(len(departures) - 1, bisect_left(departures, start.timestamp()) - 1, -1):
+            origin = origins[i]
+            if origin == target or (origin == source and departures[i] > latest):
+                continue
+            destination = destinations[i]
+            if destination == target:
+                arrival, onward = arrivals[i], None
+            else:
+                entry = profiles.get(destination)
+                if entry is None:
+                    continue
+                onward = bisect_right(entry[0], -(arrivals[i] + change)) - 1
+                if onward < 0:
+                    continue
+                arrival = entry[1][onward]
+            entry = profiles.setdefault(origin, ([], [], []))
+            if not entry[1] or arrival < entry[1][-1]:
+                entry[0].append(-departures[i])
+                entry[1].append(arrival)
+                entry[2].append((i, onward))
+
+        options = []
+        entry = profiles.get(source)
+        for position in range(len(entry[0]) - 1, -1, -1) if entry else ():
+            legs = []
+            airport, j = source, position
+            while j is not None:
+                i, j = profiles[airport][2][j]
+                legs.append(self._leg(i))
+                airport = destinations[i]
+            options.append((datetime.fromtimestamp(-entry[0][position]),
+                            datetime.fromtimestamp(entry[1][position]), legs))
+        return options
+
+    def _leg(self, i):
+        return {
+            'flight_number': self._numbers[i],
+            'from': self._origins[i],
+            'to': self._destinations[i],
+            'departure_time': datetime.fromtimestamp(self._departures[i]).isoformat(),
+            'arrival_time': datetime.fromtimestamp(self._arrivals[i]).isoformat(),
+        }
@@ -0,0 +1,259 @@
+"""
+WhatIf.py
+Parallel Monte Carlo what-if runs of delays and closures over the current schedule.
+"""
+
+import heapq
+import math
+import os
+import random
+import time
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from itertools import repeat
+
+from AirportGraph import _restricted_tree
+from Metrics import percentile
+
+METRICS = ('mean_wait_minutes', 'p95_wait_minutes', 'max_queue', 'runway_utilization',
+           'cancellations', 'departures')
+
+
+class Scenario:
+    """Random disruption model applied to every Monte Carlo run.
+
+    - each flight is late with ``delay_probability``, by an exponential
+      delay with mean ``mean_delay``
+    - with ``runway_closure_probability`` one runway closes for
+      ``closure_duration`` starting at a random time in the schedule
+    - with ``airport_closure_probability`` one airport closes; flights to
+      destinations no longer reachable from ``hub`` are cancelled
+    - flights waiting longer than ``max_wait`` for a runway are cancelled
+    """
+
+    def __init__(self, delay_probability=0.2, mean_delay=timedelta(minutes=20),
+                 runway_closure_probability=0.3, closure_duration=timedelta(hours=2),
+                 airport_closure_probability=0.05, max_wait=timedelta(hours=3)):
+        self.delay_probability = delay_probability
+        self.mean_delay = mean_delay.total_seconds()
+        self.runway_closure_probability = runway_closure_probability
+        self.closure_duration = closure_duration.total_seconds()
+        self.airport_closure_probability = airport_closure_probability
+        self.max_wait = max_wait.total_seconds()
+
+
+class WhatIfReport:
+    """Percentiles of each metric over all runs."""
+
+    PERCENTILES = (5, 50, 95, 99)
+
+    def __init__(self, results, wall_seconds):
+        self.runs = len(results)
+        self.wall_seconds = wall_seconds
+        self.metrics = {}
+        for position, name in enumerate(METRICS):
+            values = sorted(result[position] for result in results)
+            summary = {f'p{q}': round(percentile(values, q), 3) for q in self.PERCENTILES}
+            summary['mean'] = round(sum(values) / len(values), 3) if values else 0.0
+            self.metrics[name] = summary
+
+    def summary(self):
+        return {'runs': self.runs, 'wall_seconds': round(self.wall_seconds, 3), **self.metrics}
+
+
+# ---------------- STATE ----------------
+def compact_state(system, hub=None):
+    """Flatten waiting flights, busy runways and routes into arrays and tuples.
+
+    This is what workers receive instead of a pickled AirportManagementSystem
+    object graph. Airport closures are judged from ``hub``, by default the
+    system's own hub; with no hub they are not simulated.
+    """
+    now = system.clock().timestamp()
+    hub = system.hub if hub is None else hub
+    flights = list(system.flight_queue) + system.scheduled_flights.flights()
+    airports = sorted({f.destination for f in flights} | set(system.airport_graph.graph))
+    airport_ids = {name: i for i, name in enumerate(airports)}
+    occupancy = system.runways.min_occupancy.total_seconds() or 120.0
+    busy = system.runways.release_times()
+    routes = [(airport_ids[source], airport_ids[destination], distance)
+              for source, destination, distance in system.airport_graph.edges()]
+    return {
+        'start': now,
+        'occupancy': occupancy,
+        'runways': array('d', (max(busy[r.runway_id].timestamp(), now) if r.runway_id in busy else now
+                               for r in system.runways)),
+        'departures': array('d', (max(f.departure_time.timestamp(), now) for f in flights)),
+        'emergency': bytes(f.is_emergency for f in flights),
+        'destinations': array('l', (airport_ids[f.destination] for f in flights)),
+        'airports': tuple(airports),
+        'routes': tuple(routes),
+        'hub': airport_ids.get(hub, -1),
+    }
+
+
+# ---------------- ONE RUN ----------------
+def run_scenario(state, scenario, seed, graph=None):
+    """Simulate one randomized day; returns a tuple ordered like METRICS.
+
+    Flights become ready at their (possibly delayed) departure time and
+    take the first free runway for ``occupancy`` seconds, emergencies
+    first, like allocate_runways.
+    """
+    rng = random.Random(seed)
+    departures = state['departures']
+    emergency = state['emergency']
+    occupancy = state['occupancy']
+    count = len(departures)
+    start = state['start']
+    end = max(departures, default=start)
+
+    ready = list(departures)
+    if scenario.delay_probability > 0 and scenario.mean_delay > 0:
+        rate = 1 / scenario.mean_delay
+        for i in range(count):
+            if rng.random() < scenario.delay_probability:
+                ready[i] += rng.expovariate(rate)
+
+    cancelled = 0
+    skip = set()
+    if state['hub'] >= 0 and rng.random() < scenario.airport_closure_probability:
+        if graph is None:
+            graph = _graph(state)
+        closed = rng.randrange(len(state['airports']))
+        if closed != state['hub']:
+            reachable = _restricted_tree(graph, state['hub'], {closed}, None)
+            destinations = state['destinations']
+            skip = {i for i in range(count) if destinations[i] not in reachable}
+            cancelled += len(skip)
+
+    runway_count = len(state['runways'])
+    closed_runway, closed_from, closed_until = -1, 0.0, 0.0
+    if runway_count and rng.random() < scenario.runway_closure_probability:
+        closed_runway = rng.randrange(runway_count)
+        closed_from = rng.uniform(start, end)
+        closed_until = closed_from + scenario.closure_duration
+
+    order = sorted((i for i in range(count) if i not in skip), key=ready.__getitem__)
+    runways = [(free_at, r) for r, free_at in enumerate(state['runways'])]
+    heapq.heapify(runways)
+    queue = []
+    waits = []
+    max_queue = 0
+    busy = 0.0
+    last = start
+    position = 0
+    while runways and (position < len(order) or queue):
+        free_at, runway = heapq.heappop(runways)
+        if not queue:
+            free_at = max(free_at, ready[order[position]])
+        if runway == closed_runway and free_at < closed_until and free_at + occupancy > closed_from:
+            heapq.heappush(runways, (closed_until, runway))
+            continue
+        while position < len(order) and ready[order[position]] <= free_at:
+            i = order[position]
+            heapq.heappush(queue, (0 if emergency[i] else 1, ready[i], i))
+            position += 1
+        max_queue = max(max_queue, len(queue))
+        _, ready_at, i = heapq.heappop(queue)
+        wait = free_at - ready_at
+        if wait > scenario.max_wait:
+            cancelled += 1
+            heapq.heappush(runways, (free_at, runway))
+            continue
+        waits.append(wait)
+        busy += occupancy
+        last = max(last, free_at + occupancy)
+        heapq.heappush(runways, (free_at + occupancy, runway))
+
+    waits.sort()
+    span = (last - start) * runway_count
+    if closed_runway >= 0:
+        span -= max(0.0, min(closed_until, last) - max(closed_from, start))
+    return (
+        sum(waits) / len(waits) / 60 if waits else 0.0,
+        percentile(waits, 95) / 60,
+        max_queue,
+        busy / span if span > 0 else 0.0,
+        cancelled,
+        len(waits),
+    )
+
+
+# ---------------- PARALLEL DRIVER ----------------
+_STATE = None
+_GRAPH = None
+
+
+def _init_worker(state):
+    global _STATE, _GRAPH
+    _STATE = state
+    _GRAPH = _graph(state)
+
+
+def _run_batch(scenario, seeds):
+    return [run_scenario(_STATE, scenario, seed, _GRAPH) for seed in seeds]
+
+
+def _run_state_batch(state, scenario, seeds):
+    graph = _graph(state)
+    return [run_scenario(state, scenario, seed, graph) for seed in seeds]
+
+
+def run_what_if(state, runs=1000, scenario=None, workers=None, seed=0, pool=None):
+    """Run ``runs`` seeded scenarios over a compact_state; returns a WhatIfReport.
+
+    Runs are split into a few batches per worker so each task is large and
+    results (one small tuple per run) are cheap to send back. Without
+    ``pool`` a pool of ``workers`` processes is started for this call and
+    the state is shipped to each worker once; ``workers=1`` runs
+    in-process. A long-lived ``pool`` (e.g. shared by API requests) is
+    reused instead, with the state sent along with each batch, and
+    ``workers`` should be its size.
+    """
+    scenario = scenario or Scenario()
+    workers = workers or os.cpu_count() or 1
+    seeds = [seed + i for i in range(runs)]
+    started = time.perf_counter()
+    if pool is None and (workers == 1 or runs < 2):
+        graph = _graph(state)
+        results = [run_scenario(state, scenario, s, graph) for s in seeds]
+    else:
+        size = max(1, math.ceil(runs / (workers * 4)))
+        batches = [seeds[i:i + size] for i in range(0, runs, size)]
+        results = []
+        if pool is not None:
+            for batch in pool.map(_run_state_batch, repeat(state), repeat(scenario), batches):
+                results.extend(batch)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as pool:
+                for batch in pool.map(_run_batch, [scenario] * len(batches), batches):
+                    results.extend(batch)
+    return WhatIfReport(results, time.perf_counter() - started)
+
+
+def _graph(state):
+    graph = defaultdict(list)
+    for source, destination, distance in state['routes']:
+        graph[source].append((destination, distance))
+        graph[destination].append((source, distance))
+    return graph
+
+
+if __name__ == "__main__":
+    from AirportManagementSystem import AirportManagementSystem
+    from Metrics import quiet_logging
+
+    with quiet_logging():
+        system = AirportManagementSystem(runway_count=4, runway_occupancy=timedelta(minutes=2))
+        rng = random.Random(0)
+        base = system.clock().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        for i in range(1500):
+            system.add_flight_at(f"WI{i}", rng.choice(["LAX", "LHR", "SFO", "CDG", "NRT", "FRA"]),
+                                 base + timedelta(seconds=rng.randrange(86400)), rng.random() < 0.02)
+        system.schedule_flights()
+    state = compact_state(system)
+    for workers in sorted({1, os.cpu_count() or 1}):
+        print(f"workers={workers}", run_what_if(state, runs=200, workers=workers).summary())
@@ -4,8 +4,20 @@ A modular implementation demonstrating Data Structures and Algorithms.
 """
 
 from .Flight import Flight
+from .FlightIndex import FlightIndex
+from .FlightQueue import FlightQueue
+from .HistoryStore import HistoryStore
 from .Runway import Runway
+from .RunwayPool import RunwayPool
+from .RunwayPlanner import RunwayPlanner
+from .RunwayAssignment import AssignmentCosts, assign_runways
 from .AirportGraph import AirportGraph
+from .CSRGraph import CSRGraph
+from .RouteCache import RouteCache
+from .Timetable import Timetable
+from .LandmarkRouter import LandmarkRouter
+from .ChangeFeed import ChangeFeed
+from .Metrics import REGISTRY, configure_logging
 from .AirportManagementSystem import AirportManagementSystem
 
 __version__ = "1.0.0"
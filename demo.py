@@ -1,7 +1,9 @@
 from AirportManagementSystem import AirportManagementSystem
 from datetime import datetime, timedelta
+from Metrics import configure_logging
 
 def main():
+    configure_logging()  # show system messages on the console
     ams = AirportManagementSystem()
 
     print("\n--- Adding Flights ---")
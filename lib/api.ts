@@ -16,8 +16,20 @@ export type ScheduledFlight = {
 }
 
 export type FlightsResponse = { data: ScheduledFlight[] }
+export type FlightsPage = FlightsResponse & { next_cursor: string | null }
+export type FlightQuery = {
+  cursor?: string
+  limit?: number
+  status?: string
+  destination?: string
+  emergency?: boolean
+  departure_from?: string
+  departure_to?: string
+}
 export type StatusResponse = { status: string }
 export type CancelledResponse = { cancelled_list: string[] }
+export type RouteResult = { src: string; dest: string; Path: string[] | null; Distance: number | null }
+export type RoutesBatchResponse = { data: RouteResult[] }
 
 // Default to Next.js rewrite prefix to avoid CORS in dev
 const fallbackBase = "/api"
@@ -45,6 +57,19 @@ async function apiFetch<T>(path: string, init?: RequestInit): Promise<T> {
 
 export const getFlights = () => apiFetch<FlightsResponse>("/flights/list_scheduled_flights")
 
+function toQueryString(query: FlightQuery) {
+  const params = new URLSearchParams()
+  for (const [key, value] of Object.entries(query)) {
+    if (value !== undefined && value !== null && value !== "") params.set(key, String(value))
+  }
+  const qs = params.toString()
+  return qs ? `?${qs}` : ""
+}
+
+// Cursor-paginated, server-filtered listing; pass next_cursor back to get the next page
+export const getFlightsPage = (query: FlightQuery = {}) =>
+  apiFetch<FlightsPage>(`/flights/list_scheduled_flights${toQueryString({ limit: 50, ...query })}`)
+
 export const addFlight = (data: AddFlightPayload) =>
   apiFetch<StatusResponse>("/flights/add_flight", {
     method: "POST",
@@ -65,4 +90,45 @@ export const addRoute = (data: { src: string; dest: string; distance: number })
     body: JSON.stringify(data),
   })
 
+export const findRoutesBatch = (pairs: { src: string; dest: string }[]) =>
+  apiFetch<RoutesBatchResponse>("/route/find_routes_batch", {
+    method: "POST",
+    body: JSON.stringify({ pairs }),
+  })
+
 export const assignRunway = () => apiFetch<StatusResponse>("/flights/assign_runway")
+
+// Live updates over Server-Sent Events; replaces polling the list endpoints.
+// The first event is a full "snapshot" (also resent if the client falls too far behind),
+// then incremental events. EventSource resumes with Last-Event-ID on reconnect.
+export type RunwayState = { runway_no: number; flight_no: string | null }
+export type ChangeEvent =
+  | { type: "snapshot"; id: number; data: { runways: RunwayState[]; cancelled_list: string[]; scheduled: ScheduledFlight[] } }
+  | { type: "flight_added" | "cancellation_undone" | "flight_escalated"; id: number; data: ScheduledFlight }
+  | { type: "flights_added"; id: number; data: ScheduledFlight[] }
+  | { type: "runway_assigned" | "runway_released"; id: number; data: { runway_no: number; flight_number: string } }
+  | { type: "flight_cancelled"; id: number; data: { flight_number: string; runway_no: number | null } }
+  | { type: "route_added"; id: number; data: { src: string; dest: string; distance: number } }
+
+const changeEventTypes: ChangeEvent["type"][] = [
+  "snapshot",
+  "flight_added",
+  "flights_added",
+  "runway_assigned",
+  "runway_released",
+  "flight_cancelled",
+  "cancellation_undone",
+  "flight_escalated",
+  "route_added",
+]
+
+export function subscribeChanges(onEvent: (event: ChangeEvent) => void, since?: number) {
+  const source = new EventSource(`${API_BASE_URL}/changes/stream${since !== undefined ? `?since=${since}` : ""}`)
+  for (const type of changeEventTypes) {
+    source.addEventListener(type, (e) => {
+      const message = e as MessageEvent<string>
+      onEvent({ type, id: Number(message.lastEventId), data: JSON.parse(message.data) } as ChangeEvent)
+    })
+  }
+  return () => source.close()
+}
@@ -1,8 +1,10 @@
 from AirportManagementSystem import AirportManagementSystem
 from datetime import datetime, timedelta
+from Metrics import configure_logging
 
 def main():
     """Main function with menu-driven interface."""
+    configure_logging()  # show system messages on the console
     system = AirportManagementSystem()
     
     print("🛫 Welcome to Airport Management System")
@@ -26,7 +28,10 @@ def main():
             destination = input("Enter destination airport: ").strip().upper()
             departure_time = input("Enter departure time (HH:MM): ").strip()
             is_emergency = input("Is this an emergency flight? (y/n): ").strip().lower() == 'y'
-            system.add_flight(flight_number, destination, departure_time, is_emergency)
+            try:
+                system.add_flight(flight_number, destination, departure_time, is_emergency)
+            except ValueError as e:
+                print(f"❌ {e}")
         
         elif choice == "2":
             system.schedule_flights()
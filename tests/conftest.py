@@ -0,0 +1,31 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Modules live flat at the repository root and are imported by bare name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+START = datetime(2025, 1, 1, 8, 0)
+
+
+class Clock:
+    """A clock the test moves by hand: set ``now`` to let time pass."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def start():
+    """The moment every test's clock starts at."""
+    return START
+
+
+@pytest.fixture
+def clock(start):
+    return Clock(start)
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from AirportGraph import AirportGraph
+from Benchmarks.Workload import random_graph, random_queries
+from Metrics import quiet_logging
+
+
+def _random_graph(seed, airports=9, routes=18):
+    rng = random.Random(seed)
+    graph = AirportGraph()
+    names = [f"A{i}" for i in range(airports)]
+    with quiet_logging():
+        for _ in range(routes):
+            source, destination = rng.sample(names, 2)
+            graph.add_route(source, destination, rng.randint(1, 9))
+    return graph, names
+
+
+def _all_simple_paths(graph, start, destination, closed=(), closed_routes=()):
+    closed_routes = {frozenset(route) for route in closed_routes}
+    found = {}
+
+    def walk(path, cost):
+        airport = path[-1]
+        if airport == destination:
+            key = tuple(path)
+            found[key] = min(found.get(key, float('inf')), cost)
+            return
+        for neighbor, weight in graph.graph[airport]:
+            if neighbor in path or neighbor in closed or frozenset((airport, neighbor)) in closed_routes:
+                continue
+            walk(path + [neighbor], cost + weight)
+
+    if start not in closed and destination not in closed:
+        walk([start], 0)
+    return sorted(found.values())
+
+
+def test_shortest_route_and_unknown_airports():
+    graph = AirportGraph()
+    with quiet_logging():
+        for source, destination, distance in [('JFK', 'LAX', 5), ('JFK', 'LHR', 7), ('LHR', 'CDG', 1)]:
+            graph.add_route(source, destination, distance)
+    assert graph.find_shortest_route('LAX', 'CDG') == (['LAX', 'JFK', 'LHR', 'CDG'], 13)
+    assert graph.find_shortest_route('LAX', 'XXX') == (None, float('inf'))
+
+
+def test_batch_matches_single_queries():
+    graph, names = _random_graph(1)
+    pairs = [(a, b) for a in names for b in names] + [('A0', 'XXX')]
+    assert [d for _, d in graph.find_routes_batch(pairs)] == [graph.find_shortest_route(a, b)[1] for a, b in pairs]
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_k_shortest_routes_match_brute_force(seed):
+    graph, names = _random_graph(seed)
+    rng = random.Random(seed)
+    for _ in range(5):
+        start, destination = rng.sample(names, 2)
+        closed = set(rng.sample([n for n in names if n not in (start, destination)], 1))
+        closed_routes = [tuple(rng.sample(names, 2))]
+        expected = _all_simple_paths(graph, start, destination, closed, closed_routes)[:4]
+        routes = graph.find_k_shortest_routes(start, destination, 4, closed, closed_routes)
+        assert [cost for _, cost in routes] == expected
+        for path, cost in routes:
+            assert path[0] == start and path[-1] == destination
+            assert len(set(path)) == len(path) and not closed & set(path)
+
+
+def test_k_shortest_routes_closed_endpoint_has_no_route():
+    graph, _ = _random_graph(0)
+    assert graph.find_k_shortest_routes('A0', 'A1', 3, excluded_airports=['A1']) == []
+
+
+def _expected(graph, pairs):
+    return [graph.find_shortest_route(start, destination) for start, destination in pairs]
+
+
+def test_routes_batch_matches_single_queries():
+    graph = random_graph(200, seed=21)
+    pairs = random_queries(graph, 120, seed=22) + [('N0', 'NOPE'), ('NOPE', 'N0')]
+    results = graph.find_routes_batch(pairs)
+    assert [d for _, d in results] == [d for _, d in _expected(graph, pairs)]
+    assert results[-2:] == [(None, float('inf'))] * 2
+    for (start, destination), (path, _) in zip(pairs, results):
+        if path:
+            assert path[0] == start and path[-1] == destination
+
+
+def test_routes_batch_in_worker_processes():
+    graph = random_graph(150, seed=23)
+    pairs = random_queries(graph, 60, seed=24)
+    assert graph.find_routes_batch(pairs, max_workers=2) == graph.find_routes_batch(pairs)
+
+
+def test_k_must_be_positive():
+    graph, names = _random_graph(1)
+    with pytest.raises(ValueError):
+        graph.find_k_shortest_routes(names[0], names[1], 0)
+    assert len(graph.find_k_shortest_routes(names[0], names[1], 1)) <= 1
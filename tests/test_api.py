@@ -0,0 +1,122 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+pytest.importorskip('fastapi')
+pytest.importorskip('httpx')
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from AirportManagementSystem import AirportManagementSystem  # noqa: E402
+from BackEnd_Api import API  # noqa: E402
+from BackEnd_Api import CommandProcessor as commands  # noqa: E402
+from BackEnd_Api import ShardDispatcher as shard  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def client():
+    with TestClient(API.app) as client:
+        yield client
+
+
+def _add(client, number, time_str='23:59', emergency=False):
+    response = client.post('/flights/add_flight', json={'flight_no': number, 'destination': 'LAX',
+                                                        'time_str': time_str, 'is_emergency': emergency})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('cursor', ['garbage', '1|2', 'x|2025-01-01T08:00:00|F1', '1|2025-13-01|F1'])
+def test_malformed_queue_cursor_is_a_client_error(client, cursor):
+    response = client.get('/flights/list_scheduled_flights', params={'cursor': cursor, 'limit': 2})
+    assert response.status_code == 400
+
+
+def test_queue_pages_follow_next_cursor(client):
+    for i in range(5):
+        _add(client, f"PG{i}")
+    numbers, cursor = [], None
+    while True:
+        params = {'limit': 2, 'destination': 'LAX'}
+        if cursor:
+            params['cursor'] = cursor
+        body = client.get('/flights/list_scheduled_flights', params=params).json()
+        numbers.extend(f['flight_number'] for f in body['data'])
+        cursor = body['next_cursor']
+        if cursor is None:
+            break
+    assert {f"PG{i}" for i in range(5)} <= set(numbers)
+    assert len(numbers) == len(set(numbers))
+
+
+def test_unchanged_listing_revalidates_with_304(client):
+    first = client.get('/flights/cancelled_list')
+    assert first.status_code == 200
+    again = client.get('/flights/cancelled_list', headers={'If-None-Match': first.headers['etag']})
+    assert again.status_code == 304
+
+
+def test_route_batch_answers_each_pair(client):
+    pairs = [{'src': 'JFK', 'dest': 'LAX'}, {'src': 'JFK', 'dest': 'NOPE'}, {'src': 'JFK', 'dest': 'LAX'}]
+    response = client.post('/route/find_routes_batch', json={'pairs': pairs})
+    assert response.status_code == 200
+    rows = response.json()['data']
+    assert [(row['src'], row['dest']) for row in rows] == [(p['src'], p['dest']) for p in pairs]
+    expected = API.management_system.find_shortest_route('JFK', 'LAX')
+    assert expected[0] and rows[0]['Path'] == rows[2]['Path'] == expected[0]
+    assert rows[1]['Path'] is None and rows[1]['Distance'] is None
+
+
+def test_metrics_endpoint_exposes_prometheus_text(client):
+    client.get('/flights/list_scheduled_flights')
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    assert '# TYPE airport_waiting_flights gauge' in response.text
+
+
+def test_runway_plan_takes_wake_classes(client):
+    _add(client, 'WK1')
+    response = client.get('/runways/plan', params={'hours': 48, 'wake': 'WK1:h'})
+    assert response.status_code == 200
+    assert {s['flight_number']: s['wake'] for s in response.json()['data']}['WK1'] == 'H'
+    assert client.get('/runways/plan', params={'wake': 'WK1:X'}).status_code == 400
+
+
+def test_cancelling_an_unknown_flight_is_not_found(client):
+    _add(client, 'CX1')
+    assert client.post('/flights/cancel_flight', json={'flight_no': 'CX1'}).status_code == 200
+    assert client.post('/flights/cancel_flight', json={'flight_no': 'CX-NONE'}).status_code == 404
+
+
+def test_adding_an_active_flight_number_again_conflicts(client):
+    _add(client, 'DUP1')
+    response = client.post('/flights/add_flight', json={'flight_no': 'DUP1', 'destination': 'JFK',
+                                                        'time_str': '23:59', 'is_emergency': False})
+    assert response.status_code == 409
+
+
+def test_shard_adds_connect_only_accepted_destinations(monkeypatch):
+    # A separate app state with one shard, so shutdown only closes these objects
+    system = AirportManagementSystem(sample_routes=False, hub=None)
+    monkeypatch.setattr(API, 'management_system', system)
+    monkeypatch.setattr(API, 'processor', commands.CommandProcessor(system))
+    monkeypatch.setattr(API, 'shards', shard.open_shards(['JFK'], system.airport_graph, system.route_cache))
+    monkeypatch.setattr(API, 'what_if_pool', ProcessPoolExecutor(1))
+    with TestClient(API.app) as client:
+        body = {'flight_no': 'KL1', 'destination': ' ams ', 'time_str': '23:59', 'is_emergency': False}
+        assert client.post('/airports/JFK/flights/add_flight', json=body).status_code == 200
+        bad = dict(body, flight_no='KL2', destination='bad1', time_str='99:99')
+        assert client.post('/airports/JFK/flights/add_flight', json=bad).status_code == 400
+        rows = 'flight_no,destination,time_str\nKL3, cdg ,23:59\nKL4,bad2,99:99\nKL1,bad3,23:59\n'
+        response = client.post('/airports/JFK/flights/add_flights_bulk', content=rows,
+                               headers={'content-type': 'text/csv'})
+        assert response.json()['added'] == 1
+    assert system.find_shortest_route('JFK', 'AMS') == (['JFK', 'AMS'], 5)
+    assert 'CDG' in system.airport_graph
+    assert not any(code in system.airport_graph for code in ('BAD1', 'BAD2', 'BAD3', ' ams ', 'ams'))
+
+
+@pytest.mark.parametrize('k', [0, -1, 11, 10_000])
+def test_k_routes_are_bounded(client, k):
+    response = client.post('/route/find_k_routes', json={'src': 'JFK', 'dest': 'LAX', 'k': k})
+    assert response.status_code == 422
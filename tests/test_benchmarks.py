@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from Benchmarks.Suite import BENCHMARKS, compare, main, run_suite
+from Benchmarks.Workload import BENCH_START, random_flights, random_graph
+
+
+@pytest.mark.parametrize('distribution', ['uniform', 'peaks', 'burst'])
+def test_workloads_are_seeded(distribution):
+    flights = random_flights(200, seed=5, distribution=distribution)
+    assert flights == random_flights(200, seed=5, distribution=distribution)
+    assert flights != random_flights(200, seed=6, distribution=distribution)
+    assert all(departure > BENCH_START for _, _, departure, _ in flights)
+    assert len({number for number, _, _, _ in flights}) == 200
+    with pytest.raises(ValueError):
+        random_flights(1, distribution='weekly')
+
+
+def test_random_graph_is_seeded():
+    assert dict(random_graph(100, seed=2).graph) == dict(random_graph(100, seed=2).graph)
+
+
+def test_every_benchmark_runs_at_small_scale():
+    results = run_suite(scales=[50], repeat=1)
+    assert [r['benchmark'] for r in results] == list(BENCHMARKS)
+    assert all(r['operations'] > 0 and r['us_per_op'] >= 0 for r in results)
+
+
+def test_compare_flags_regressions():
+    before = {'results': [{'benchmark': 'a', 'scale': 10, 'us_per_op': 1.0},
+                          {'benchmark': 'b', 'scale': 10, 'us_per_op': 1.0}]}
+    after = {'results': [{'benchmark': 'a', 'scale': 10, 'us_per_op': 1.1},
+                         {'benchmark': 'b', 'scale': 10, 'us_per_op': 2.0},
+                         {'benchmark': 'c', 'scale': 10, 'us_per_op': 9.0}]}
+    rows, regressions = compare(before, after, threshold=0.2)
+    assert [row[0] for row in rows] == ['a', 'b']
+    assert [row[0] for row in regressions] == ['b']
+
+
+def test_main_writes_and_compares_results(tmp_path, capsys):
+    output = tmp_path / 'bench.json'
+    args = ['--scales', '20', '--benchmarks', 'add_flight', 'dijkstra', '--repeat', '1']
+    assert main(args + ['--output', str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert report['environment']['seed'] == 0
+    assert {r['benchmark'] for r in report['results']} == {'add_flight', 'dijkstra'}
+    assert main(args + ['--compare', str(output), '--threshold', '1000']) == 0
+    assert 'add_flight' in capsys.readouterr().out
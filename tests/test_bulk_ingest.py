@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+import BulkIngest
+from AirportManagementSystem import AirportManagementSystem
+from BulkIngest import parse_time, parse_times, rows_from_csv, rows_from_ndjson
+
+NOW = datetime(2025, 1, 1, 8, 0, 30)
+
+TIMES = ['09:30', '9:30', ' 09:30 ', '08:00', '08:01', '00:00', '23:59', '24:00', '12:60', '9:3',
+         '+9:30', '-1:30', '1_0:00', '٠٩:٣٠', '09:30\x00', '0930', '09.30', '009:30', '', None, 930, 'ab:cd']
+
+
+def _system():
+    return AirportManagementSystem(clock=lambda: NOW)
+
+
+def test_numpy_and_plain_parsers_agree(monkeypatch):
+    with_numpy = parse_times(TIMES, NOW)
+    monkeypatch.setattr(BulkIngest, 'np', None)
+    assert parse_times(TIMES, NOW) == with_numpy
+    assert [parse_time(t, NOW) for t in TIMES] == with_numpy
+
+
+def test_times_roll_over_to_the_next_day():
+    parsed = dict(zip(TIMES, parse_times(TIMES, NOW)))
+    assert parsed['09:30'] == parsed['9:30'] == parsed[' 09:30 '] == datetime(2025, 1, 1, 9, 30)
+    assert parsed['08:00'] == datetime(2025, 1, 2, 8, 0)
+    assert parsed['08:01'] == datetime(2025, 1, 1, 8, 1)
+    for bad in ['24:00', '12:60', '9:3', '+9:30', '1_0:00', '٠٩:٣٠', '09:30\x00', '0930', '', None, 930]:
+        assert parsed[bad] is None, bad
+
+
+def test_ndjson_rows_that_are_not_objects_are_row_errors():
+    text = '{"flight_no": "AA1", "destination": "LAX", "time_str": "09:00"}\n[1,2]\n"x"\n\n{bad\n'
+    report = _system().add_flights_bulk(rows_from_ndjson(text))
+    assert report['added'] == 1
+    assert [e['row'] for e in report['errors']] == [2, 3, 5]
+    assert 'list' in report['errors'][0]['error']
+
+
+def test_non_dict_rows_passed_directly_are_rejected_per_row():
+    rows = [(1, ['AA1', 'LAX', '09:00']), (2, None), (3, {'flight_no': 'AA2', 'destination': 'LAX', 'time_str': '09:00'})]
+    report = _system().add_flights_bulk(rows)
+    assert report['added'] == 1
+    assert [e['row'] for e in report['errors']] == [1, 2]
+
+
+def test_csv_rows_report_missing_fields_duplicates_and_bad_times():
+    text = ('flight_no,destination,time_str,is_emergency\n'
+            'AA1,lax,09:00,yes\nAA1,LAX,09:00,\n,LAX,09:00,\nAA2,LAX,25:00,\n')
+    system = _system()
+    report = system.add_flights_bulk(rows_from_csv(text))
+    assert report['added'] == 1
+    assert [e['row'] for e in report['errors']] == [2, 3, 4]
+    assert system.flight_queue[0].is_emergency
+
+
+@pytest.mark.parametrize('destination', ['bos', ' Bos ', 'BOS'])
+def test_bulk_and_single_adds_build_the_same_routes(destination):
+    single, bulk = _system(), _system()
+    single.add_flight('AA1', destination, '9:30')
+    bulk.add_flights_bulk([(1, {'flight_no': 'AA1', 'destination': destination, 'time_str': '9:30'})])
+    assert dict(single.airport_graph.graph) == dict(bulk.airport_graph.graph)
+    assert single.flight_queue[0].destination == bulk.flight_queue[0].destination == 'BOS'
+    assert single.flight_queue[0].departure_time == bulk.flight_queue[0].departure_time
+
+
+def test_single_add_rejects_what_bulk_rejects():
+    system = _system()
+    system.add_flight('AA1', 'LAX', '+9:30')
+    system.add_flight('AA2', 'LAX', '24:00')
+    assert system.flight_queue == []
+    assert parse_time('23:59', NOW) - NOW < timedelta(days=1)
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from datetime import timedelta
+
+from AirportManagementSystem import AirportManagementSystem
+from ChangeFeed import ChangeFeed, encode_event
+
+
+def _events(chunk):
+    events = []
+    for frame in chunk.decode().split('\n\n'):
+        if frame.startswith('id: '):
+            lines = dict(line.split(': ', 1) for line in frame.split('\n'))
+            events.append((int(lines['id']), lines['event'], json.loads(lines['data'])))
+    return events
+
+
+def test_encode_event_is_an_sse_frame():
+    assert encode_event(3, 'ping', {'a': 1}) == b'id: 3\nevent: ping\ndata: {"a":1}\n\n'
+
+
+def test_since_replays_missed_frames_or_asks_for_a_reload():
+    feed = ChangeFeed(capacity=3)
+    assert feed.since(0) == []
+    for i in range(5):
+        assert feed.publish('tick', {'i': i}) == i + 1
+    assert len(feed) == 3
+    assert [e[0] for e in _events(b''.join(feed.since(2)))] == [3, 4, 5]
+    assert [e[0] for e in _events(b''.join(feed.since(4)))] == [5]
+    assert feed.since(5) == []
+    assert feed.since(1) is None  # frame 2 has been dropped
+
+
+def test_wait_wakes_on_publish_and_times_out():
+    async def scenario():
+        feed = ChangeFeed()
+        assert not await feed.wait(0, timeout=0.01)
+        waiters = [asyncio.create_task(feed.wait(0, timeout=5)) for _ in range(3)]
+        await asyncio.sleep(0)
+        feed.publish('tick', {})
+        return await asyncio.gather(*waiters)
+
+    assert asyncio.run(scenario()) == [True, True, True]
+
+
+def test_stream_resumes_or_starts_from_a_snapshot():
+    async def take(feed, sequence, count, publish=()):
+        stream = feed.stream(sequence, snapshot=lambda: ('state', {'full': True}), heartbeat=0.01)
+        chunks = [await stream.__anext__() for _ in range(count)]
+        for kind in publish:
+            feed.publish(kind, {})
+        if publish:
+            chunks.append(await stream.__anext__())
+        await stream.aclose()
+        return [event for chunk in chunks for event in _events(chunk)]
+
+    feed = ChangeFeed(capacity=2)
+    for kind in ('a', 'b', 'c'):
+        feed.publish(kind, {})
+    assert asyncio.run(take(feed, 1, 1)) == [(2, 'b', {}), (3, 'c', {})]
+    assert asyncio.run(take(feed, 0, 1)) == [(3, 'state', {'full': True})]
+    assert asyncio.run(take(feed, None, 1, publish=['d'])) == [(3, 'state', {'full': True}), (4, 'd', {})]
+    assert asyncio.run(take(feed, 4, 1)) == []  # only a keepalive while idle
+
+
+def test_system_publishes_state_changes(start, clock):
+    system = AirportManagementSystem(runway_count=1, clock=clock, sample_routes=False, hub=None)
+    system.changes = ChangeFeed()
+    system.add_flight_at('AA1', 'LAX', start + timedelta(minutes=5))
+    system.schedule_flights()
+    system.allocate_runways(show_runways=False)
+    kinds = [kind for _, kind, _ in _events(b''.join(system.changes.since(0)))]
+    assert kinds[0] == 'flight_added' and kinds[-1] == 'runway_assigned'
+    assert _events(system.changes.since(0)[-1])[0][2] == {'runway_no': 1, 'flight_number': 'AA1'}
@@ -0,0 +1,113 @@
+import asyncio
+
+from AirportManagementSystem import AirportManagementSystem
+from BackEnd_Api import CommandProcessor as commands
+
+
+def _system():
+    return AirportManagementSystem(runway_count=2, sample_routes=False, hub=None)
+
+
+def test_batch_schedules_and_allocates_once():
+    async def scenario():
+        processor = commands.CommandProcessor(_system())
+        task = processor.start()
+        await asyncio.gather(
+            processor.submit(commands.add_flight, 'AA1', 'LAX', '23:59', False),
+            processor.submit(commands.add_flight, 'AA2', 'LAX', '23:58', True),
+            processor.submit(commands.allocate_runways),
+        )
+        task.cancel()
+        return processor
+
+    processor = asyncio.run(scenario())
+    assert sorted(name for _, name in processor.snapshot.runways) == ['AA1', 'AA2']
+    assert processor.version >= 1
+
+
+def test_command_error_is_raised_to_its_caller_only():
+    def boom(system):
+        raise ValueError('boom')
+
+    async def scenario():
+        processor = commands.CommandProcessor(_system())
+        task = processor.start()
+        results = await asyncio.gather(
+            processor.submit(boom),
+            processor.submit(commands.add_flight, 'AA1', 'LAX', '23:59', False),
+            return_exceptions=True,
+        )
+        task.cancel()
+        return results
+
+    error, ok = asyncio.run(scenario())
+    assert isinstance(error, ValueError)
+    assert ok is True
+
+
+def test_cancelled_caller_does_not_stop_the_processor():
+    async def scenario():
+        processor = commands.CommandProcessor(_system())
+        task = processor.start()
+        waiter = asyncio.create_task(processor.submit(commands.add_flight, 'AA1', 'LAX', '23:59', False))
+        await asyncio.sleep(0)  # the command is queued, not yet applied
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.wait_for(processor.submit(commands.add_flight, 'AA2', 'LAX', '23:59', False), 1)
+        alive = not task.done()
+        task.cancel()
+        return processor.system, alive
+
+    system, alive = asyncio.run(scenario())
+    assert alive
+    assert 'AA2' in system.scheduled_flights
+
+
+def test_batch_failure_fails_the_batch_and_keeps_serving():
+    class FailingJournal:
+        fail = True
+
+        def append(self, op, args):
+            pass
+
+        def sync(self):
+            if self.fail:
+                self.fail = False
+                raise OSError('disk full')
+
+    async def scenario():
+        system = _system()
+        system.journal = FailingJournal()
+        processor = commands.CommandProcessor(system)
+        task = processor.start()
+        first = await asyncio.gather(processor.submit(commands.add_flight, 'AA1', 'LAX', '23:59', False),
+                                     return_exceptions=True)
+        second = await asyncio.wait_for(processor.submit(commands.add_flight, 'AA2', 'LAX', '23:59', False), 1)
+        task.cancel()
+        return first[0], second
+
+    first, second = asyncio.run(scenario())
+    assert isinstance(first, OSError)
+    assert second is True
+
+
+def test_cancel_sees_a_flight_added_earlier_in_the_batch():
+    async def scenario():
+        processor = commands.CommandProcessor(_system())
+        task = processor.start()
+        results = await asyncio.gather(
+            processor.submit(commands.add_flight, 'AA1', 'LAX', '23:59', False),
+            processor.submit(commands.add_flight, 'AA2', 'LAX', '23:58', False),
+            processor.submit(commands.cancel_flight, 'AA1'),
+            processor.submit(commands.plan_runways, 24),
+            processor.submit(commands.cancel_flight, 'NOPE'),
+        )
+        task.cancel()
+        return processor, results
+
+    processor, (_, _, cancelled, plan, missing) = asyncio.run(scenario())
+    assert processor.version == 1  # all five commands ran as one batch
+    assert (cancelled, missing) == (True, False)
+    assert processor.snapshot.cancelled == ('AA1',)
+    assert [f.flight_number for f in processor.system.scheduled_flights] == ['AA2']
+    assert [slot['flight_number'] for slot in plan] == ['AA2']
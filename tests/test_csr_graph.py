@@ -0,0 +1,104 @@
+import random
+
+import pytest
+
+from AirportGraph import AirportGraph
+from AirportManagementSystem import AirportManagementSystem
+from CSRGraph import CSRGraph
+from Metrics import quiet_logging
+
+EDGES = [('JFK', 'LAX', 5), ('JFK', 'LHR', 7), ('LAX', 'SFO', 1), ('LHR', 'CDG', 1), ('SFO', 'NRT', 10),
+         ('CDG', 'FRA', 1), ('LAX', 'LHR', 1)]
+
+
+def _pair(seed, airports=12, routes=30):
+    rng = random.Random(seed)
+    edges = {}
+    while len(edges) < routes:
+        a, b = sorted(rng.sample(range(airports), 2))
+        edges[(f"A{a}", f"A{b}")] = rng.randint(1, 9)
+    graph = AirportGraph()
+    with quiet_logging():
+        for (a, b), distance in edges.items():
+            graph.add_route(a, b, distance)
+    return graph, CSRGraph.from_edges((a, b, d) for (a, b), d in edges.items())
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_k_shortest_routes_match_airport_graph(seed):
+    graph, csr = _pair(seed)
+    rng = random.Random(seed)
+    names = list(graph.graph)
+    for _ in range(6):
+        start, destination = rng.sample(names, 2)
+        closed = rng.sample([n for n in names if n not in (start, destination)], 2)
+        expected = graph.find_k_shortest_routes(start, destination, 5, closed, [(start, names[0])])
+        got = csr.find_k_shortest_routes(start, destination, 5, closed, [(start, names[0])])
+        assert [d for _, d in got] == [d for _, d in expected]
+
+
+def test_system_alternative_routes_with_csr_backend():
+    system = AirportManagementSystem(airport_graph=CSRGraph.from_edges(EDGES), sample_routes=False)
+    routes = system.find_alternative_routes('JFK', 'CDG', 3)
+    assert routes == [(['JFK', 'LAX', 'LHR', 'CDG'], 7), (['JFK', 'LHR', 'CDG'], 8)]
+    system.add_route('JFK', 'CDG', 9)  # overlay edges are seen too
+    assert [d for _, d in system.find_alternative_routes('JFK', 'CDG', 3)] == [7, 8, 9]
+    assert system.find_alternative_routes('JFK', 'XXX') == []
+
+
+def test_from_edges_merges_parallel_routes():
+    csr = CSRGraph.from_edges([('A', 'B', 5), ('B', 'A', 3), ('A', 'A', 1), ('B', 'C', 2)])
+    assert len(csr) == 3
+    assert sorted(csr.edges()) == [('A', 'B', 3), ('B', 'C', 2)]
+    assert csr.find_shortest_route('A', 'C') == (['A', 'B', 'C'], 5)
+    assert csr.find_shortest_route('A', 'XXX') == (None, float('inf'))
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_shortest_routes_match_airport_graph(seed):
+    graph, csr = _pair(seed)
+    for start in graph.graph:
+        distances, previous = csr.shortest_path_tree(start)
+        assert (distances, previous) == graph.shortest_path_tree(start)
+        for destination in graph.graph:
+            assert csr.find_shortest_route(start, destination)[1] == graph.find_shortest_route(start, destination)[1]
+
+
+def test_overlay_routes_are_visible_and_compacted():
+    csr = CSRGraph.from_edges(EDGES)
+    csr.add_route('NRT', 'FRA', 2)
+    csr.add_route('NRT', 'SYD', 4)
+    assert csr.find_shortest_route('SFO', 'SYD') == (['SFO', 'LAX', 'LHR', 'CDG', 'FRA', 'NRT', 'SYD'], 10)
+    before = sorted(csr.edges())
+    csr.compact()
+    assert not csr._overlay
+    assert sorted(csr.edges()) == before
+    assert csr.find_shortest_route('JFK', 'NRT')[1] == 10
+
+
+def test_save_and_load_round_trip(tmp_path):
+    csr = CSRGraph.from_edges(EDGES)
+    csr.add_route('NRT', 'SYD', 4)
+    path = tmp_path / 'routes.csr'
+    csr.save(path)
+    loaded = CSRGraph.load(path)
+    assert loaded.codes == csr.codes
+    assert sorted(loaded.edges()) == sorted(csr.edges())
+    assert loaded.find_shortest_route('JFK', 'SYD') == csr.find_shortest_route('JFK', 'SYD')
+    (tmp_path / 'other.bin').write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        CSRGraph.load(tmp_path / 'other.bin')
+
+
+def test_from_csv_reads_plain_and_openflights_rows(tmp_path):
+    plain = tmp_path / 'routes.csv'
+    plain.write_text('source,destination,distance\nJFK,LAX,5\nLAX,SFO,1\n')
+    assert sorted(CSRGraph.from_csv(plain).edges()) == [('JFK', 'LAX', 5.0), ('LAX', 'SFO', 1.0)]
+
+    airports = tmp_path / 'airports.dat'
+    airports.write_text('1,"A","A","X","AAA","AAAA",0.0,0.0\n2,"B","B","X","BBB","BBBB",0.0,1.0\n')
+    routes = tmp_path / 'routes.dat'
+    routes.write_text('XX,1,AAA,1,BBB,2,,0,320\nXX,1,AAA,1,CCC,3,,0,320\n')
+    csr = CSRGraph.from_csv(routes, airports, default_distance=7)
+    assert csr.find_shortest_route('AAA', 'BBB')[1] == pytest.approx(111.19, abs=0.1)
+    assert csr.find_shortest_route('AAA', 'CCC')[1] == 7
@@ -0,0 +1,72 @@
+import random
+from datetime import timedelta
+
+from AirportManagementSystem import AirportManagementSystem
+from Flight import Flight
+from FlightIndex import FlightIndex
+
+
+def _flight(start, number, minutes, destination='LAX'):
+    return Flight(number, destination, start + timedelta(minutes=minutes))
+
+
+def test_range_queries_match_a_linear_scan(start):
+    rng = random.Random(3)
+    index = FlightIndex()
+    flights = {}
+    for i in range(300):
+        flight = _flight(start, f"F{i % 120}", rng.randrange(600), rng.choice(['LAX', 'JFK', 'LHR']))
+        flights[flight.flight_number] = flight  # re-adding a number replaces it
+        if i % 3:
+            index.add(flight)
+        else:
+            index.add_many([flight])
+    for _ in range(50):
+        low, high = sorted(start + timedelta(minutes=rng.randrange(600)) for _ in range(2))
+        destination = rng.choice([None, 'LAX', 'JFK', 'SYD'])
+        expected = sorted((f for f in flights.values()
+                           if low <= f.departure_time < high and destination in (None, f.destination)),
+                          key=lambda f: (f.departure_time, f.flight_number))
+        assert index.departing_between(low, high, destination) == expected
+    assert len(index) == len(flights)
+    assert len(index.destination('LAX')) == sum(f.destination == 'LAX' for f in flights.values())
+
+
+def test_departed_flights_keep_only_their_history_row(start):
+    index = FlightIndex()
+    flight = _flight(start, 'F1', 5)
+    index.add(flight)
+    index.depart(_flight(start, 'F1', 5), 9)  # a different object with the same number is ignored
+    assert index.get('F1') is flight
+    index.depart(flight, 7)
+    assert index.get('F1') == 7 and 'F1' in index
+    assert index.departing_between() == []
+    index.add_departed('F1', 8)
+    index.add_departed('F2', 4)
+    assert (index.get('F1'), index.get('F2')) == (8, 4)
+    index.add(_flight(start, 'F2', 1))
+    index.add_departed('F2', 5)  # an active flight wins over a departed row
+    assert index.get('F2').departure_time == start + timedelta(minutes=1)
+    assert index.get('NOPE') is None
+
+
+def test_system_locates_flights_through_their_lifecycle(start, clock):
+    system = AirportManagementSystem(runway_count=1, clock=clock, sample_routes=False, hub=None)
+    system.add_flight_at('AA1', 'LAX', start + timedelta(minutes=5))
+    system.add_flight_at('AA2', 'JFK', start + timedelta(minutes=10))
+    system.add_flight_at('AA3', 'LAX', start + timedelta(minutes=20))
+    assert system.locate_flight('AA1')['location'] == 'incoming queue'
+    system.schedule_flights()
+    assert system.locate_flight('AA2')['location'] == 'scheduled queue'
+    system.allocate_runways(show_runways=False)
+    assert system.locate_flight('AA1')['location'] == 'runway 1'
+    system.cancel_flight('AA3')
+    assert system.locate_flight('AA3')['location'] == 'cancellation log'
+    assert [f.flight_number for f in system.flights_departing_between(destination='LAX')] == ['AA1', 'AA3']
+
+    clock.now = start + timedelta(minutes=6)
+    system.allocate_runways(show_runways=False)
+    departed = system.locate_flight('AA1')
+    assert (departed['location'], departed['status'], departed['assigned_runway_no']) == ('departed', 'Departed', 1)
+    assert [f.flight_number for f in system.flights_departing_between()] == ['AA2', 'AA3']
+    assert system.locate_flight('ZZ9') is None
@@ -0,0 +1,144 @@
+from datetime import timedelta
+
+import pytest
+
+from AirportManagementSystem import AirportManagementSystem
+from Flight import Flight
+from FlightQueue import FlightQueue, decode_cursor, encode_cursor, sort_key
+
+
+def _flights(start, count):
+    return [Flight(f"F{i:03d}", 'LAX', start + timedelta(minutes=i % 7), i % 5 == 0) for i in range(count)]
+
+
+def test_cursor_round_trip(start):
+    for flight in _flights(start, 10):
+        key = sort_key(flight)
+        assert decode_cursor(encode_cursor(key)) == key
+    assert encode_cursor(None) is None
+    assert decode_cursor(None) is None and decode_cursor('') is None
+
+
+@pytest.mark.parametrize('cursor', ['x', '1|2', 'a|2025-01-01T08:00:00|F1', '1|not-a-date|F1',
+                                    '1|2025-01-01T08:00:00+00:00|F1'])
+def test_malformed_cursors_raise_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_pages_cover_the_queue_in_priority_order(start):
+    system = AirportManagementSystem(sample_routes=False, hub=None)
+    flights = _flights(start, 23)
+    for f in flights:
+        system.scheduled_flights.push(f)
+    seen = []
+    cursor = None
+    while True:
+        page, key = system.list_scheduled(decode_cursor(cursor), limit=5)
+        seen.extend(f.flight_number for f in page)
+        cursor = encode_cursor(key)
+        if cursor is None:
+            break
+    assert seen == [f.flight_number for f in sorted(flights, key=sort_key)]
+
+
+def _check_heap(queue):
+    heap = queue._heap
+    for i in range(1, len(heap)):
+        assert not heap[i] < heap[(i - 1) // 2]
+    assert all(heap[position].flight_number == number for number, position in queue._index.items())
+    assert len(queue._index) == len(heap)
+
+
+def test_operations_match_a_sorted_reference(start):
+    import random
+
+    rng = random.Random(0)
+    queue = FlightQueue()
+    reference = {}
+    for step in range(2000):
+        action = rng.random()
+        if action < 0.45:
+            f = Flight(f"F{rng.randrange(300)}", 'LAX', start + timedelta(minutes=rng.randrange(500)),
+                       rng.random() < 0.1)
+            queue.push(f)
+            reference[f.flight_number] = f
+        elif action < 0.65 and reference:
+            number = rng.choice(sorted(reference))
+            assert queue.remove(number) is reference.pop(number)
+        elif action < 0.8 and reference:
+            number = rng.choice(sorted(reference))
+            f = reference[number]
+            f.priority = 1
+            f.departure_time -= timedelta(minutes=rng.randrange(60))
+            assert queue.update(number)
+        elif reference:
+            best = min(reference.values(), key=sort_key)
+            popped = queue.pop()
+            assert sort_key(popped)[:2] == sort_key(best)[:2]
+            del reference[popped.flight_number]
+        if step % 100 == 0:
+            _check_heap(queue)
+        assert len(queue) == len(reference)
+    assert [f.flight_number for f in queue.smallest(len(reference))] == \
+        [f.flight_number for f in sorted(reference.values(), key=sort_key)]
+
+
+def test_missing_numbers_and_empty_queue():
+    queue = FlightQueue()
+    assert queue.pop() is None and queue.peek() is None
+    assert queue.remove('NOPE') is None
+    assert not queue.update('NOPE')
+    assert queue.get('NOPE') is None
+
+
+def test_push_replaces_a_queued_flight_with_the_same_number(start):
+    queue = FlightQueue(_flights(start, 3))
+    replacement = Flight('F001', 'SFO', start, True)
+    queue.push(replacement)
+    assert len(queue) == 3
+    assert queue.get('F001') is replacement
+    assert queue.peek().priority == 1
+
+
+def test_smallest_and_iteration_do_not_modify_the_queue(start):
+    flights = _flights(start, 12)
+    queue = FlightQueue(flights)
+    expected = [f.flight_number for f in sorted(flights, key=sort_key)]
+    assert [f.flight_number for f in queue.smallest(4)] == expected[:4]
+    assert [f.flight_number for f in queue.smallest(4, predicate=lambda f: f.priority == 2)] == \
+        [n for n in expected if not int(n[1:]) % 5 == 0][:4]
+    assert len(queue.flights()) == 12 and len(queue) == 12
+    assert [f.flight_number for f in queue.smallest(20, after=sort_key(queue.get(expected[5])))] == expected[6:]
+
+
+def test_system_allocates_cancels_and_escalates_by_number(start, clock):
+    system = AirportManagementSystem(runway_count=1, clock=clock, sample_routes=False, hub=None)
+    for i in range(4):
+        system.add_flight_at(f"AA{i}", 'LAX', start + timedelta(minutes=10 + i))
+    system.schedule_flights()
+    system.cancel_flight('AA0')
+    assert system.escalate_flight('AA3')
+    system.allocate_runways(show_runways=False)
+    assert system.flight_index.get('AA3').assigned_runway_no == 1
+    assert [f.flight_number for f in system.scheduled_flights] == ['AA1', 'AA2']
+    system.undo_cancellation()
+    assert system.scheduled_flights.peek().flight_number == 'AA0'
+
+
+def test_system_rejects_a_number_that_is_still_active(start, clock):
+    system = AirportManagementSystem(runway_count=1, clock=clock, sample_routes=False, hub=None)
+    system.add_flight_at('AA1', 'LAX', start + timedelta(minutes=5))
+    with pytest.raises(ValueError):
+        system.add_flight_at('AA1', 'JFK', start + timedelta(minutes=9))
+    system.schedule_flights()
+    with pytest.raises(ValueError):
+        system.add_flight('AA1', 'JFK', '23:00')
+    assert [f.destination for f in system.scheduled_flights] == ['LAX']
+    assert len(system.history) == 1
+
+    system.allocate_runways(show_runways=False)
+    clock.now = start + timedelta(minutes=5)
+    system.allocate_runways(show_runways=False)  # AA1 departs, freeing the number
+    system.add_flight_at('AA1', 'JFK', start + timedelta(minutes=30))
+    assert system.locate_flight('AA1')['destination'] == 'JFK'
@@ -0,0 +1,82 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+from Flight import Flight
+from HistoryStore import FlightRecord, HistoryStore
+
+
+def _flight(start, i, emergency=False):
+    return Flight(f"F{i}", ('LAX', 'JFK', 'LHR')[i % 3], start + timedelta(minutes=i), emergency)
+
+
+def _as_tuple(record):
+    return (record.flight_number, record.destination, record.departure_time, record.status,
+            bool(record.is_emergency), record.assigned_runway_no)
+
+
+def test_flight_has_no_instance_dict(start):
+    flight = _flight(start, 1)
+    assert not hasattr(flight, '__dict__')
+    with pytest.raises(AttributeError):
+        flight.gate = 'B12'
+
+
+def test_live_rows_track_the_flight_until_retired(start):
+    store = HistoryStore()
+    flight = _flight(start, 1, emergency=True)
+    row = store.append(flight)
+    assert store.row_of(flight) == row == 0
+    flight.status, flight.assigned_runway_no = 'Runway Assigned', 2
+    assert store.get(row) is flight
+    flight.status = 'Departed'
+    store.retire(flight)
+    record = store.get(row)
+    assert isinstance(record, FlightRecord)
+    assert _as_tuple(record) == ('F1', 'JFK', start + timedelta(minutes=1), 'Departed', True, 2)
+    assert store.row_of(flight) is None
+    store.retire(flight)  # a second retire is a no-op
+    assert len(store) == 1
+
+
+def test_rows_survive_freezing_into_chunks(start):
+    store = HistoryStore(chunk_size=8)
+    rng = random.Random(1)
+    flights = [_flight(start, i, emergency=rng.random() < 0.2) for i in range(100)]
+    expected = {}
+    for i, flight in enumerate(flights):
+        store.append(flight)
+        if i >= 5:
+            old = flights[i - 5]
+            old.status, old.assigned_runway_no = rng.choice([('Departed', 1 + i % 3), ('Cancelled', None)])
+            store.retire(old)
+            expected[i - 5] = _as_tuple(old)
+    assert store._chunks
+    for row, record in store.rows():
+        assert _as_tuple(record) == expected.get(row, _as_tuple(flights[row]))
+    assert [_as_tuple(r) for r in store.records(90)] == [_as_tuple(f) for f in flights[90:]]
+    assert _as_tuple(store.get(3)) == expected[3]
+    with pytest.raises(IndexError):
+        store.get(100)
+
+
+def test_late_retire_after_freeze_overrides_the_chunk(start):
+    store = HistoryStore(chunk_size=4)
+    flights = [_flight(start, i) for i in range(12)]
+    for flight in flights:
+        store.append(flight)
+    flights[11].status = 'Cancelled'
+    store.retire(flights[11])  # spills the oldest rows while F0 is still live
+    assert store._chunked_rows and store.get(0) is flights[0]
+    flights[0].status, flights[0].assigned_runway_no = 'Departed', 3
+    store.retire(flights[0])
+    assert _as_tuple(store.get(0)) == ('F0', 'LAX', start, 'Departed', False, 3)
+
+
+def test_append_record_and_unknown_status(start):
+    store = HistoryStore(chunk_size=2)
+    for i in range(6):
+        store.append_record(FlightRecord(f"R{i}", 'SFO', start, 'Diverted' if i == 4 else 'Departed', False, 1))
+    assert [r.status for r in store] == ['Departed'] * 4 + ['Diverted', 'Departed']
+    assert store.memory_bytes() > 0
@@ -0,0 +1,79 @@
+import random
+
+from AirportManagementSystem import AirportManagementSystem
+from Benchmarks.Workload import random_graph, random_queries
+from LandmarkRouter import LandmarkRouter
+from Metrics import quiet_logging
+
+
+def _close(a, b):
+    return a == b or abs(a - b) < 1e-6
+
+
+def test_alt_matches_dijkstra():
+    graph = random_graph(400, seed=3)
+    router = LandmarkRouter(graph, landmark_count=6).build()
+    for start, destination in random_queries(graph, 200, seed=4):
+        path, distance = router.find_shortest_route(start, destination)
+        assert _close(distance, graph.find_shortest_route(start, destination)[1])
+        if path:
+            assert path[0] == start and path[-1] == destination
+
+
+def test_route_added_keeps_tables_exact():
+    graph = random_graph(300, seed=5)
+    router = LandmarkRouter(graph, landmark_count=4).build()
+    rng = random.Random(6)
+    airports = list(graph.graph)
+    with quiet_logging():
+        for _ in range(40):
+            source, destination = rng.sample(airports, 2)
+            graph.add_route(source, destination, rng.uniform(1, 50))
+            router.route_added(source, destination, graph.graph[source][-1][1])
+    rebuilt = [graph.shortest_path_tree(landmark)[0] for landmark in router.landmarks]
+    for table, exact in zip(router.tables, rebuilt):
+        assert table.keys() == exact.keys()
+        assert all(_close(table[airport], exact[airport]) for airport in exact)
+
+
+def test_system_add_route_repairs_the_router():
+    system = AirportManagementSystem(airport_graph=random_graph(300, seed=7), sample_routes=False, hub=None)
+    system.use_landmarks(landmark_count=4)
+    graph = system.airport_graph
+    rng = random.Random(8)
+    airports = list(graph.graph)
+    with quiet_logging():
+        for _ in range(60):
+            source, destination = rng.sample(airports, 2)
+            system.add_route(source, destination, rng.uniform(1, 20))
+        for start, destination in random_queries(graph, 300, seed=9):
+            assert _close(system.find_shortest_route(start, destination)[1],
+                          graph.find_shortest_route(start, destination)[1])
+
+
+def test_unknown_airport_has_no_route():
+    system = AirportManagementSystem()
+    system.use_landmarks(landmark_count=2)
+    assert system.find_shortest_route('JFK', 'XXX') == (None, float('inf'))
+    assert system.find_shortest_route('JFK', 'CDG')[1] == 8
+
+
+def test_alt_searches_report_settled_airports():
+    from AirportGraph import settled_histogram
+
+    alt, point = settled_histogram('alt'), settled_histogram('point')
+    before = (alt.count, point.count)
+    graph = random_graph(200, seed=10)
+    router = LandmarkRouter(graph, landmark_count=4).build()
+    start, destination = random_queries(graph, 1, seed=11)[0]
+    router.find_shortest_route(start, destination)
+    router.dijkstra_route(start, destination)
+    assert (alt.count, point.count) == (before[0] + 1, before[1] + 1)
+
+
+def test_landmark_benchmark_runs_at_small_scale():
+    from Benchmarks.Landmarks import compare_routing
+
+    report = compare_routing(200, landmark_count=4, queries=20, seed=2)
+    assert report['queries'] == 20
+    assert report['alt']['settled'] <= report['dijkstra']['settled']
@@ -0,0 +1,92 @@
+import io
+import json
+import logging
+
+import pytest
+
+from AirportManagementSystem import AirportManagementSystem
+from Metrics import Registry, configure_logging, percentile, quiet_logging, register_system_gauges, timed
+
+
+def _samples(text):
+    return dict(line.rsplit(' ', 1) for line in text.splitlines() if line and not line.startswith('#'))
+
+
+@pytest.fixture
+def airport_logger():
+    logger = logging.getLogger('airport')
+    saved = (list(logger.handlers), logger.level, logger.propagate)
+    yield logger
+    logger.handlers[:], logger.level, logger.propagate = saved
+
+
+def test_counters_and_gauges_render_with_labels():
+    registry = Registry()
+    registry.counter('jobs_total', 'Jobs run', queue='a"b').inc(3)
+    registry.counter('jobs_total', queue='a"b').inc()
+    registry.gauge('depth', 'Queue depth', lambda: 7)
+    registry.gauge('gone', 'Missing source', lambda: 1 / 0)
+    text = registry.render()
+    assert '# HELP jobs_total Jobs run\n# TYPE jobs_total counter' in text
+    samples = _samples(text)
+    assert samples['jobs_total{queue="a\\"b"}'] == '4'
+    assert samples['depth'] == '7'
+    assert 'gone' not in samples
+    with pytest.raises(ValueError):
+        registry.histogram('jobs_total')
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    histogram = registry.histogram('size', buckets=(1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+    samples = _samples(registry.render())
+    assert [samples[f'size_bucket{{le="{bound}"}}'] for bound in ('1', '10', '+Inf')] == ['2', '3', '4']
+    assert (samples['size_count'], float(samples['size_sum'])) == ('4', 56.5)
+
+
+def test_timed_records_calls_that_raise():
+    registry = Registry()
+
+    @timed('work', registry=registry)
+    def work(fail=False):
+        if fail:
+            raise RuntimeError
+        return 'done'
+
+    assert work() == 'done'
+    with pytest.raises(RuntimeError):
+        work(fail=True)
+    assert _samples(registry.render())['airport_operation_seconds_count{operation="work"}'] == '2'
+
+
+def test_system_gauges_follow_the_system():
+    registry = Registry()
+    system = AirportManagementSystem(runway_count=2, sample_routes=False, hub=None)
+    register_system_gauges(system, registry)
+    system.add_route('JFK', 'LAX', 5)
+    system.add_flight('AA1', 'LAX', '23:59')
+    samples = _samples(registry.render())
+    assert (samples['airport_incoming_flights'], samples['airport_free_runways']) == ('1', '2')
+    assert (samples['airport_graph_airports'], samples['airport_graph_routes']) == ('2', '1')
+
+
+def test_structured_logging_and_quiet_blocks(airport_logger):
+    stream = io.StringIO()
+    configure_logging(structured=True, stream=stream)
+    airport_logger.info('hello %s', 'tower', extra={'event': 'greeting'})
+    with quiet_logging():
+        airport_logger.info('suppressed')
+        airport_logger.warning('kept')
+    airport_logger.info('after')
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [e['message'] for e in entries] == ['hello tower', 'kept', 'after']
+    assert entries[0]['event'] == 'greeting' and entries[0]['level'] == 'INFO'
+
+
+def test_percentile_interpolates_a_sorted_list():
+    assert percentile([], 95) == 0.0
+    assert percentile([4.0], 99) == 4.0
+    assert [percentile([1, 2, 3, 4, 5], q) for q in (0, 50, 100)] == [1, 3, 5]
+    assert percentile([0, 10], 95) == pytest.approx(9.5)
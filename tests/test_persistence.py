@@ -0,0 +1,119 @@
+from datetime import timedelta
+
+from AirportManagementSystem import AirportManagementSystem
+from Persistence import open_system, read_log, snapshot_state
+
+def _state(system):
+    state = snapshot_state(system)
+    state['routes'] = sorted(state['routes'])
+    return state
+
+
+def _edges(system):
+    return sorted((a, b, d) for a, neighbors in system.airport_graph.graph.items() for b, d in neighbors)
+
+
+def _exercise(system, clock):
+    start = clock()
+    system.add_flight_at('AA1', 'LAX', start + timedelta(minutes=30))
+    system.add_flight_at('AA2', 'BOS', start + timedelta(minutes=40), emergency=True)  # new hub route
+    system.add_flights_bulk([(1, {'flight_no': 'AA3', 'destination': 'mia', 'time_str': '09:15'}),
+                             (2, {'flight_no': 'AA4', 'destination': 'LHR', 'time_str': '10:00'})])
+    system.add_route('BOS', 'MIA', 2)
+    system.schedule_flights()
+    system.allocate_runways(show_runways=False)
+    system.cancel_flight('AA4')
+    system.add_flight_at('AA5', 'SEA', start + timedelta(hours=3))
+    system.schedule_flights()
+    system.escalate_flight('AA5')
+    clock.now = start + timedelta(hours=1)
+    system._clear_departed_flights()
+    system.journal.sync()
+
+
+def test_reopen_restores_the_same_state(clock, tmp_path):
+    system = open_system(str(tmp_path), runway_count=2, clock=clock)
+    _exercise(system, clock)
+    expected, edges = _state(system), _edges(system)
+    system.journal.close()
+
+    reopened = open_system(str(tmp_path), runway_count=2, clock=clock)
+    assert _state(reopened) == expected
+    assert _edges(reopened) == edges
+    reopened.journal.close()
+
+    # A second restart, now from a snapshot of the replayed system
+    reopened = open_system(str(tmp_path), runway_count=2, clock=clock)
+    reopened.journal.checkpoint()
+    reopened.journal.close()
+    again = open_system(str(tmp_path), runway_count=2, clock=clock)
+    assert _state(again) == expected
+    assert _edges(again) == edges
+
+
+def test_replay_keeps_one_hub_edge_per_new_destination(start, clock, tmp_path):
+    system = open_system(str(tmp_path), clock=clock)
+    system.add_flight_at('AA1', 'BOS', start + timedelta(hours=1))
+    system.journal.close()
+    for _ in range(3):
+        system = open_system(str(tmp_path), clock=clock)
+        system.journal.close()
+    assert system.airport_graph.graph['BOS'] == [('JFK', 5)]
+    assert system.hub == 'JFK'
+
+
+def test_journal_records_and_checkpoint_truncates(tmp_path):
+    system = open_system(str(tmp_path))
+    system.add_route('AAA', 'BBB', 3)
+    system.journal.sync()
+    assert [op for _, op, _ in read_log(str(tmp_path))] == ['route']
+    system.journal.checkpoint()
+    assert list(read_log(str(tmp_path))) == []
+    system.journal.close()
+    reopened = open_system(str(tmp_path))
+    assert ('BBB', 3) in reopened.airport_graph.graph['AAA']
+
+
+def test_torn_final_record_is_ignored(tmp_path):
+    system = open_system(str(tmp_path))
+    system.add_route('AAA', 'BBB', 3)
+    system.add_route('CCC', 'DDD', 4)
+    system.journal.close()
+    with open(tmp_path / 'wal.log', 'r+b') as handle:
+        handle.truncate(handle.seek(0, 2) - 3)
+    reopened = open_system(str(tmp_path))
+    assert 'AAA' in reopened.airport_graph
+    assert 'CCC' not in reopened.airport_graph
+
+
+def test_fresh_directory_writes_a_snapshot(tmp_path):
+    open_system(str(tmp_path)).journal.close()
+    assert (tmp_path / 'snapshot.bin').exists()
+    assert _state(open_system(str(tmp_path))) == _state(AirportManagementSystem())
+
+
+def test_csr_backed_system_snapshots_and_reopens(clock, tmp_path):
+    from CSRGraph import CSRGraph
+
+    system = open_system(str(tmp_path), runway_count=2, clock=clock, airport_graph=CSRGraph())
+    _exercise(system, clock)
+    system.journal.checkpoint()
+    expected = _state(system)
+    system.journal.close()
+
+    reopened = open_system(str(tmp_path), runway_count=2, clock=clock, airport_graph=CSRGraph())
+    assert isinstance(reopened.airport_graph, CSRGraph)
+    assert _state(reopened) == expected
+    assert reopened.find_shortest_route('BOS', 'MIA')[1] == 2
+    reopened.journal.close()
+
+
+def test_airport_graph_edges_match_csr_graph():
+    from CSRGraph import CSRGraph
+
+    system = AirportManagementSystem(sample_routes=True, hub=None)
+    edges = list(system.airport_graph.edges())
+    assert len(edges) == sum(len(n) for n in system.airport_graph.graph.values()) // 2
+    csr = CSRGraph.from_edges(edges)
+    assert sorted(tuple(sorted(e[:2])) + (e[2],) for e in csr.edges()) == \
+        sorted(tuple(sorted(e[:2])) + (e[2],) for e in edges)
@@ -0,0 +1,69 @@
+import json
+from datetime import timedelta
+
+from AirportManagementSystem import AirportManagementSystem
+from BackEnd_Api.ResponseCache import ResponseCache, encode_json, etag_matches
+
+
+class Builder:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {'calls': self.calls, 'name': 'Zürich'}
+
+
+def test_body_is_built_once_per_version():
+    cache = ResponseCache()
+    build = Builder()
+    etag, body = cache.get('/a', (1,), build)
+    assert json.loads(body) == {'calls': 1, 'name': 'Zürich'}
+    assert cache.get('/a', (1,), build) == (etag, body)
+    changed = cache.get('/a', (2,), build)
+    assert changed[0] != etag and json.loads(changed[1])['calls'] == 2
+    assert cache.get('/b', (2,), build)[0] != changed[0]  # same version, other key
+    assert cache.stats() == {'entries': 2, 'hits': 1, 'misses': 3}
+
+
+def test_least_recently_used_key_is_evicted():
+    cache = ResponseCache(capacity=2)
+    build = Builder()
+    cache.get('a', (0,), build)
+    cache.get('b', (0,), build)
+    cache.get('a', (0,), build)
+    cache.get('c', (0,), build)
+    assert len(cache) == 2
+    cache.get('a', (0,), build)
+    assert cache.hits == 2
+    cache.get('b', (0,), build)
+    assert cache.misses == 4
+
+
+def test_etag_matching():
+    assert etag_matches('"x"', '"x"')
+    assert etag_matches('W/"x"', '"x"')
+    assert etag_matches('"y", W/"x"', '"x"')
+    assert etag_matches('*', '"x"')
+    assert not etag_matches('"y"', '"x"')
+    assert not etag_matches(None, '"x"') and not etag_matches('', '"x"')
+
+
+def test_encode_json_is_compact():
+    assert json.loads(encode_json({'a': [1, 2], 'b': 'é'})) == {'a': [1, 2], 'b': 'é'}
+    assert b' ' not in encode_json({'a': [1, 2]})
+
+
+def test_system_versions_move_with_their_collections(start, clock):
+    system = AirportManagementSystem(runway_count=1, clock=clock, sample_routes=False, hub=None)
+    before = dict(system.versions)
+    system.add_route('JFK', 'LAX', 5)
+    assert system.versions['routes'] == before['routes'] + 1
+    system.add_flight_at('AA1', 'LAX', start + timedelta(minutes=5))
+    system.schedule_flights()
+    after_schedule = dict(system.versions)
+    assert after_schedule['scheduled'] > before['scheduled']
+    assert after_schedule['runways'] == before['runways']
+    system.allocate_runways(show_runways=False)
+    assert system.versions['runways'] > after_schedule['runways']
+    assert system.versions['cancelled'] == before['cancelled']
@@ -0,0 +1,83 @@
+import random
+
+from AirportGraph import AirportGraph
+from Benchmarks.Workload import random_graph, random_queries
+from Metrics import quiet_logging
+from RouteCache import RouteCache
+
+
+def _line(*airports):
+    graph = AirportGraph()
+    with quiet_logging():
+        for source, destination in zip(airports, airports[1:]):
+            graph.add_route(source, destination, 10)
+    return graph
+
+
+def test_matches_dijkstra_and_memoizes_paths():
+    graph = random_graph(300, seed=11)
+    cache = RouteCache(graph)
+    queries = random_queries(graph, 150, seed=12)
+    for start, destination in queries:
+        assert cache.find_shortest_route(start, destination)[1] == graph.find_shortest_route(start, destination)[1]
+    hits, misses = cache.hits, cache.misses
+    for start, destination in queries:
+        cache.find_shortest_route(start, destination)
+    assert cache.misses == misses
+    assert cache.hits == hits + len(queries)
+
+
+def test_one_tree_per_origin():
+    cache = RouteCache(_line('A', 'B', 'C', 'D'))
+    assert cache.find_shortest_route('A', 'D') == (['A', 'B', 'C', 'D'], 30)
+    assert cache.find_shortest_route('A', 'C') == (['A', 'B', 'C'], 20)
+    assert len(cache) == 1
+    assert cache.find_shortest_route('A', 'ZZZ') == (None, float('inf'))
+    assert cache.stats()['misses'] == 2
+
+
+def test_least_recently_used_origin_is_evicted():
+    cache = RouteCache(_line('A', 'B', 'C', 'D'), capacity=2)
+    cache.find_shortest_route('A', 'D')
+    cache.find_shortest_route('B', 'D')
+    cache.find_shortest_route('A', 'D')  # A is now the most recent
+    cache.find_shortest_route('C', 'D')
+    assert set(cache._trees) == {'A', 'C'}
+
+
+def test_route_added_drops_only_improved_trees():
+    graph = _line('A', 'B', 'C', 'D')
+    with quiet_logging():
+        graph.add_route('X', 'Y', 5)
+    cache = RouteCache(graph)
+    cache.find_shortest_route('A', 'D')
+    cache.find_shortest_route('X', 'Y')
+    with quiet_logging():
+        graph.add_route('A', 'D', 5)
+    cache.route_added('A', 'D', 5)
+    assert set(cache._trees) == {'X'}
+    assert cache.find_shortest_route('A', 'D') == (['A', 'D'], 5)
+
+
+def test_stays_exact_while_routes_are_added():
+    graph = random_graph(200, seed=13)
+    cache = RouteCache(graph, capacity=32)
+    rng = random.Random(14)
+    airports = list(graph.graph)
+    with quiet_logging():
+        for _ in range(30):
+            for start, destination in random_queries(graph, 10, seed=rng.random()):
+                assert cache.find_shortest_route(start, destination)[1] == graph.find_shortest_route(start, destination)[1]
+            source, destination = rng.sample(airports, 2)
+            distance = rng.uniform(1, 50)
+            graph.add_route(source, destination, distance)
+            cache.route_added(source, destination, distance)
+
+
+def test_routes_batch_keeps_query_order():
+    graph = random_graph(200, seed=15)
+    pairs = random_queries(graph, 80, seed=16)
+    cache = RouteCache(graph)
+    results = cache.find_routes_batch(pairs)
+    assert [d for _, d in results] == [graph.find_shortest_route(*pair)[1] for pair in pairs]
+    assert len(cache) == len({start for start, _ in pairs})
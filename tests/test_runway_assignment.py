@@ -0,0 +1,105 @@
+import itertools
+import random
+from datetime import timedelta
+
+import pytest
+
+import RunwayAssignment
+from AirportManagementSystem import AirportManagementSystem
+from Flight import Flight
+from RunwayAssignment import INF, AssignmentCosts, assign_runways, min_cost_assignment, total_cost
+
+BACKENDS = ['python'] + (['numpy'] if RunwayAssignment.np is not None else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(RunwayAssignment, 'np', None)
+    return request.param
+
+
+def _brute_force(cost):
+    rows, columns = len(cost), len(cost[0])
+    if rows <= columns:
+        return min(sum(cost[i][j] for i, j in enumerate(p)) for p in itertools.permutations(range(columns), rows))
+    return min(sum(cost[i][j] for j, i in enumerate(p)) for p in itertools.permutations(range(rows), columns))
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_hungarian_matches_brute_force(backend, seed):
+    rng = random.Random(seed)
+    rows, columns = rng.randint(1, 6), rng.randint(1, 6)
+    if seed % 4 == 0:
+        rows = min(rows, 3)
+        columns = rows * 3  # exercises the cut to each row's k cheapest columns
+    cost = [[rng.choice([rng.randint(0, 9), rng.uniform(-5, 20)]) for _ in range(columns)] for _ in range(rows)]
+    pairs = min_cost_assignment(cost)
+    assert len(pairs) == min(rows, columns)
+    assert len({i for i, _ in pairs}) == len({j for _, j in pairs}) == len(pairs)
+    assert sum(cost[i][j] for i, j in pairs) == pytest.approx(_brute_force(cost))
+
+
+def _flight(start, number, minutes, emergency=False):
+    return Flight(number, 'LAX', start + timedelta(minutes=minutes), emergency)
+
+
+def test_emergencies_are_seated_whatever_the_cost(start, backend):
+    flights = [_flight(start, 'N1', -30), _flight(start, 'N2', -20), _flight(start, 'E1', 10, emergency=True)]
+    costs = AssignmentCosts(taxi_minutes={'far': {1: 500}}, stands={'E1': 'far'})
+    assert [(f.flight_number, r) for f, r in assign_runways(flights, [1], start, costs)] == [('E1', 1)]
+
+
+def test_unsuitable_pairs_are_never_returned(start, backend):
+    flights = [_flight(start, 'H1', -5), _flight(start, 'M1', 0)]
+    costs = AssignmentCosts(max_wake={1: 'M', 2: 'M'}, wake_classes={'H1': 'H'})
+    assert [f.flight_number for f, _ in assign_runways(flights, [1, 2], start, costs)] == ['M1']
+    costs.max_wake[2] = 'H'
+    seated = {f.flight_number: r for f, r in assign_runways(flights, [1, 2], start, costs)}
+    assert seated == {'H1': 2, 'M1': 1}
+    assert total_cost([(flights[0], 1)], [1, 2], start, costs) == (0.0, 1)
+
+
+def test_overdue_flights_and_short_taxis_win(start, backend):
+    flights = [_flight(start, 'LATE', -30), _flight(start, 'ON_TIME', 0)]
+    assert [f.flight_number for f, _ in assign_runways(flights, [1], start)] == ['LATE']
+    costs = AssignmentCosts(taxi_minutes={'A': {1: 1, 2: 9}, 'B': {1: 2, 2: 3}}, stands={'LATE': 'A', 'ON_TIME': 'B'})
+    seated = {f.flight_number: r for f, r in assign_runways(flights, [1, 2], start, costs)}
+    assert seated == {'LATE': 1, 'ON_TIME': 2}
+
+
+def test_backends_build_the_same_matrix(start, monkeypatch):
+    if RunwayAssignment.np is None:
+        pytest.skip('NumPy is not installed')
+    rng = random.Random(7)
+    flights = [_flight(start, f"F{i}", rng.randint(-60, 60)) for i in range(12)]
+    costs = AssignmentCosts(taxi_minutes={s: {r: rng.uniform(1, 15) for r in range(1, 5)} for s in 'ABC'},
+                            stands={f.flight_number: rng.choice('ABC') for f in flights},
+                            max_wake={1: 'M'}, wake_classes={'F3': 'H', 'F4': 'L'})
+    fast = costs.matrix(flights, [1, 2, 3, 4], start).tolist()
+    monkeypatch.setattr(RunwayAssignment, 'np', None)
+    slow = costs.matrix(flights, [1, 2, 3, 4], start)
+    for a, b in zip(fast, slow):
+        assert [x == INF for x in a] == [x == INF for x in b]
+        assert [x for x in a if x != INF] == pytest.approx([x for x in b if x != INF])
+
+
+def test_system_allocates_by_cost(start, clock, backend):
+    system = AirportManagementSystem(runway_count=2, clock=clock, sample_routes=False, hub=None)
+    system.assignment_costs = AssignmentCosts(taxi_minutes={'west': {1: 10, 2: 1}}, stands={'AA2': 'west'})
+    system.add_flight_at('AA1', 'LAX', start + timedelta(minutes=5))
+    system.add_flight_at('AA2', 'LAX', start + timedelta(minutes=6))
+    system.add_flight_at('AA3', 'LAX', start + timedelta(minutes=7))
+    system.schedule_flights()
+    system.allocate_runways(show_runways=False)
+    assert {r.runway_id: r.current_flight_name for r in system.runways} == {1: 'AA1', 2: 'AA2'}
+    assert [f.flight_number for f in system.scheduled_flights] == ['AA3']
+
+
+def test_optimal_cycles_beat_greedy_ones():
+    from Benchmarks.Assignment import compare_assignment
+
+    report = compare_assignment(60, 6, cycles=3, seed=1)
+    assert report['optimal']['unsuitable'] == 0
+    assert report['optimal']['cost'] <= report['greedy']['cost'] + 1e-6 or report['greedy']['unsuitable']
+    assert report['optimal']['emergencies_seated'] >= report['greedy']['emergencies_seated']
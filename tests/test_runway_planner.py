@@ -0,0 +1,148 @@
+import random
+from datetime import timedelta
+
+from AirportManagementSystem import AirportManagementSystem
+from Flight import Flight
+from RunwayPlanner import WAKE_SEPARATION, RunwayPlanner
+
+
+def _flights(start, count, seed=0, spread_minutes=60):
+    rng = random.Random(seed)
+    return [Flight(f"F{i}", 'LAX', start + timedelta(minutes=rng.randrange(spread_minutes)), rng.random() < 0.1)
+            for i in range(count)]
+
+
+def _check(planner, flights):
+    for runway_id in planner._blocks:
+        slots = planner.runway_slots(runway_id)
+        for leader, follower in zip(slots, slots[1:]):
+            assert follower.start >= leader.end + WAKE_SEPARATION.get((leader.wake, follower.wake), 0)
+    for f in flights:
+        slot = planner.get(f.flight_number)
+        assert slot.start >= f.departure_time.timestamp()
+        assert slot.end - slot.start == planner.occupancy
+
+
+def test_plan_respects_occupancy_and_wake_separation(start):
+    flights = _flights(start, 80)
+    rng = random.Random(1)
+    wakes = {f.flight_number: rng.choice('LMH') for f in flights}
+    planner = RunwayPlanner(3, timedelta(minutes=2))
+    planner.plan(flights, wakes)
+    assert len(planner) == 80
+    _check(planner, flights)
+
+
+def test_uncongested_flights_leave_on_time(start):
+    flights = [Flight(f"F{i}", 'LAX', start + timedelta(minutes=10 * i)) for i in range(5)]
+    planner = RunwayPlanner(1, timedelta(minutes=2))
+    assert all(slot.delay == 0 for slot in planner.plan(flights))
+
+
+def test_cancel_moves_delayed_flights_into_the_gap(start):
+    flights = [Flight(f"F{i}", 'LAX', start) for i in range(4)]
+    planner = RunwayPlanner(1, timedelta(minutes=2))
+    planner.plan(flights)
+    assert [s.flight.flight_number for s in planner.slots()] == ['F0', 'F1', 'F2', 'F3']
+    moved = planner.cancel('F0')
+    assert [s.flight.flight_number for s in moved] == ['F1', 'F2', 'F3']
+    assert planner.get('F1').delay == 0
+    assert 'F0' not in planner
+    _check(planner, flights[1:])
+
+
+def test_cancellations_never_delay_remaining_flights(start):
+    flights = _flights(start, 60, seed=2, spread_minutes=30)
+    planner = RunwayPlanner(2, timedelta(minutes=2))
+    planner.plan(flights)
+    remaining = list(flights)
+    for cancelled in flights[::7]:
+        before = {f.flight_number: planner.get(f.flight_number).start for f in remaining}
+        planner.cancel(cancelled.flight_number)
+        remaining.remove(cancelled)
+        assert all(planner.get(f.flight_number).start <= before[f.flight_number] for f in remaining)
+        _check(planner, remaining)
+    assert len(planner) == len(remaining)
+
+
+def _system(clock):
+    system = AirportManagementSystem(runway_count=2, clock=clock, sample_routes=False, hub=None)
+    for i in range(6):
+        system.add_flight_at(f"AA{i}", 'LAX', clock() + timedelta(minutes=5))
+    system.schedule_flights()
+    return system
+
+
+def test_current_plan_is_kept_between_reads(clock):
+    system = _system(clock)
+    first = system.current_plan(2)
+    planner = system.planner
+    assert len(first) == 6
+    assert system.current_plan(2) == first and system.planner is planner
+    clock.now += timedelta(seconds=30)
+    system.current_plan(2)
+    assert system.planner is planner  # horizon moved less than PLAN_REFRESH
+
+
+def test_cancel_and_undo_update_the_served_plan_in_place(clock):
+    system = _system(clock)
+    system.current_plan(2)
+    planner = system.planner
+    system.cancel_flight('AA0')
+    slots = system.current_plan(2)
+    assert system.planner is planner
+    assert 'AA0' not in [s.flight.flight_number for s in slots]
+    system.undo_cancellation()
+    assert 'AA0' in [s.flight.flight_number for s in system.current_plan(2)]
+    assert system.planner is planner
+
+
+def test_other_changes_replan(start, clock):
+    system = _system(clock)
+    system.current_plan(2)
+    planner = system.planner
+    system.add_flight_at('AA9', 'LAX', start + timedelta(minutes=6))
+    system.schedule_flights()
+    assert 'AA9' in [s.flight.flight_number for s in system.current_plan(2)]
+    assert system.planner is not planner
+    planner = system.planner
+    system.current_plan(3)
+    assert system.planner is not planner
+    planner = system.planner
+    clock.now += timedelta(minutes=2)
+    system.current_plan(3)
+    assert system.planner is not planner
+
+
+def test_plan_waits_for_held_runways_and_starts_now(start, clock):
+    system = AirportManagementSystem(runway_count=1, clock=clock, sample_routes=False, hub=None)
+    system.add_flight_at('HELD', 'LAX', start + timedelta(minutes=30))
+    system.schedule_flights()
+    system.allocate_runways(show_runways=False)
+    system.add_flight_at('NEXT', 'LAX', start + timedelta(minutes=10))
+    system.add_flight_at('LATE', 'LAX', start - timedelta(minutes=45))
+    system.schedule_flights()
+    slots = {s.flight.flight_number: s for s in system.current_plan(2)}
+    held_until = (start + timedelta(minutes=30)).timestamp()
+    assert set(slots) == {'NEXT', 'LATE'}
+    assert all(s.start >= held_until for s in slots.values())
+    assert min(s.start for s in slots.values()) >= start.timestamp()
+
+    system.cancel_flight('HELD')  # frees the runway: waiting flights move up in place
+    slots = {s.flight.flight_number: s for s in system.current_plan(2)}
+    assert slots['LATE'].start == start.timestamp()
+    assert slots['NEXT'].start == (start + timedelta(minutes=10)).timestamp()
+
+
+def test_wake_classes_reach_the_served_plan(clock):
+    from BackEnd_Api import CommandProcessor as commands
+
+    system = _system(clock)
+    plain = commands.plan_runways(system, 2)
+    heavy = commands.plan_runways(system, 2, {'AA0': 'H', 'AA1': 'H'})
+    wakes = {s['flight_number']: s['wake'] for s in heavy}
+    assert (wakes.pop('AA0'), wakes.pop('AA1')) == ('H', 'H') and set(wakes.values()) == {'M'}
+    assert plain != heavy
+    slots = system.current_plan(2, {'AA0': 'H', 'AA1': 'H'})
+    _check(system.planner, [s.flight for s in slots])
+    assert WAKE_SEPARATION[('M', 'M')] == 0
@@ -0,0 +1,99 @@
+import asyncio
+from datetime import timedelta
+
+from Flight import Flight
+from RunwayPool import RunwayPool
+
+
+def _flight(start, number, minutes):
+    return Flight(number, 'LAX', start + timedelta(minutes=minutes))
+
+
+def test_acquire_lowest_free_runway_or_a_given_one(start, clock):
+    pool = RunwayPool(3, clock=clock)
+    assert pool.acquire(_flight(start, 'A', 5), runway_id=2).runway_id == 2
+    assert pool.acquire(_flight(start, 'B', 5)).runway_id == 1
+    assert pool.acquire(_flight(start, 'C', 5), runway_id=2) is None
+    assert pool.free_ids() == [3]
+    assert pool.acquire(_flight(start, 'D', 5)).runway_id == 3
+    assert pool.acquire(_flight(start, 'E', 5)) is None
+    assert pool.runway_for('B').runway_id == 1
+
+
+def test_release_due_in_departure_order_with_min_occupancy(start, clock):
+    pool = RunwayPool(3, clock=clock, min_occupancy=timedelta(minutes=10))
+    pool.acquire(_flight(start, 'LATE', 30))
+    pool.acquire(_flight(start, 'NOW', 0))   # held for min_occupancy
+    pool.acquire(_flight(start, 'SOON', 5))
+    assert pool.next_release_time() == start + timedelta(minutes=10)
+    assert pool.next_available_minutes() == 10
+    clock.now = start + timedelta(minutes=10)
+    assert [f.flight_number for _, f in pool.release_due()] == ['NOW', 'SOON']
+    assert pool.free_count == 2
+    assert list(pool.release_times()) == [1]
+
+
+def test_cancelled_runway_leaves_no_stale_release(start, clock):
+    pool = RunwayPool(1, clock=clock)
+    pool.acquire(_flight(start, 'A', 5))
+    assert pool.release_flight('A').flight_number == 'A'
+    assert pool.release_flight('A') is None
+    pool.acquire(_flight(start, 'B', 20))
+    clock.now = start + timedelta(minutes=6)
+    assert pool.release_due() == []  # A's old heap entry is skipped
+    assert pool.next_release_time() == start + timedelta(minutes=20)
+
+
+def test_release_timer_frees_runways_in_the_background(start, clock):
+    pool = RunwayPool(2, clock=clock)
+    pool.acquire(_flight(start, 'A', 1))
+    released = []
+
+    async def scenario():
+        task = asyncio.create_task(pool.run_release_timer(on_release=lambda r, f: released.append(f.flight_number),
+                                                          max_sleep=0.01))
+        await asyncio.sleep(0.03)
+        assert released == []
+        clock.now = start + timedelta(minutes=1)
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if released:
+                break
+        task.cancel()
+
+    asyncio.run(scenario())
+    assert released == ['A']
+    assert pool.free_count == 2
+
+
+def test_release_timer_survives_a_failing_callback(start, clock, caplog):
+    pool = RunwayPool(2, clock=clock)
+    pool.acquire(_flight(start, 'A', 1))
+    pool.acquire(_flight(start, 'B', 2))
+    released = []
+
+    def on_release(runway, flight):
+        released.append(flight.flight_number)
+        if flight.flight_number == 'A':
+            raise RuntimeError('listener broke')
+
+    async def scenario():
+        task = asyncio.create_task(pool.run_release_timer(on_release=on_release, max_sleep=0.01))
+        clock.now = start + timedelta(minutes=1)
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if released:
+                break
+        clock.now = start + timedelta(minutes=2)
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if len(released) == 2:
+                break
+        alive = not task.done()
+        task.cancel()
+        return alive
+
+    assert asyncio.run(scenario())
+    assert released == ['A', 'B']
+    assert pool.free_count == 2
+    assert [r.event for r in caplog.records] == ['release_callback_failed']
@@ -0,0 +1,72 @@
+import asyncio
+
+from AirportGraph import AirportGraph
+from BackEnd_Api import CommandProcessor as commands
+from BackEnd_Api import ShardDispatcher as shard
+from Metrics import quiet_logging
+from RouteCache import RouteCache
+
+
+def _graph():
+    graph = AirportGraph()
+    with quiet_logging():
+        graph.add_route('JFK', 'LAX', 5)
+        graph.add_route('LHR', 'LAX', 9)
+    return graph
+
+
+def _route(system, start, destination):
+    return system.find_shortest_route(start, destination)
+
+
+async def _exercise(shards):
+    shards.start()
+    try:
+        await asyncio.gather(
+            shards.submit('JFK', commands.add_flight, 'AA1', 'LAX', '23:59', False),
+            shards.submit('LHR', commands.add_flight, 'BA1', 'LAX', '23:59', False),
+            shards.submit('LHR', commands.add_flight, 'BA2', 'LAX', '23:58', True),
+        )
+        await shards.submit('LHR', commands.allocate_runways)
+        with quiet_logging():
+            shards.graph.add_route('JFK', 'SFO', 3)  # as the front end does before broadcasting
+        await shards.broadcast_route('JFK', 'SFO', 3)
+        return (
+            [f['flight_number'] for f in await shards.query('JFK', shard.scheduled_flights)],
+            await shards.query('LHR', shard.runway_status),
+            await shards.query('LHR', shard.flight_status, 'BA2'),
+            await shards.query('JFK', _route, 'LAX', 'SFO'),
+        )
+    finally:
+        shards.close()
+
+
+def test_open_shards_picks_the_backend():
+    graph = _graph()
+    assert isinstance(shard.open_shards(['JFK', 'LHR', 'JFK'], graph, RouteCache(graph)), shard.LocalShards)
+    shards = shard.open_shards(['JFK', 'LHR', 'CDG'], graph, RouteCache(graph), workers=2)
+    assert isinstance(shards, shard.ProcessShards)
+    assert shards.codes == ['JFK', 'LHR', 'CDG'] and 'CDG' in shards and 'SFO' not in shards
+    assert shards.placement == {'JFK': 0, 'LHR': 1, 'CDG': 0}
+
+
+def test_local_shards_keep_airports_apart():
+    graph = _graph()
+    shards = shard.open_shards(['JFK', 'LHR'], graph, RouteCache(graph), runway_count=1)
+    waiting, runways, located, route = asyncio.run(_exercise(shards))
+    assert waiting == ['AA1']
+    assert runways == [(1, 'BA2')]
+    assert located['location'] == 'runway 1'
+    assert route == (['LAX', 'JFK', 'SFO'], 8)
+    assert shards.systems['JFK'].route_cache is shards.systems['LHR'].route_cache
+
+
+def test_process_shards_match_local_shards():
+    graph = _graph()
+    shards = shard.open_shards(['JFK', 'LHR'], graph, RouteCache(graph), runway_count=1, workers=2)
+    with quiet_logging():
+        waiting, runways, located, route = asyncio.run(_exercise(shards))
+    assert waiting == ['AA1']
+    assert runways == [(1, 'BA2')]
+    assert located['location'] == 'runway 1' and isinstance(located['departure_time'], str)
+    assert route == (['LAX', 'JFK', 'SFO'], 8)  # reached the worker's copy of the graph by broadcast
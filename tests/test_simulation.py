@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from Simulation import AirportSimulation, VirtualClock, random_day
+
+
+def test_virtual_clock_only_moves_forward(start):
+    clock = VirtualClock(start)
+    clock.advance_to(start + timedelta(hours=1))
+    clock.advance_to(start)
+    assert clock() == start + timedelta(hours=1)
+
+
+def test_single_runway_serializes_departures(start):
+    sim = AirportSimulation(start=start, runway_count=1, runway_occupancy=timedelta(minutes=10))
+    for i in range(3):
+        sim.add_arrival(start, f"AA{i}", 'LAX', start + timedelta(minutes=1))
+    report = sim.run()
+    assert report.departures == 3
+    assert report.max_queue_depth == 2
+    # Departures at +10, +20 and +30 minutes: the runway is never idle
+    assert report.end == start + timedelta(minutes=30)
+    assert abs(report.runway_utilization - 1.0) < 1e-9
+
+
+def test_cancellations_and_emergencies_apply_at_their_time(start):
+    sim = AirportSimulation(start=start, runway_count=1, runway_occupancy=timedelta(minutes=10))
+    for i in range(4):
+        sim.add_arrival(start, f"AA{i}", 'LAX', start + timedelta(minutes=1 + i))
+    sim.add_cancellation(start + timedelta(minutes=5), 'AA1')
+    sim.add_emergency(start + timedelta(minutes=5), 'AA3')
+    sim.add_cancellation(start + timedelta(minutes=5), 'NOPE')
+    report = sim.run(until=start + timedelta(minutes=10))
+    assert (report.departures, report.cancellations, report.emergencies) == (1, 1, 1)
+    assert sim.system.runways.runway_for('AA3') is not None  # escalated past AA2 when AA0 left
+    report = sim.run()
+    assert (report.departures, report.cancellations, report.emergencies) == (2, 0, 0)
+    assert sim.system.flight_index.get('AA1').status == 'Cancelled'
+
+
+def test_until_stops_early_and_random_days_are_reproducible(start):
+    def run(until=None):
+        sim = AirportSimulation(start=start, runway_count=2)
+        random_day(sim, 300, seed=4)
+        return sim.run(until).summary()
+
+    full = run()
+    assert full['arrivals'] == 300
+    assert full['departures'] + full['cancellations'] == 300
+    assert {k: v for k, v in run().items() if k != 'wall_seconds'} == \
+        {k: v for k, v in full.items() if k != 'wall_seconds'}
+    assert run(start + timedelta(hours=6))['departures'] < full['departures']
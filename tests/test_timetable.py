@@ -0,0 +1,81 @@
+from datetime import timedelta
+from itertools import permutations
+
+from AirportGraph import AirportGraph
+from AirportManagementSystem import AirportManagementSystem
+from Flight import Flight
+from RouteCache import RouteCache
+from Timetable import Timetable
+
+
+def _timetable():
+    graph = AirportGraph()
+    for source, destination, distance in [('JFK', 'LHR', 7), ('LHR', 'CDG', 1), ('JFK', 'CDG', 8), ('CDG', 'FRA', 1)]:
+        graph.add_route(source, destination, distance)
+    return Timetable(RouteCache(graph))
+
+
+def _at(start, minutes):
+    return start + timedelta(minutes=minutes)
+
+
+def test_earliest_arrival_changes_flights_with_transfer_time(start):
+    timetable = _timetable()
+    timetable.add(Flight('J1', 'LHR', _at(start, 0)), 'JFK')     # arrives +420
+    timetable.add(Flight('L1', 'CDG', _at(start, 430)), 'LHR')   # too tight a connection
+    timetable.add(Flight('L2', 'CDG', _at(start, 460)), 'LHR')   # arrives +520
+    timetable.add(Flight('J2', 'CDG', _at(start, 120)), 'JFK')   # direct, arrives +600
+    arrival, legs = timetable.earliest_arrival('JFK', 'CDG', start)
+    assert arrival == _at(start, 520)
+    assert [leg['flight_number'] for leg in legs] == ['J1', 'L2']
+
+    arrival, legs = timetable.earliest_arrival('JFK', 'CDG', start, transfer=timedelta(minutes=5))
+    assert [leg['flight_number'] for leg in legs] == ['J1', 'L1']
+    assert timetable.earliest_arrival('JFK', 'CDG', _at(start, 1))[0] == _at(start, 600)  # J1 has left: direct only
+    assert timetable.earliest_arrival('CDG', 'JFK', start) == (None, [])
+
+
+def test_remove_and_route_changes_update_connections(start):
+    timetable = _timetable()
+    timetable.add_many([Flight('J1', 'LHR', _at(start, 0)), Flight('J2', 'LHR', _at(start, 0))], 'JFK')
+    assert len(timetable) == 2
+    timetable.remove('J1')
+    assert len(timetable) == 1
+    timetable.route_cache.graph.add_route('JFK', 'LHR', 2)
+    timetable.route_cache.route_added('JFK', 'LHR', 2)
+    timetable.routes_changed()
+    assert timetable.earliest_arrival('JFK', 'LHR', start)[0] == _at(start, 120)
+
+
+def test_profile_matches_earliest_arrival_for_every_start(start):
+    timetable = _timetable()
+    flights = [('J1', 'LHR', 0, 'JFK'), ('J2', 'CDG', 60, 'JFK'), ('J3', 'LHR', 200, 'JFK'),
+               ('L1', 'CDG', 470, 'LHR'), ('L2', 'CDG', 700, 'LHR'), ('C1', 'FRA', 560, 'CDG'),
+               ('C2', 'FRA', 700, 'CDG'), ('J4', 'CDG', 400, 'JFK')]
+    for number, destination, minutes, origin in flights:
+        timetable.add(Flight(number, destination, _at(start, minutes)), origin)
+    for source, target in permutations(['JFK', 'LHR', 'CDG', 'FRA'], 2):
+        options = timetable.profile(source, target, start, _at(start, 24 * 60))
+        arrivals = [arrival for _, arrival, _ in options]
+        assert arrivals == sorted(set(arrivals))
+        for departure, arrival, legs in options:
+            assert timetable.earliest_arrival(source, target, departure)[0] == arrival
+            assert legs[0]['from'] == source and legs[-1]['to'] == target
+
+
+def test_departed_flights_leave_the_timetable(start, clock):
+    system = AirportManagementSystem(runway_count=2, clock=clock)
+    timetable = Timetable(system.route_cache)
+    system.use_timetable(timetable)
+    system.add_flight_at('AA1', 'LAX', _at(start, 10))
+    system.add_flight_at('AA2', 'LAX', _at(start, 20))
+    system.schedule_flights()
+    system.allocate_runways(show_runways=False)
+    assert len(timetable) == 2
+
+    clock.now = _at(start, 15)
+    system._clear_departed_flights()
+    assert len(timetable) == 1
+    assert timetable.earliest_arrival('JFK', 'LAX', start)[1][0]['flight_number'] == 'AA2'
+    timetable.routes_changed()  # rebuilds from every flight the timetable still holds
+    assert len(timetable) == 1
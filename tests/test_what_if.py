@@ -0,0 +1,69 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from AirportManagementSystem import AirportManagementSystem
+from WhatIf import METRICS, Scenario, compact_state, run_scenario, run_what_if
+
+
+def _system(clock, hub='JFK'):
+    start = clock()
+    system = AirportManagementSystem(runway_count=2, clock=clock, runway_occupancy=timedelta(minutes=2),
+                                     hub=hub)
+    for i in range(30):
+        system.add_flight_at(f"AA{i}", ['LAX', 'LHR', 'CDG'][i % 3], start + timedelta(minutes=i), i % 10 == 0)
+    system.schedule_flights()
+    system.add_flight_at('AA99', 'SFO', start + timedelta(minutes=5))  # still in the incoming queue
+    return system
+
+
+def test_compact_state_covers_every_waiting_flight(clock):
+    state = compact_state(_system(clock))
+    assert len(state['departures']) == 31
+    assert sum(state['emergency']) == 3
+    assert _hub(state) == 'JFK'
+
+
+def _hub(state):
+    return state['airports'][state['hub']] if state['hub'] >= 0 else None
+
+
+def test_compact_state_uses_the_system_hub(clock):
+    system = _system(clock)
+    system.hub = 'LHR'
+    assert _hub(compact_state(system)) == 'LHR'
+    system.hub = None
+    assert _hub(compact_state(system)) is None
+    assert _hub(compact_state(system, hub='LAX')) == 'LAX'
+
+
+def test_calm_day_departs_everything(clock):
+    state = compact_state(_system(clock))
+    calm = Scenario(delay_probability=0, runway_closure_probability=0, airport_closure_probability=0)
+    result = dict(zip(METRICS, run_scenario(state, calm, seed=1)))
+    assert result['departures'] == 31
+    assert result['cancellations'] == 0
+
+
+def test_runs_are_reproducible_and_match_across_pools(clock):
+    state = compact_state(_system(clock))
+    in_process = run_what_if(state, runs=40, workers=1, seed=7).metrics
+    assert run_what_if(state, runs=40, workers=1, seed=7).metrics == in_process
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert run_what_if(state, runs=40, workers=2, seed=7, pool=pool).metrics == in_process
+        assert run_what_if(state, runs=40, workers=2, seed=7, pool=pool).metrics == in_process
+    assert run_what_if(state, runs=40, workers=2, seed=7).metrics == in_process
+
+
+def test_compact_state_with_a_csr_graph(start, clock):
+    from CSRGraph import CSRGraph
+
+    graph = CSRGraph.from_edges(AirportManagementSystem(hub=None).airport_graph.edges())
+    system = AirportManagementSystem(runway_count=2, clock=clock, airport_graph=graph,
+                                     sample_routes=False, hub='JFK')
+    system.add_flight_at('AA1', 'LAX', start + timedelta(minutes=5))
+    system.add_flight_at('AA2', 'SYD', start + timedelta(minutes=9))  # new hub route in the overlay
+    state = compact_state(system)
+    routes = {frozenset((state['airports'][a], state['airports'][b])) for a, b, _ in state['routes']}
+    assert len(state['routes']) == len(list(graph.edges()))
+    assert frozenset(('JFK', 'SYD')) in routes
+    assert run_scenario(state, Scenario(), 0)[METRICS.index('departures')] == 2